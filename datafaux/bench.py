@@ -0,0 +1,228 @@
+"""
+Benchmark suite: rows/s and memory for every preset generator, compiled schemas,
+error injection and each exporter, at several row counts; plus CLI startup time against a budget.
+
+Memory is reported as `rss_growth_mb`, how far RSS rose above its level after the case's setup
+while the case ran (sampled, see `profiling.Profiler`), and, for cases run in their own process,
+as `peak_rss_mb`, the process high-water mark (setup included). Without isolation the high-water
+mark accumulates across cases, so it is left out (None).
+"""
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from . import __version__
+
+DEFAULT_SIZES = [1000, 10000]
+
+PEOPLE_SCHEMA = {
+    "type": "people",
+    "fields": [
+        {"name": "person_id", "type": "uuid"},
+        {"name": "name", "type": "name"},
+        {"name": "email", "type": "email"},
+        {"name": "age", "type": "int", "min": 18, "max": 90},
+        {"name": "registered_at", "type": "datetime", "start": "-3y"},
+    ],
+}
+
+
+def _people_frame(n):
+    from .generators import people
+    return people.generate_columnar(count=n, seed=0)
+
+
+def _generator(module, func="generate_default", **kwargs):
+    def setup(n):
+        import importlib
+        generate = getattr(importlib.import_module(f".generators.{module}", __package__), func)
+        generate(count=1, seed=0, **kwargs)  # warm-up: imports, locale data and value pools
+        return lambda: generate(count=n, seed=0, **kwargs)
+    return setup
+
+
+def _schema(n):
+    from .generators.compiler import compile_schema
+    plan = compile_schema(PEOPLE_SCHEMA)
+    return lambda: plan.generate(count=n, seed=0)
+
+
+def _inject(n):
+    from .modes.testers import inject_errors
+    df = _people_frame(n)
+    return lambda: inject_errors(df.copy(), error_rate=0.05, seed=0)
+
+
+def _save(fmt, stream=False):
+    def setup(n):
+        from .utils.exporters import save_df, save_df_stream
+        df = _people_frame(n)
+        out = os.path.join(tempfile.mkdtemp(prefix="datafaux-bench-"), f"out.{fmt}")
+
+        def run():
+            if os.path.exists(out):
+                os.remove(out)
+            if stream:
+                save_df_stream(df, out, fmt=fmt, chunksize=10000)
+            else:
+                save_df(df, out, fmt)
+        return run
+    return setup
+
+
+# name -> setup(n) returning a zero-argument callable; only the callable is timed
+CASES = {
+    "people": _generator("people"),
+    "people_columnar": _generator("people", "generate_columnar"),
+    "ecommerce": _generator("ecommerce"),
+    "ecommerce_tables": _generator("ecommerce", "generate_tables"),
+    "finance": _generator("finance"),
+    "health": _generator("health"),
+    "schema_people": _schema,
+    "inject_errors": _inject,
+    "save_csv": _save("csv"),
+    "save_json": _save("json"),
+    "save_parquet": _save("parquet"),
+    "save_xlsx": _save("xlsx"),
+    "stream_csv": _save("csv", stream=True),
+    "stream_json": _save("json", stream=True),
+    "stream_parquet": _save("parquet", stream=True),
+    "stream_xlsx": _save("xlsx", stream=True),
+}
+
+
+# CLI invocations timed by `startup_times`, and their wall-time budgets in seconds
+STARTUP_COMMANDS = {
+    "help": ["--help"],
+    "generate_small": ["generate", "--preset", "people", "-n", "50", "--out", "{out}"],
+}
+STARTUP_BUDGET = {"help": 0.5, "generate_small": 1.5}
+
+
+def startup_times(repeat=3, budget=None):
+    """
+    Times fresh `python -m datafaux.main` processes (best of `repeat`) for each startup command and
+    checks them against `budget` (default STARTUP_BUDGET).
+    """
+    budget = budget or STARTUP_BUDGET
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+    workdir = tempfile.mkdtemp(prefix="datafaux-bench-")
+    results = []
+    for name, args in STARTUP_COMMANDS.items():
+        cmd = [sys.executable, "-m", "datafaux.main"] + [a.format(out=os.path.join(workdir, "out.csv")) for a in args]
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run(cmd, check=True, capture_output=True, env=env, cwd=workdir)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results.append({
+            "command": name,
+            "seconds": round(best, 4),
+            "budget_seconds": budget.get(name),
+            "over_budget": budget.get(name) is not None and best > budget[name],
+        })
+    return results
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(name, n, repeat=1, isolated=False):
+    """
+    Runs one case `repeat` times on `n` rows and returns its best timing and RSS growth, plus the
+    process peak RSS when the case runs in a process of its own (`isolated`).
+    """
+    from .profiling import Profiler
+    run = CASES[name](n)
+    best = None
+    profiler = Profiler()
+    profiler.mark("run")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    profiler.close()
+    return {
+        "case": name,
+        "rows": n,
+        "seconds": round(best, 6),
+        "rows_per_sec": round(n / best, 1) if best else None,
+        "rss_growth_mb": profiler.stages["run"]["rss_growth_mb"],
+        "peak_rss_mb": round(peak_rss_mb(), 1) if isolated else None,
+    }
+
+
+def _isolated(args):
+    return run_case(*args, isolated=True)
+
+
+def run_benchmarks(cases=None, sizes=None, repeat=1, isolate=True, progress=None):
+    """
+    Runs the selected cases at every size. With `isolate`, each measurement runs in a fresh
+    process so peak RSS belongs to that case alone (it is None otherwise).
+    """
+    results = []
+    for name in cases or list(CASES):
+        if name not in CASES:
+            raise ValueError(f"Unknown benchmark case '{name}'")
+        for n in sizes or DEFAULT_SIZES:
+            if isolate:
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(max_workers=1) as pool:
+                    result = pool.submit(_isolated, (name, n, repeat)).result()
+            else:
+                result = run_case(name, n, repeat)
+            results.append(result)
+            if progress:
+                progress(result)
+    return {
+        "version": __version__,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def save_report(report, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+def load_report(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(report, baseline, threshold=0.2):
+    """
+    Compares two reports; returns one entry per (case, rows) present in both, flagging a
+    regression when rows/s dropped by more than `threshold` (a fraction).
+    """
+    base = {(r["case"], r["rows"]): r for r in baseline["results"]}
+    rows = []
+    for r in report["results"]:
+        ref = base.get((r["case"], r["rows"]))
+        if not ref or not ref.get("rows_per_sec") or not r.get("rows_per_sec"):
+            continue
+        change = r["rows_per_sec"] / ref["rows_per_sec"] - 1
+        rows.append({
+            "case": r["case"],
+            "rows": r["rows"],
+            "baseline_rows_per_sec": ref["rows_per_sec"],
+            "rows_per_sec": r["rows_per_sec"],
+            "change": round(change, 4),
+            "regression": change < -threshold,
+        })
+    return rows
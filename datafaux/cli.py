@@ -1,12 +1,63 @@
 import click
 import sys
-import yaml
 import os
-from .config import DEFAULT_ROWS, DEFAULT_LOCALE, SUPPORTED_FORMATS, PRESETS, CHUNKSIZE_DEFAULT
-from .generators import people as people_gen
-from .generators import ecommerce as ecommerce_gen
-from .utils.exporters import save_df, save_df_stream
-from .utils.validators import validate_schema
+from .config import DEFAULT_ROWS, DEFAULT_LOCALE, SUPPORTED_FORMATS, PRESETS, CHUNKSIZE_DEFAULT, ENGINES, POOL_SIZE
+from .utils.compression import CODECS
+
+# pandas, Faker, yaml and the generators are imported inside the commands that need them,
+# so `--help` and small runs don't pay for them up front.
+
+def run_generator(generator_func, count, seed, workers=1, **kwargs):
+    """
+    Runs a generator in-process, or sharded over a process pool when `workers` > 1.
+    """
+    if workers > 1:
+        from .modes.parallel import generate_parallel
+        return generate_parallel(generator_func, count, workers=workers, seed=seed, **kwargs)
+    return generator_func(count=count, seed=seed, **kwargs)
+
+
+def run_stream(generator_func, out, **kwargs):
+    """
+    Runs `modes.streaming.generate_stream`, reporting checkpoint problems (e.g. --resume with
+    different options) as CLI errors.
+    """
+    from .modes.streaming import generate_stream
+    try:
+        generate_stream(generator_func, out, **kwargs)
+    except ValueError as e:
+        click.secho(f"[Error] {e}", fg="red")
+        click.secho("Tip: Rerun with the original options, or drop --resume to start over.", fg="yellow")
+        sys.exit(1)
+
+
+def mark(profiler, stage):
+    """
+    Starts a `--profile` stage (no-op without --profile).
+    """
+    if profiler is not None:
+        profiler.mark(stage)
+
+
+def finish_profile(profiler, path):
+    """
+    Prints the `--profile` summary and saves the JSON report to `path`.
+    """
+    if profiler is None:
+        return
+    from .profiling import format_report
+    profiler.close()
+    report = profiler.report()
+    for line in format_report(report):
+        click.echo(line)
+    try:
+        profiler.save(path, report)
+    except OSError as e:
+        click.secho(f"[Error] Could not save the profile report: {e}", fg="red")
+        click.secho("Tip: Pass a writable path with --profile-out.", fg="yellow")
+        sys.exit(1)
+    click.secho(f"Saved profile report to {path}", fg="green")
+
 
 @click.group()
 def main():
@@ -24,16 +75,63 @@ def main():
 @click.option("--mode", type=click.Choice(["normal", "streaming", "testers"]), default="normal",
               help="Generation mode: normal (in-memory), streaming (by chunks), testers (injects errors)")
 @click.option("--error-rate", default=0.05, help="Percentage of errors to inject in testers mode")
+@click.option("--inject-errors", "with_errors", is_flag=True, default=False,
+              help="Inject errors like testers mode, in any mode (e.g. together with --mode streaming)")
 @click.option("--chunksize", default=CHUNKSIZE_DEFAULT, help="Chunksize for streaming")
 @click.option("--customers-file", type=click.Path(exists=True), default=None, help="CSV or JSON file with customer data for ecommerce preset.")
+@click.option("--items-out", type=click.Path(), default=None,
+              help="For the ecommerce preset: write normalized order lines to this file instead of a nested items column.")
+@click.option("--engine", type=click.Choice(ENGINES), default="faker",
+              help="Generation engine for the people preset: faker (row by row) or columnar (vectorized, value pools)")
+@click.option("--workers", default=1, type=click.IntRange(min=1),
+              help="Number of worker processes: --count is split into shards (or chunks, in streaming mode) "
+                   "with seeds derived from --seed")
+@click.option("--pipeline", is_flag=True, default=False,
+              help="Streaming: write chunks from a dedicated writer thread while generation continues")
+@click.option("--queue-size", default=4, type=click.IntRange(min=1),
+              help="Streaming: max chunks buffered between producers and the writer (backpressure)")
+@click.option("--unordered", is_flag=True, default=False,
+              help="Streaming with --workers: write chunks as they are produced instead of in chunk order")
+@click.option("--row-group-size", default=None, type=click.IntRange(min=1),
+              help="Parquet row group size (default: one row group per chunk in streaming mode)")
+@click.option("--parquet-compression", default="snappy",
+              type=click.Choice(["snappy", "gzip", "zstd", "brotli", "lz4", "none"]), help="Parquet compression codec")
+@click.option("--compression", default=None, type=click.Choice(CODECS),
+              help="Compress CSV/JSON output (block-parallel). Inferred from --out extensions like .csv.gz or .ndjson.zst")
+@click.option("--partition-by", "partition_by", multiple=True,
+              help="Write --out as a directory of Hive-style partitions keyed on a column (e.g. currency) or a "
+                   "date part (e.g. order_date:month). Repeatable.")
+@click.option("--rows-per-file", default=None, type=click.IntRange(min=1),
+              help="Write --out as a directory of files (per partition) holding at most this many rows each")
+@click.option("--pool-size", default=None, type=click.IntRange(min=1),
+              help=f"Values sampled per value pool of the columnar engine and schemas (default: {POOL_SIZE}; "
+                   "built once per locale and size, then cached on disk)")
+@click.option("--checkpoint", is_flag=True, default=False,
+              help="Streaming (csv/json): record progress in an <out>.checkpoint.json manifest so an interrupted "
+                   "run can be resumed (deleted once the run completes)")
+@click.option("--resume", is_flag=True, default=False,
+              help="Streaming (csv/json): continue an interrupted --checkpoint run from its manifest")
+@click.option("--profile", is_flag=True, default=False,
+              help="Report time and peak memory per stage, per-column cost for schemas and per-chunk throughput "
+                   "when streaming")
+@click.option("--profile-out", type=click.Path(), default=None,
+              help="Where to save the --profile JSON report (default: <out>.profile.json)")
 @click.option("--verbose", is_flag=True, default=False, help="Enable verbose logging output.")
-def generate(preset, schema, count, out, fmt, seed, locale, mode, error_rate, chunksize, customers_file, verbose):
+def generate(preset, schema, count, out, fmt, seed, locale, mode, error_rate, with_errors, chunksize, customers_file,
+             items_out, engine, workers, pipeline, queue_size, unordered, row_group_size, parquet_compression, compression,
+             partition_by, rows_per_file, pool_size, checkpoint, resume, profile, profile_out, verbose):
     """Generate dataset with preset or schema. Supports config.yaml for default options."""
+    profiler = None
+    if profile:
+        from .profiling import Profiler
+        profiler = Profiler()
+        profiler.mark("config")
     # Load config.yaml if present
     config = {}
     config_path = os.path.join(os.getcwd(), "config.yaml")
     if os.path.exists(config_path):
         try:
+            import yaml
             with open(config_path, "r", encoding="utf-8") as f:
                 config = yaml.safe_load(f) or {}
             if verbose:
@@ -53,9 +151,84 @@ def generate(preset, schema, count, out, fmt, seed, locale, mode, error_rate, ch
     error_rate = error_rate if error_rate != 0.05 else config.get("error_rate", error_rate)
     chunksize = chunksize if chunksize != CHUNKSIZE_DEFAULT else config.get("chunksize", chunksize)
     customers_file = customers_file or config.get("customers_file")
+    items_out = items_out or config.get("items_out")
+    engine = engine if engine != "faker" else config.get("engine", engine)
+    workers = workers if workers != 1 else config.get("workers", workers)
+    pipeline = pipeline or config.get("pipeline", False)
+    queue_size = queue_size if queue_size != 4 else config.get("queue_size", queue_size)
+    unordered = unordered or config.get("unordered", False)
+    row_group_size = row_group_size or config.get("row_group_size")
+    parquet_compression = (parquet_compression if parquet_compression != "snappy"
+                           else config.get("parquet_compression", parquet_compression))
+    compression = compression or config.get("compression")
+    partition_by = list(partition_by) or config.get("partition_by") or []
+    if isinstance(partition_by, str):
+        partition_by = [partition_by]
+    rows_per_file = rows_per_file or config.get("rows_per_file")
+    pool_size = pool_size or config.get("pool_size")
+    if pool_size:
+        # read by `utils.pools.get_pools` here and in worker processes
+        os.environ["DATAFAUX_POOL_SIZE"] = str(pool_size)
+    resume = resume or config.get("resume", False)
+    checkpoint = checkpoint or config.get("checkpoint", False) or resume
+    with_errors = with_errors or config.get("inject_errors", False) or mode == "testers"
+    if profiler is not None:
+        profiler.options.update(preset=preset, schema=schema, count=count, format=fmt, seed=seed, mode=mode,
+                                chunksize=chunksize, engine=engine, workers=workers, inject_errors=bool(with_errors))
 
     if verbose:
-        click.echo(f"[Verbose] Options: preset={preset}, schema={schema}, count={count}, out={out}, format={fmt}, seed={seed}, locale={locale}, mode={mode}, error_rate={error_rate}, chunksize={chunksize}, customers_file={customers_file}")
+        # every option of this command, named after its flag, with the value resolved against config.yaml
+        resolved = locals()
+        options = [(max(param.opts, key=len).lstrip("-").replace("-", "_"), resolved[param.name])
+                   for param in click.get_current_context().command.params if param.name != "verbose"]
+        click.echo("[Verbose] Options: " + ", ".join(f"{name}={value}" for name, value in options))
+
+    sink_options = {}
+    if fmt == "parquet":
+        sink_options = {"compression": parquet_compression, "row_group_size": row_group_size}
+    if compression:
+        if fmt not in ("csv", "json"):
+            click.secho(f"[Error] --compression is only supported for csv and json output, not {fmt}.", fg="red")
+            click.secho("Tip: Use --parquet-compression for Parquet files.", fg="yellow")
+            sys.exit(1)
+        sink_options = {"compression": compression}
+    partitioned = bool(partition_by or rows_per_file)
+    if partitioned:
+        if fmt not in ("csv", "json", "parquet"):
+            click.secho(f"[Error] Partitioned output is not supported for {fmt}.", fg="red")
+            click.secho("Tip: Use --format csv, json or parquet with --partition-by/--rows-per-file.", fg="yellow")
+            sys.exit(1)
+        from .utils.partitions import parse_partition_by
+        try:
+            parse_partition_by(partition_by)
+        except ValueError as e:
+            click.secho(f"[Error] {e}", fg="red")
+            click.secho("Tip: Use --partition-by COLUMN or COLUMN:year|month|day.", fg="yellow")
+            sys.exit(1)
+        sink_options.update(partition_by=partition_by, rows_per_file=rows_per_file)
+
+    transform = None
+    if with_errors and mode == "streaming":
+        from functools import partial
+        from .modes.testers import inject_errors_stream
+        transform = partial(inject_errors_stream, error_rate=error_rate)
+
+    stream_options = {"sink_options": sink_options, "transform": transform, "workers": workers,
+                      "pipeline": pipeline, "queue_size": queue_size, "ordered": not unordered}
+    # streamed csv/json written in chunk order can be checkpointed, so an interrupted run can be resumed
+    if checkpoint and mode == "streaming" and fmt in ("csv", "json") and not unordered and not partitioned:
+        from .modes.checkpoint import manifest_path
+        stream_options.update(checkpoint=manifest_path(out), resume=resume)
+    elif checkpoint:
+        click.secho("[Error] --checkpoint/--resume need --mode streaming with single-file csv or json output in "
+                    "chunk order.", fg="red")
+        click.secho("Tip: Drop --checkpoint/--resume, or stream with --format csv/json without --unordered or "
+                    "partitioning.", fg="yellow")
+        sys.exit(1)
+    # columnar streams can hand Arrow tables straight to the sinks unless a transform needs DataFrames
+    arrow_chunks = transform is None
+    # in memory, columnar data is kept as a compact Arrow table unless errors are injected or shards merged
+    compact = not with_errors and workers == 1
 
     if not preset and not schema:
         click.secho("[Error] You must specify either --preset or --schema (in CLI or config.yaml).", fg="red")
@@ -65,7 +238,9 @@ def generate(preset, schema, count, out, fmt, seed, locale, mode, error_rate, ch
     df = None
 
     if schema:
+        mark(profiler, "schema_load")
         try:
+            import yaml
             with open(schema, "r", encoding="utf-8") as f:
                 doc = yaml.safe_load(f)
             if verbose:
@@ -74,6 +249,7 @@ def generate(preset, schema, count, out, fmt, seed, locale, mode, error_rate, ch
             click.secho(f"[Error] Failed to load schema file: {e}", fg="red")
             click.secho("Tip: Check that the file exists and is valid YAML.", fg="yellow")
             sys.exit(1)
+        from .utils.validators import validate_schema
         ok, msg = validate_schema(doc)
         if not ok:
             click.secho(f"[Error] Invalid schema: {msg}", fg="red")
@@ -82,37 +258,84 @@ def generate(preset, schema, count, out, fmt, seed, locale, mode, error_rate, ch
         stype = doc.get("type")
         if verbose:
             click.echo(f"[Verbose] Schema type: {stype}")
-        if stype == "people":
-            df = people_gen.generate_from_schema(doc, count=count, seed=seed, locale=locale)
-        elif stype == "ecommerce":
-            df = ecommerce_gen.generate_from_schema(doc, count=count, seed=seed, locale=locale)
-        else:
-            click.secho(f"[Error] Schema type '{stype}' is not supported in this version.", fg="red")
-            click.secho("Supported types: people, ecommerce", fg="yellow")
+        mark(profiler, "compile")
+        if stype == "relational":
+            from .generators.relational import compile_relational
+            from .modes.streaming import generate_relational
+            if fmt not in ("csv", "json", "parquet"):
+                click.secho(f"[Error] Relational schemas can't be written as {fmt}.", fg="red")
+                click.secho("Tip: Use --format csv, json or parquet (one file per table).", fg="yellow")
+                sys.exit(1)
+            if with_errors or workers > 1:
+                click.secho("[Error] Relational schemas don't support error injection or --workers yet.", fg="red")
+                click.secho("Tip: Drop --inject-errors/--mode testers and --workers.", fg="yellow")
+                sys.exit(1)
+            try:
+                plan = compile_relational(doc, locale)
+            except ValueError as e:
+                click.secho(f"[Error] Invalid schema: {e}", fg="red")
+                click.secho("Tip: Each table needs a 'name'; parents and 'ref' targets must be defined first "
+                            "and have a 'key'.", fg="yellow")
+                sys.exit(1)
+            out_dir = out if out != "out.csv" else "out"
+            mark(profiler, "stream")
+            rows = generate_relational(plan, out_dir, count=count, chunksize=chunksize, fmt=fmt,
+                                       sink_options=sink_options, seed=seed, arrow=True)
+            summary = ", ".join(f"{name}={n}" for name, n in rows.items())
+            click.secho(f"Generated {summary} in {out_dir}", fg="green")
+            finish_profile(profiler, profile_out or f"{out_dir}.profile.json")
+            return
+        from .generators.compiler import compile_schema
+        try:
+            plan = compile_schema(doc, locale)
+        except ValueError as e:
+            click.secho(f"[Error] Invalid schema: {e}", fg="red")
+            click.secho("Tip: Each field needs a 'name' and a 'type' with valid parameters.", fg="yellow")
+            sys.exit(1)
+        try:
+            plan.check_rows(count)
+        except ValueError as e:
+            click.secho(f"[Error] {e}", fg="red")
+            click.secho("Tip: Widen 'min'/'max' of the unique field or lower --count.", fg="yellow")
             sys.exit(1)
+        if mode == "streaming":
+            if verbose:
+                click.echo("[Verbose] Using streaming mode for compiled schema.")
+            click.secho("Generating in streaming mode...", fg="yellow")
+            from .modes.streaming import schema_stream
+            mark(profiler, "stream")
+            run_stream(schema_stream, out, count=count, chunksize=chunksize, fmt=fmt, seed=seed, plan=plan,
+                       arrow=arrow_chunks, profiler=profiler, **stream_options)
+            click.secho(f"Generated {count} records in {out}", fg="green")
+            finish_profile(profiler, profile_out or f"{out}.profile.json")
+            return
+        mark(profiler, "generate")
+        if workers > 1:
+            from .generators.compiler import generate_from_schema
+            df = run_generator(generate_from_schema, count, seed, workers, schema=doc, locale=locale)
+        else:
+            df = plan.generate(count=count, seed=seed, arrow=compact, profiler=profiler)
     else:
+        mark(profiler, "setup")
+        gen_kwargs = {"locale": locale}
         if preset == "people":
-            if mode == "streaming":
-                if verbose:
-                    click.echo("[Verbose] Using streaming mode for people preset.")
-                click.secho("Generating in streaming mode...", fg="yellow")
-                from .modes.streaming import generate_stream, people_stream
-                generate_stream(people_stream, out, count=count, chunksize=chunksize, fmt=fmt, seed=seed, locale=locale)
-                click.secho(f"Generated {count} records in {out}", fg="green")
-                return
-            else:
-                if verbose:
-                    click.echo("[Verbose] Using in-memory mode for people preset.")
-                df = people_gen.generate_default(count=count, seed=seed, locale=locale)
+            from .generators import people as people_gen
+            func = people_gen.generate_columnar if engine == "columnar" else people_gen.generate_default
+            stream_kwargs = dict(gen_kwargs, engine=engine, arrow=arrow_chunks)
+            if engine == "columnar" and compact and mode != "streaming":
+                gen_kwargs["arrow"] = True
         elif preset == "ecommerce":
             customers_df = None
             if customers_file:
                 import pandas as pd
                 try:
                     if customers_file.lower().endswith(".csv"):
-                        customers_df = pd.read_csv(customers_file)
+                        # only the key column is used: check the header, then load just customer_id
+                        columns = set(pd.read_csv(customers_file, nrows=0).columns)
+                        customers_df = pd.read_csv(customers_file, usecols=lambda c: c == "customer_id")
                     elif customers_file.lower().endswith(".json"):
                         customers_df = pd.read_json(customers_file)
+                        columns = set(customers_df.columns)
                     else:
                         click.secho("[Error] Unsupported customers file format. Use CSV or JSON.", fg="red")
                         click.secho("Tip: Provide a .csv or .json file for --customers-file.", fg="yellow")
@@ -125,32 +348,197 @@ def generate(preset, schema, count, out, fmt, seed, locale, mode, error_rate, ch
                     sys.exit(1)
                 # Check required columns
                 required_cols = {"customer_id", "name", "email"}
-                if not required_cols.issubset(set(customers_df.columns)):
+                if not required_cols.issubset(columns):
                     click.secho(f"[Error] Customers file must contain columns: {', '.join(required_cols)}.", fg="red")
                     click.secho("Tip: Check your CSV/JSON header.", fg="yellow")
                     sys.exit(1)
-            if verbose:
-                click.echo("[Verbose] Generating ecommerce data.")
-            df = ecommerce_gen.generate_default(count=count, customers_df=customers_df, seed=seed, locale=locale)
+                # a duplicated customer_id would be picked more often than the others
+                duplicated = customers_df["customer_id"].duplicated()
+                if duplicated.any():
+                    click.secho(f"[Warning] Dropping {duplicated.sum()} rows with a duplicate customer_id from "
+                                f"{customers_file}.", fg="yellow")
+                    customers_df = customers_df[~duplicated]
+                if customers_df.empty:
+                    click.secho(f"[Error] Customers file {customers_file} holds no customers.", fg="red")
+                    click.secho("Tip: Add at least one row, or drop --customers-file to generate customers.",
+                                fg="yellow")
+                    sys.exit(1)
+            if items_out and mode == "streaming":
+                click.secho("[Error] --items-out is not supported in streaming mode.", fg="red")
+                click.secho("Tip: Drop --items-out to stream orders with a nested items column.", fg="yellow")
+                sys.exit(1)
+            from .generators import ecommerce as ecommerce_gen
+            func = ecommerce_gen.generate_tables if items_out else ecommerce_gen.generate_default
+            gen_kwargs["customers_df"] = customers_df
+            stream_kwargs = dict(gen_kwargs, arrow=arrow_chunks)
+            if compact and mode != "streaming":
+                gen_kwargs["arrow"] = True
+        elif preset == "finance":
+            from .generators import finance as finance_gen
+            func = finance_gen.generate_default
+            stream_kwargs = gen_kwargs
+        elif preset == "health":
+            from .generators import health as health_gen
+            func = health_gen.generate_default
+            stream_kwargs = dict(gen_kwargs, arrow=arrow_chunks)
+            if compact and mode != "streaming":
+                gen_kwargs["arrow"] = True
         else:
             click.secho(f"[Error] Preset '{preset}' is not supported in this version.", fg="red")
             click.secho(f"Supported presets: {', '.join(PRESETS)}", fg="yellow")
             sys.exit(1)
 
-    if mode == "testers":
+        if mode == "streaming":
+            if verbose:
+                click.echo(f"[Verbose] Using streaming mode for {preset} preset.")
+            click.secho("Generating in streaming mode...", fg="yellow")
+            from .modes.streaming import STREAMS
+            mark(profiler, "stream")
+            run_stream(STREAMS[preset], out, count=count, chunksize=chunksize, fmt=fmt, seed=seed,
+                       profiler=profiler, **stream_options, **stream_kwargs)
+            click.secho(f"Generated {count} records in {out}", fg="green")
+            finish_profile(profiler, profile_out or f"{out}.profile.json")
+            return
+        if verbose:
+            click.echo(f"[Verbose] Generating {preset} data in memory ({engine} engine).")
+        mark(profiler, "generate")
+        df = run_generator(func, count, seed, workers, **gen_kwargs)
+        if preset == "ecommerce" and items_out:
+            from .utils.exporters import save_df
+            df, order_items = df
+            mark(profiler, "export")
+            # order lines go to a single file; partitioning applies to --out only
+            save_df(order_items, items_out, fmt,
+                    **{k: v for k, v in sink_options.items() if k not in ("partition_by", "rows_per_file")})
+            click.secho(f"Generated {len(order_items)} order lines in {items_out}", fg="green")
+
+    if with_errors:
         if verbose:
             click.echo("[Verbose] Injecting errors into dataset.")
+        mark(profiler, "error_injection")
         from .modes.testers import inject_errors
-        df = inject_errors(df, error_rate=error_rate)
+        df = inject_errors(df, error_rate=error_rate, seed=seed)
 
-    # support streaming from a large df (writes in chunks)
-    if mode == "streaming" and df is not None:
-        if verbose:
-            click.echo("[Verbose] Saving DataFrame in streaming mode.")
-        save_df_stream(df, out, fmt=fmt, chunksize=chunksize)
+    if verbose:
+        click.echo("[Verbose] Saving data in memory mode.")
+    mark(profiler, "export")
+    if partitioned:
+        from .utils.exporters import open_sink
+        with open_sink(out, fmt, **sink_options) as sink:
+            sink.write(df)
     else:
-        if verbose:
-            click.echo("[Verbose] Saving DataFrame in memory mode.")
-        save_df(df, out, fmt)
+        from .utils.exporters import save_df
+        save_df(df, out, fmt, **sink_options)
+
+    click.secho(f"Generated {len(df)} records in {out}", fg="green")
+    finish_profile(profiler, profile_out or f"{out}.profile.json")
+
+@main.command()
+@click.option("--case", "cases", multiple=True, help="Benchmark case to run (repeatable). Default: all cases.")
+@click.option("--sizes", default="1000,10000", help="Comma-separated row counts.")
+@click.option("--repeat", default=1, type=click.IntRange(min=1), help="Runs per measurement (best time is kept).")
+@click.option("--out", "-o", default=None, help="Save the JSON report to this file.")
+@click.option("--compare", "baseline", type=click.Path(exists=True), default=None,
+              help="Baseline JSON report to compare against.")
+@click.option("--threshold", default=0.2, help="Allowed rows/s drop (fraction) before flagging a regression.")
+@click.option("--no-isolate", is_flag=True, default=False, help="Run all cases in this process (faster; RSS growth only, no peak RSS).")
+@click.option("--list", "list_cases", is_flag=True, default=False, help="List available cases and exit.")
+@click.option("--startup", is_flag=True, default=False,
+              help="Time CLI startup (--help, a small generate) against its budget instead of running cases.")
+def bench(cases, sizes, repeat, out, baseline, threshold, no_isolate, list_cases, startup):
+    """Benchmark generators, error injection and exporters (rows/s, RSS growth and peak RSS)."""
+    from .bench import CASES, run_benchmarks, save_report, load_report, compare, startup_times
+
+    if startup:
+        results = startup_times(repeat=max(repeat, 3))
+        for r in results:
+            color = "red" if r["over_budget"] else "green"
+            click.secho(f"{r['command']:<18} {r['seconds']:>8.3f}s (budget {r['budget_seconds']}s)", fg=color)
+        if out:
+            save_report({"startup": results}, out)
+            click.secho(f"Saved startup report to {out}", fg="green")
+        over = [r["command"] for r in results if r["over_budget"]]
+        if over:
+            click.secho(f"[Error] Startup over budget: {', '.join(over)}.", fg="red")
+            click.secho("Tip: Check for new module-level imports of pandas, Faker or pyarrow "
+                        "(python -X importtime -m datafaux.main --help).", fg="yellow")
+            sys.exit(1)
+        return
+    if list_cases:
+        for name in CASES:
+            click.echo(name)
+        return
+    try:
+        sizes = [int(s) for s in sizes.split(",") if s.strip()]
+    except ValueError:
+        click.secho(f"[Error] Invalid --sizes value: {sizes}", fg="red")
+        click.secho("Tip: Use comma-separated integers, e.g. --sizes 1000,10000", fg="yellow")
+        sys.exit(1)
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        click.secho(f"[Error] Unknown benchmark case(s): {', '.join(unknown)}", fg="red")
+        click.secho("Tip: Use 'datafaux bench --list' to see available cases.", fg="yellow")
+        sys.exit(1)
+
+    def progress(r):
+        peak = f"{r['peak_rss_mb']:>9.1f} MB peak" if r["peak_rss_mb"] is not None else ""
+        click.echo(f"{r['case']:<18} {r['rows']:>10} rows {r['seconds']:>10.3f}s "
+                   f"{r['rows_per_sec']:>14,.0f} rows/s {r['rss_growth_mb']:>+9.1f} MB {peak}".rstrip())
+
+    report = run_benchmarks(cases=list(cases) or None, sizes=sizes, repeat=repeat, isolate=not no_isolate,
+                            progress=progress)
+    if out:
+        save_report(report, out)
+        click.secho(f"Saved benchmark report to {out}", fg="green")
+    if baseline:
+        rows = compare(report, load_report(baseline), threshold=threshold)
+        regressions = [r for r in rows if r["regression"]]
+        for r in rows:
+            color = "red" if r["regression"] else "green"
+            click.secho(f"{r['case']:<18} {r['rows']:>10} rows {r['change']:>+8.1%}", fg=color)
+        if regressions:
+            click.secho(f"[Error] {len(regressions)} benchmark regression(s) above {threshold:.0%}.", fg="red")
+            sys.exit(1)
 
-    click.secho(f"Generated {len(df)} records in {out}", fg="green")
\ No newline at end of file
+@main.command()
+@click.option("--host", default="127.0.0.1", help="Address to listen on.")
+@click.option("--port", "-p", default=8765, type=click.IntRange(0, 65535), help="TCP port to listen on.")
+@click.option("--socket", "socket_path", type=click.Path(), default=None,
+              help="Listen on this Unix socket instead of TCP.")
+@click.option("--workers", default=1, type=click.IntRange(min=1),
+              help="Worker processes generating chunks (each keeps its own Faker, pools and schemas warm).")
+@click.option("--locale", default=DEFAULT_LOCALE, help="Default locale, warmed at startup (requests can pass ?locale=).")
+@click.option("--chunksize", default=CHUNKSIZE_DEFAULT, type=click.IntRange(min=1),
+              help="Default rows per generated chunk (requests can pass ?chunksize=).")
+@click.option("--schema", "schemas", multiple=True, type=click.Path(exists=True),
+              help="Schema file to keep compiled, requested as ?schema=<file name without extension>. Repeatable.")
+@click.option("--verbose", is_flag=True, default=False, help="Log every request.")
+def serve(host, port, socket_path, workers, locale, chunksize, schemas, verbose):
+    """Run a local generation server streaming NDJSON/CSV over HTTP (TCP or a Unix socket)."""
+    import yaml
+    from .server import GenerationServer
+
+    docs = {}
+    for path in schemas:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                docs[os.path.splitext(os.path.basename(path))[0]] = yaml.safe_load(f)
+        except Exception as e:
+            click.secho(f"[Error] Failed to load schema file: {e}", fg="red")
+            click.secho("Tip: Check that the file exists and is valid YAML.", fg="yellow")
+            sys.exit(1)
+    server = GenerationServer(workers=workers, locale=locale, chunksize=chunksize, schemas=docs,
+                              log=click.echo if verbose else None)
+    try:
+        server.serve_forever(host, port, socket_path,
+                             ready=lambda address: click.secho(f"Serving on {address} (Ctrl+C to stop)", fg="green"))
+    except ValueError as e:
+        click.secho(f"[Error] Invalid schema: {e}", fg="red")
+        click.secho("Tip: Relational schemas can't be served; each field needs a 'name' and a 'type'.", fg="yellow")
+        sys.exit(1)
+    except OSError as e:
+        click.secho(f"[Error] Could not listen: {e}", fg="red")
+        click.secho("Tip: Pick another --port, or check the --socket path.", fg="yellow")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        click.echo("Stopped.")
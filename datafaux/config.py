@@ -2,4 +2,7 @@ DEFAULT_LOCALE = "en_US"
 DEFAULT_ROWS = 100
 SUPPORTED_FORMATS = ["csv", "json", "parquet", "xlsx"]
 PRESETS = ["people", "ecommerce", "finance", "health"]
-CHUNKSIZE_DEFAULT = 1000
\ No newline at end of file
+CHUNKSIZE_DEFAULT = 1000
+ENGINES = ["faker", "columnar"]
+POOL_SIZE = 20000
+CUSTOMER_POOL_MAX = 100000
@@ -1 +1,13 @@
-from . import people, ecommerce, finance, health  # noqa
\ No newline at end of file
+"""
+Preset generators. Submodules are imported on first access (`generators.people`, ...), so importing
+the package does not pull in pandas and Faker.
+"""
+import importlib
+
+__all__ = ["people", "ecommerce", "finance", "health"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
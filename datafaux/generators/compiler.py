@@ -0,0 +1,383 @@
+import json
+import numpy as np
+import pandas as pd
+from ..utils.columns import (uuid_column, uuid_bytes, int_column, datetime_values, format_datetimes, to_timestamp,
+                             pool_indices, pooled_email_column, pooled_phone_column)
+from ..utils.distributions import arrival_seconds, distribution_of, index_cdf, sample, sample_indices
+from ..utils.faker_helpers import derive_seed, get_rng, reference_time
+from ..utils.pools import get_pools
+from ..utils.unique import UNIQUE_TYPES, field_key, permute, row_suffixed
+from ..utils.validators import validate_schema
+
+
+class ColumnGenerator:
+    """
+    Base class for compiled columns: `generate(n, rng, now, offset)` returns a whole column of `n` values
+    for the rows starting at row `offset` of the dataset, `generate_arrow` the same values (drawn
+    identically from `rng`) as a compact pyarrow array. `capacity` is the number of distinct values a
+    `unique` column can produce (None if unbounded).
+    """
+    capacity = None
+
+    def __init__(self, name, spec):
+        self.name = name
+        self.spec = spec
+        self.unique = bool(spec.get("unique"))
+
+    def check_rows(self, rows):
+        if self.capacity is not None and rows > self.capacity:
+            raise ValueError(f"Field '{self.name}': 'unique' needs {rows} distinct values, but only "
+                             f"{self.capacity} are available.")
+
+    def generate(self, n, rng, now=None, offset=0):
+        raise NotImplementedError
+
+    def generate_arrow(self, n, rng, now=None, offset=0):
+        import pyarrow as pa
+        return pa.array(self.generate(n, rng, now, offset))
+
+
+class UUIDColumn(ColumnGenerator):
+    def generate(self, n, rng, now=None, offset=0):
+        return uuid_column(rng, n)
+
+    def generate_arrow(self, n, rng, now=None, offset=0):
+        from ..utils.arrow_columns import uuid_array
+        return uuid_array(uuid_bytes(rng, n))
+
+
+class NumericColumn(ColumnGenerator):
+    """
+    Base for int/float columns: uniform between `min` and `max` (`default_range` if missing), or any
+    distribution of `utils.distributions`, clipped to `min`/`max` when they are given.
+    """
+    default_range = (0, 100)
+
+    def __init__(self, name, spec):
+        super().__init__(name, spec)
+        try:
+            self.distribution = distribution_of(spec)
+        except ValueError as e:
+            raise ValueError(f"Field '{name}': {e}")
+        if self.distribution != "uniform":
+            try:
+                sample(np.random.default_rng(0), spec, 1)
+            except ValueError as e:
+                raise ValueError(f"Field '{name}': invalid '{self.distribution}' parameters ({e}).")
+        uniform = self.distribution == "uniform"
+        self.low = self.cast(spec["min"]) if "min" in spec else (self.default_range[0] if uniform else None)
+        self.high = self.cast(spec["max"]) if "max" in spec else (self.default_range[1] if uniform else None)
+        if self.low is not None and self.high is not None and self.low > self.high:
+            raise ValueError(f"Field '{name}': 'min' must be <= 'max'.")
+        if self.unique and self.distribution != "uniform":
+            raise ValueError(f"Field '{name}': 'unique' can't be combined with a '{self.distribution}' distribution.")
+
+    def cast(self, value):
+        raise NotImplementedError
+
+    def draw(self, n, rng):
+        values = sample(rng, self.spec, n)
+        if self.low is not None or self.high is not None:
+            values = np.clip(values, self.low, self.high)
+        return values
+
+
+class IntColumn(NumericColumn):
+    """
+    With `unique`, row `i` gets value `min + permute(i)` (see `utils.unique`), so no value repeats
+    until all `max - min + 1` values are used.
+    """
+    cast = staticmethod(int)
+
+    def __init__(self, name, spec):
+        super().__init__(name, spec)
+        if self.unique:
+            self.capacity = self.high - self.low + 1
+            self.keys = field_key(name)
+
+    def generate(self, n, rng, now=None, offset=0):
+        if self.unique:
+            self.check_rows(offset + n)
+            return self.low + permute(np.arange(offset, offset + n), self.capacity, self.keys).astype(np.int64)
+        if self.distribution == "uniform":
+            return int_column(rng, n, self.low, self.high)
+        return np.rint(self.draw(n, rng)).astype(np.int64)
+
+    def generate_arrow(self, n, rng, now=None, offset=0):
+        from ..utils.arrow_columns import int_array
+        if self.low is None or self.high is None:
+            return super().generate_arrow(n, rng, now, offset)
+        return int_array(self.generate(n, rng, now, offset), self.low, self.high)
+
+
+class FloatColumn(NumericColumn):
+    cast = staticmethod(float)
+    default_range = (0.0, 1000.0)
+
+    def __init__(self, name, spec):
+        super().__init__(name, spec)
+        self.decimals = int(spec.get("decimals", 2))
+
+    def generate(self, n, rng, now=None, offset=0):
+        if self.distribution == "uniform":
+            return np.round(rng.uniform(self.low, self.high, size=n), self.decimals)
+        return np.round(self.draw(n, rng).astype(float), self.decimals)
+
+
+class DatetimeColumn(ColumnGenerator):
+    """
+    Uniform between `start` and `end`, or Poisson arrivals from `start` (`distribution: poisson`
+    with a `rate` per `per` unit; see `utils.distributions.arrival_seconds`).
+    """
+
+    def __init__(self, name, spec):
+        super().__init__(name, spec)
+        self.start = spec.get("start", "-3y")
+        self.end = spec.get("end", "now")
+        for key in ("start", "end"):
+            try:
+                to_timestamp(getattr(self, key), reference_time())
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"Field '{name}': invalid '{key}' {getattr(self, key)!r} ({e}).")
+        self.arrivals = spec.get("distribution", "uniform") == "poisson"
+        if not self.arrivals and spec.get("distribution", "uniform") != "uniform":
+            raise ValueError(f"Field '{name}': datetime fields support 'distribution: poisson' (arrivals) only.")
+        if self.arrivals:
+            try:
+                arrival_seconds(np.random.default_rng(0), spec, 1)
+            except ValueError as e:
+                raise ValueError(f"Field '{name}': {e}")
+
+    def values(self, n, rng, now=None, offset=0):
+        if not self.arrivals:
+            return datetime_values(rng, n, start=self.start, end=self.end, now=now)
+        seconds = np.floor(arrival_seconds(rng, self.spec, n, offset)).astype(np.int64)
+        return (to_timestamp(self.start, now) + seconds).astype("datetime64[s]")
+
+    def generate(self, n, rng, now=None, offset=0):
+        return format_datetimes(self.values(n, rng, now, offset))
+
+    def generate_arrow(self, n, rng, now=None, offset=0):
+        from ..utils.arrow_columns import timestamp_array
+        return timestamp_array(self.values(n, rng, now, offset))
+
+
+class PoolColumn(ColumnGenerator):
+    """
+    Draws values from a per-locale pool (names, addresses, ...) by integer index: uniformly, or with
+    `weights` (one per value) or a Zipf `distribution` (the first values are the most frequent).
+    """
+
+    def __init__(self, name, spec, pool):
+        super().__init__(name, spec)
+        self.pool = pool
+        try:
+            self.cdf = index_cdf(spec, len(pool))
+        except ValueError as e:
+            raise ValueError(f"Field '{name}': {e}")
+
+    def indices(self, n, rng):
+        return pool_indices(rng, self.pool, n) if self.cdf is None else sample_indices(rng, self.cdf, n)
+
+    def generate(self, n, rng, now=None, offset=0):
+        if self.unique:
+            return row_suffixed(self.pool[self.indices(n, rng)], offset).astype(object)
+        return self.pool[self.indices(n, rng)]
+
+    def generate_arrow(self, n, rng, now=None, offset=0):
+        from ..utils.arrow_columns import dictionary_array
+        if self.unique:
+            return super().generate_arrow(n, rng, now, offset)
+        return dictionary_array(self.indices(n, rng), self.pool)
+
+
+class EnumColumn(PoolColumn):
+    def __init__(self, name, spec):
+        values = spec.get("values")
+        if not isinstance(values, list) or not values:
+            raise ValueError(f"Field '{name}': 'enum' requires a non-empty 'values' list.")
+        super().__init__(name, spec, np.array(values, dtype=object))
+        self.values = self.pool
+
+
+class EmailColumn(ColumnGenerator):
+    def __init__(self, name, spec, pools):
+        super().__init__(name, spec)
+        self.pools = pools
+
+    def generate(self, n, rng, now=None, offset=0):
+        return pooled_email_column(rng, self.pools, n, offset if self.unique else None)
+
+
+class PhoneColumn(EmailColumn):
+    def generate(self, n, rng, now=None, offset=0):
+        return pooled_phone_column(rng, self.pools, n)
+
+
+class ArrayColumn(ColumnGenerator):
+    """
+    Generates a list per row: all items of a batch are produced as one column, then split.
+    """
+
+    def __init__(self, name, spec, item):
+        super().__init__(name, spec)
+        if item.unique:
+            raise ValueError(f"Field '{name}': 'unique' is not supported for array items.")
+        self.item = item
+        self.min_items = int(spec.get("min_items", 1))
+        self.max_items = int(spec.get("max_items", 4))
+
+    def generate(self, n, rng, now=None, offset=0):
+        lengths = rng.integers(self.min_items, self.max_items + 1, size=n)
+        flat = self.item.generate(int(lengths.sum()), rng, now).tolist()
+        bounds = np.concatenate(([0], np.cumsum(lengths)))
+        out = np.empty(n, dtype=object)
+        out[:] = [flat[bounds[i]:bounds[i + 1]] for i in range(n)]
+        return out
+
+
+class ObjectColumn(ColumnGenerator):
+    def __init__(self, name, spec, fields):
+        super().__init__(name, spec)
+        self.fields = fields
+        capacities = [f.capacity for f in fields if f.capacity is not None]
+        self.capacity = min(capacities) if capacities else None
+
+    def generate(self, n, rng, now=None, offset=0):
+        cols = [(f.name, f.generate(n, rng, now, offset).tolist()) for f in self.fields]
+        out = np.empty(n, dtype=object)
+        out[:] = [{fname: values[i] for fname, values in cols} for i in range(n)]
+        return out
+
+
+POOL_TYPES = {
+    "name": "name",
+    "full_name": "name",
+    "user_name": "user_name",
+    "address": "address",
+    "street_address": "street_address",
+    "city": "city",
+}
+
+POOLED_TYPES = {
+    "email": EmailColumn,
+    "phone": PhoneColumn,
+    "phone_number": PhoneColumn,
+}
+
+SIMPLE_TYPES = {
+    "uuid": UUIDColumn,
+    "int": IntColumn,
+    "float": FloatColumn,
+    "datetime": DatetimeColumn,
+    "enum": EnumColumn,
+}
+
+
+def compile_field(spec, pools):
+    if not isinstance(spec, dict) or not spec.get("name"):
+        raise ValueError(f"Each field must be a mapping with a 'name': {spec!r}")
+    name = spec["name"]
+    ftype = spec.get("type")
+    if spec.get("unique") and ftype not in UNIQUE_TYPES:
+        raise ValueError(f"Field '{name}': 'unique' is supported for {', '.join(UNIQUE_TYPES)} fields, "
+                         f"not {ftype}.")
+    if ftype in POOL_TYPES:
+        return PoolColumn(name, spec, pools[POOL_TYPES[ftype]])
+    if ftype in POOLED_TYPES:
+        return POOLED_TYPES[ftype](name, spec, pools)
+    if ftype in SIMPLE_TYPES:
+        return SIMPLE_TYPES[ftype](name, spec)
+    if ftype == "array":
+        item = dict(spec.get("item") or {}, name=f"{name}[]")
+        return ArrayColumn(name, spec, compile_field(item, pools))
+    if ftype == "object":
+        return ObjectColumn(name, spec, [compile_field(f, pools) for f in spec.get("fields") or []])
+    # unknown types fall back to a random word, like the row-by-row generators did
+    return PoolColumn(name, spec, pools["word"])
+
+
+class Plan:
+    """
+    A compiled schema: one column generator per field, run as whole columns per batch.
+    """
+
+    def __init__(self, stype, columns):
+        self.type = stype
+        self.columns = columns
+
+    def run(self, count, rng, now=None, arrow=False, offset=0, profiler=None):
+        """
+        Generates one chunk (rows `offset`.. of the dataset); with `arrow`, returns a pyarrow Table of
+        compact columns instead of a DataFrame (the sinks serialize those without going through pandas).
+        With a `profiler` (see `datafaux.profiling`), the cost of every column and of building the
+        table is recorded.
+        """
+        if profiler is not None:
+            return self._run_profiled(count, rng, now, arrow, offset, profiler)
+        if arrow:
+            import pyarrow as pa
+            return pa.table({col.name: col.generate_arrow(count, rng, now, offset) for col in self.columns})
+        return pd.DataFrame({col.name: col.generate(count, rng, now, offset) for col in self.columns},
+                            columns=[col.name for col in self.columns])
+
+    def _run_profiled(self, count, rng, now, arrow, offset, profiler):
+        import time
+        data = {}
+        for col in self.columns:
+            start = time.perf_counter()
+            data[col.name] = (col.generate_arrow if arrow else col.generate)(count, rng, now, offset)
+            profiler.column(col.name, time.perf_counter() - start, count)
+        start = time.perf_counter()
+        if arrow:
+            import pyarrow as pa
+            table = pa.table(data)
+        else:
+            table = pd.DataFrame(data, columns=[col.name for col in self.columns])
+        profiler.add("table_construction" if arrow else "dataframe_construction", time.perf_counter() - start)
+        return table
+
+    def check_rows(self, rows):
+        """
+        Raises ValueError if a `unique` column can't produce `rows` distinct values.
+        """
+        for col in self.columns:
+            col.check_rows(rows)
+
+    def generate(self, count=100, seed=None, now=None, rng=None, arrow=False, profiler=None, offset=0):
+        return self.run(count, rng or get_rng(seed), now or reference_time(seed), arrow, offset, profiler)
+
+    def batches(self, count=1000000, chunksize=1000, seed=None, now=None, start=0, step=1, arrow=False,
+                profiler=None):
+        """
+        Yields DataFrame (or, with `arrow`, pyarrow Table) chunks; chunk `i` uses its own generator seeded
+        with `derive_seed(seed, i)`. `start` and `step` select a subset of the chunks. A 0-row run
+        yields one empty chunk, so the sinks still get the columns.
+        """
+        now = now or reference_time(seed)
+        for index in range(start, max(1, -(-count // chunksize)), step):
+            yield self.run(min(chunksize, count - index * chunksize), get_rng(derive_seed(seed, index)), now, arrow,
+                           offset=index * chunksize, profiler=profiler)
+
+
+_plans = {}
+
+
+def compile_schema(schema, locale="en_US"):
+    """
+    Compiles a schema into a `Plan`. Plans are cached by (schema, locale), so repeated `generate`
+    runs and streaming chunks reuse the same column generators.
+    Raises ValueError if the schema is invalid.
+    """
+    ok, msg = validate_schema(schema)
+    if not ok:
+        raise ValueError(msg)
+    key = (json.dumps(schema, sort_keys=True, default=str), locale)
+    if key not in _plans:
+        pools = get_pools(locale)
+        _plans[key] = Plan(schema.get("type"), [compile_field(f, pools) for f in schema.get("fields") or []])
+    return _plans[key]
+
+
+def generate_from_schema(schema, count=100, seed=None, locale="en_US", now=None, rng=None, offset=0):
+    return compile_schema(schema, locale).generate(count=count, seed=seed, now=now, rng=rng, offset=offset)
@@ -1,8 +1,8 @@
-from ..utils.faker_helpers import get_faker
+from ..utils.faker_helpers import get_faker, get_rng, reference_time
+from ..utils.columns import format_uuids, uuid_bytes
+from .compiler import compile_schema
+import numpy as np
 import pandas as pd
-import random
-import uuid
-from datetime import datetime, timedelta
 
 PRODUCTS_SAMPLE = [
     {"sku": "SKU-1001", "name": "T-shirt", "price": 19.99},
@@ -10,40 +10,126 @@ PRODUCTS_SAMPLE = [
     {"sku": "SKU-1003", "name": "Sneakers", "price": 79.95},
     {"sku": "SKU-1004", "name": "Backpack", "price": 39.0},
 ]
+PRODUCT_SKUS = np.array([p["sku"] for p in PRODUCTS_SAMPLE], dtype=object)
+PRODUCT_NAMES = np.array([p["name"] for p in PRODUCTS_SAMPLE], dtype=object)
+PRODUCT_PRICES = np.array([p["price"] for p in PRODUCTS_SAMPLE])
+CURRENCIES = np.array(["USD", "EUR"], dtype=object)
 
 
-def generate_default(count=100, customers_df=None, seed=None, locale="en_US"):
-    fake = get_faker(locale, seed)
+def generate_customers(count=100, seed=None, locale="en_US", fake=None):
+    fake = fake or get_faker(locale, seed)
+    return pd.DataFrame([{
+        "customer_id": fake.uuid4(),
+        "name": fake.name(),
+        "email": fake.safe_email(),
+    } for _ in range(count)])
+
+
+def generate_tables(count=100, customers_df=None, seed=None, locale="en_US", now=None, fake=None, rng=None,
+                    arrow=False):
+    """
+    Generates `count` orders plus their normalized order lines as (orders, order_items) DataFrames.
+
+    All customer indices, item counts, SKUs and quantities are drawn as NumPy arrays in one pass and
+    totals are computed from the product price array, so there is no per-order pandas work.
+    With `arrow`, both come back as pyarrow Tables of compact columns (order_id as `arrow.uuid`,
+    order_date as `timestamp[s]`, currency, sku and name as dictionaries; see `utils.arrow_columns`).
+    Raises ValueError if `customers_df` holds no customers to place the orders.
+    """
+    fake = fake or get_faker(locale, seed)
+    rng = rng or get_rng(fake.random.getrandbits(64))
+    now = now or reference_time(seed)
 
     if customers_df is None:
-        customers_df = pd.DataFrame([{
-            "customer_id": str(uuid.uuid4()),
-            "name": fake.name(),
-            "email": fake.safe_email(),
-        } for _ in range(max(1, count // 3))])
-
-    orders = []
-    for _ in range(count):
-        cust = customers_df.sample(1).iloc[0]
-        nitems = random.randint(1, 4)
-        items = []
-        total = 0.0
-        for _ in range(nitems):
-            p = random.choice(PRODUCTS_SAMPLE)
-            qty = random.randint(1, 5)
-            items.append({"sku": p["sku"], "name": p["name"], "unit_price": p["price"], "qty": qty})
-            total += p["price"] * qty
-        orders.append({
-            "order_id": str(uuid.uuid4()),
-            "customer_id": cust["customer_id"],
-            "order_date": (datetime.utcnow() - timedelta(days=random.randint(0, 365))).isoformat(),
-            "items": items,
-            "total": round(total, 2),
-            "currency": "USD" if locale.startswith("en") else "EUR"
+        customers_df = generate_customers(max(1, count // 3), fake=fake)
+    customer_ids = customers_df["customer_id"].to_numpy()
+    if count and not len(customer_ids):
+        raise ValueError("No customers to place orders for (customers_df is empty)")
+
+    nitems = rng.integers(1, 5, size=count)
+    order_pos = np.repeat(np.arange(count), nitems)
+    first_line = np.cumsum(nitems) - nitems
+    sku_idx = rng.integers(0, len(PRODUCTS_SAMPLE), size=len(order_pos))
+    qty = rng.integers(1, 6, size=len(order_pos))
+    unit_price = PRODUCT_PRICES[sku_idx]
+    totals = np.bincount(order_pos, weights=unit_price * qty, minlength=count).round(2)
+
+    days = rng.integers(0, 366, size=count).astype("timedelta64[D]")
+    raw_ids = uuid_bytes(rng, count)
+    customers = customer_ids[rng.integers(0, len(customer_ids), size=count)]
+    order_dates = np.datetime64(now, "s") - days
+    currency = np.full(count, 0 if locale.startswith("en") else 1, dtype=np.int8)
+    line = np.arange(len(order_pos)) - first_line[order_pos] + 1
+
+    if arrow:
+        import pyarrow as pa
+        from ..utils.arrow_columns import uuid_array, timestamp_array, dictionary_array
+        orders = pa.table({
+            "order_id": uuid_array(raw_ids),
+            "customer_id": pa.array(customers),
+            "order_date": timestamp_array(order_dates),
+            "total": pa.array(totals),
+            "currency": dictionary_array(currency, CURRENCIES),
         })
-    return pd.DataFrame(orders)
+        order_items = pa.table({
+            "order_id": uuid_array(raw_ids[order_pos]),
+            "line": pa.array(line),
+            "sku": dictionary_array(sku_idx, PRODUCT_SKUS),
+            "name": dictionary_array(sku_idx, PRODUCT_NAMES),
+            "unit_price": pa.array(unit_price),
+            "qty": pa.array(qty),
+        })
+        return orders, order_items
+
+    order_ids = format_uuids(raw_ids)
+    orders = pd.DataFrame({
+        "order_id": order_ids,
+        "customer_id": customers,
+        "order_date": order_dates.astype("U19").astype(object),
+        "total": totals,
+        "currency": CURRENCIES[currency],
+    })
+    order_items = pd.DataFrame({
+        "order_id": order_ids[order_pos],
+        "line": line,
+        "sku": PRODUCT_SKUS[sku_idx],
+        "name": PRODUCT_NAMES[sku_idx],
+        "unit_price": unit_price,
+        "qty": qty,
+    })
+    return orders, order_items
+
+
+def nest_items(orders, order_items):
+    """
+    Adds the legacy nested `items` column (list of dicts per order) built from the normalized order lines.
+    Pyarrow Tables (see `generate_tables(arrow=True)`) get it as a list<struct> column.
+    """
+    names = ["sku", "name", "unit_price", "qty"]
+    # order lines are contiguous per order, each order starting at line 1
+    bounds = np.append(np.flatnonzero(order_items["line"].to_numpy() == 1), len(order_items))
+    if not isinstance(orders, pd.DataFrame):
+        import pyarrow as pa
+        from ..utils.arrow_columns import render_text
+        fields = render_text(order_items.select(names))
+        lines = pa.StructArray.from_arrays([fields[c].combine_chunks() for c in names], names=names)
+        items = pa.ListArray.from_arrays(pa.array(bounds, pa.int32()), lines)
+        return orders.add_column(orders.column_names.index("order_date") + 1, "items", items)
+    cols = [order_items[c].tolist() for c in names]
+    lines = [{"sku": sku, "name": name, "unit_price": price, "qty": qty} for sku, name, price, qty in zip(*cols)]
+    items = np.empty(len(orders), dtype=object)
+    items[:] = [lines[bounds[i]:bounds[i + 1]] for i in range(len(orders))]
+    orders = orders.copy()
+    orders.insert(orders.columns.get_loc("order_date") + 1, "items", items)
+    return orders
+
+
+def generate_default(count=100, customers_df=None, seed=None, locale="en_US", now=None, fake=None, rng=None,
+                     arrow=False):
+    orders, order_items = generate_tables(count=count, customers_df=customers_df, seed=seed, locale=locale, now=now,
+                                          fake=fake, rng=rng, arrow=arrow)
+    return nest_items(orders, order_items)
 
 
-def generate_from_schema(schema, count=100, seed=None, locale="en_US"):
-    # For now, reuses generate_default; in future versions, it will map the schema
-    return generate_default(count=count, seed=seed, locale=locale)
\ No newline at end of file
+def generate_from_schema(schema, count=100, seed=None, locale="en_US", now=None, rng=None, offset=0):
+    return compile_schema(schema, locale).generate(count=count, seed=seed, now=now, rng=rng, offset=offset)
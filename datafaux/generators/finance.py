@@ -1,19 +1,20 @@
 import pandas as pd
-from ..utils.faker_helpers import get_faker
-import random
-import uuid
+from ..utils.faker_helpers import get_faker, reference_time, relative_date
 
 
-def generate_default(count=100, seed=None, locale="en_US"):
-    fake = get_faker(locale, seed)
+def generate_default(count=100, seed=None, locale="en_US", now=None, fake=None):
+    fake = fake or get_faker(locale, seed)
+    rnd = fake.random
+    now = now or reference_time(seed)
+    start = relative_date("-2y", now)
     rows = []
     for _ in range(count):
         rows.append({
-            "transaction_id": str(uuid.uuid4()),
-            "account_id": str(uuid.uuid4()),
-            "amount": round(random.uniform(-1000, 10000), 2),
+            "transaction_id": fake.uuid4(),
+            "account_id": fake.uuid4(),
+            "amount": round(rnd.uniform(-1000, 10000), 2),
             "currency": "USD",
             "description": fake.sentence(nb_words=6),
-            "timestamp": fake.date_time_between(start_date='-2y', end_date='now').isoformat()
+            "timestamp": fake.date_time_between(start_date=start, end_date=now).isoformat()
         })
     return pd.DataFrame(rows)
\ No newline at end of file
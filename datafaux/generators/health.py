@@ -1,19 +1,40 @@
+import numpy as np
 import pandas as pd
-from ..utils.faker_helpers import get_faker
-import uuid
-import random
+from faker.providers.date_time import change_year
+from ..utils.faker_helpers import get_faker, reference_time, relative_date
 
+GENDERS = np.array(["M", "F", "O"], dtype=object)
+COLUMNS = ["patient_id", "name", "dob", "gender", "last_visit", "notes"]
 
-def generate_default(count=100, seed=None, locale="en_US"):
-    fake = get_faker(locale, seed)
+
+def generate_default(count=100, seed=None, locale="en_US", now=None, fake=None, arrow=False):
+    """
+    Generates `count` patients. With `arrow`, returns a pyarrow Table with gender as a dictionary
+    column (see `utils.arrow_columns`).
+    """
+    fake = fake or get_faker(locale, seed)
+    rnd = fake.random
+    now = now or reference_time(seed)
+    start = relative_date("-2y", now)
+    # same range as fake.date_of_birth(minimum_age=0, maximum_age=99), but anchored on `now`
+    dob_start, dob_end = change_year(now.date(), -100), now.date()
     rows = []
     for _ in range(count):
         rows.append({
-            "patient_id": str(uuid.uuid4()),
+            "patient_id": fake.uuid4(),
             "name": fake.name(),
-            "dob": fake.date_of_birth(minimum_age=0, maximum_age=99).isoformat(),
-            "gender": random.choice(["M","F","O"]),
-            "last_visit": fake.date_time_between(start_date='-2y', end_date='now').isoformat(),
+            "dob": fake.date_between_dates(date_start=dob_start, date_end=dob_end).isoformat(),
+            # the same draw as rnd.choice(GENDERS), kept as an index into GENDERS
+            "gender": rnd.randrange(len(GENDERS)),
+            "last_visit": fake.date_time_between(start_date=start, end_date=now).isoformat(),
             "notes": fake.sentence(nb_words=8)
         })
-    return pd.DataFrame(rows)
\ No newline at end of file
+    df = pd.DataFrame(rows, columns=COLUMNS)
+    genders = df["gender"].to_numpy(dtype=np.int8)
+    if arrow:
+        import pyarrow as pa
+        from ..utils.arrow_columns import dictionary_array
+        return pa.table({name: dictionary_array(genders, GENDERS) if name == "gender"
+                         else pa.array(df[name].to_numpy(), pa.string()) for name in COLUMNS})
+    df["gender"] = GENDERS[genders]
+    return df
@@ -1,8 +1,9 @@
-from faker import Faker
 import pandas as pd
-import random
-import uuid
-from ..utils.faker_helpers import get_faker
+from ..utils.faker_helpers import get_faker, get_rng, reference_time, relative_date
+from ..utils.columns import (uuid_bytes, format_uuids, int_column, datetime_values, format_datetimes, pool_indices,
+                             pooled_email_column, pooled_phone_column)
+from ..utils.pools import get_pools
+from .compiler import compile_schema
 
 # default fields
 DEFAULT_FIELDS = [
@@ -16,46 +17,72 @@ DEFAULT_FIELDS = [
 ]
 
 
-def generate_default(count=100, seed=None, locale="en_US"):
-    fake = get_faker(locale, seed)
+def generate_default(count=100, seed=None, locale="en_US", now=None, fake=None):
+    fake = fake or get_faker(locale, seed)
+    rnd = fake.random
+    now = now or reference_time(seed)
+    start = relative_date("-3y", now)
     rows = []
     for _ in range(count):
         rows.append({
-            "person_id": str(uuid.uuid4()),
+            "person_id": fake.uuid4(),
             "name": fake.name(),
             "email": fake.safe_email(),
             "phone": fake.phone_number(),
             "address": fake.address().replace("\n", ", "),
-            "age": random.randint(18, 80),
-            "registered_at": fake.date_time_between(start_date='-3y', end_date='now').isoformat()
+            "age": rnd.randint(18, 80),
+            "registered_at": fake.date_time_between(start_date=start, end_date=now).isoformat()
         })
     return pd.DataFrame(rows)
 
 
-def generate_from_schema(schema, count=100, seed=None, locale="en_US"):
-    fake = get_faker(locale, seed)
-    fields = schema.get("fields") or []
-    rows = []
-    for _ in range(count):
-        rec = {}
-        for f in fields:
-            fname = f.get("name")
-            ftype = f.get("type")
-            if ftype in ("name", "full_name"):
-                rec[fname] = fake.name()
-            elif ftype in ("email",):
-                rec[fname] = fake.safe_email()
-            elif ftype in ("address",):
-                rec[fname] = fake.address().replace("\n", ", ")
-            elif ftype in ("phone", "phone_number"):
-                rec[fname] = fake.phone_number()
-            elif ftype == "uuid":
-                rec[fname] = str(uuid.uuid4())
-            elif ftype == "int":
-                rec[fname] = fake.random_int(min=f.get("min", 0), max=f.get("max", 100))
-            elif ftype == "datetime":
-                rec[fname] = fake.date_time_between(start_date=f.get("start", "-3y"), end_date="now").isoformat()
-            else:
-                rec[fname] = fake.word()
-        rows.append(rec)
-    return pd.DataFrame(rows)
+def generate_columns(count, rng, pools, now=None, arrow=False):
+    """
+    Generates the default people columns as whole arrays (one call per column instead of per row).
+    With `arrow`, the same values come back as compact pyarrow arrays (see `utils.arrow_columns`).
+    """
+    person_id = uuid_bytes(rng, count)
+    name = pool_indices(rng, pools["name"], count)
+    email = pooled_email_column(rng, pools, count)
+    phone = pooled_phone_column(rng, pools, count)
+    address = pool_indices(rng, pools["address"], count)
+    age = int_column(rng, count, 18, 80)
+    registered_at = datetime_values(rng, count, start="-3y", end="now", now=now)
+    if arrow:
+        import pyarrow as pa
+        from ..utils.arrow_columns import uuid_array, dictionary_array, int_array, timestamp_array
+        return {
+            "person_id": uuid_array(person_id),
+            "name": dictionary_array(name, pools["name"]),
+            "email": pa.array(email, type=pa.string()),
+            "phone": pa.array(phone, type=pa.string()),
+            "address": dictionary_array(address, pools["address"]),
+            "age": int_array(age, 18, 80),
+            "registered_at": timestamp_array(registered_at),
+        }
+    return {
+        "person_id": format_uuids(person_id),
+        "name": pools["name"][name],
+        "email": email,
+        "phone": phone,
+        "address": pools["address"][address],
+        "age": age,
+        "registered_at": format_datetimes(registered_at),
+    }
+
+
+def generate_columnar(count=100, seed=None, locale="en_US", now=None, rng=None, arrow=False):
+    """
+    Columnar counterpart of `generate_default`: same columns and dtypes, values drawn with NumPy
+    and from precomputed per-locale value pools. With `arrow`, returns a pyarrow Table of compact columns.
+    """
+    rng = rng or get_rng(seed)
+    columns = generate_columns(count, rng, get_pools(locale), now or reference_time(seed), arrow)
+    if arrow:
+        import pyarrow as pa
+        return pa.table(columns)
+    return pd.DataFrame(columns)
+
+
+def generate_from_schema(schema, count=100, seed=None, locale="en_US", now=None, rng=None, offset=0):
+    return compile_schema(schema, locale).generate(count=count, seed=seed, now=now, rng=rng, offset=offset)
@@ -0,0 +1,187 @@
+"""
+Relational (multi-table) schemas: several tables linked by integer foreign keys.
+
+    type: relational
+    tables:
+      - name: customers
+        key: customer_id            # integer primary key 1..n
+        count: 1000                 # root tables only (defaults to --count)
+        fields: [...]               # regular schema fields
+      - name: orders
+        key: order_id
+        parent: {table: customers, per: {distribution: poisson, mean: 3}}
+        fields:
+          - {name: product_id, type: ref, table: products}
+
+A child table gets `per`-parent rows (its foreign key column is named after the parent key, or
+`parent.column`; `per` takes `fixed` or any distribution of `utils.distributions`). `ref` fields
+sample keys uniformly from a root table, or with `distribution: zipf` for a few popular rows.
+Keys are integer sequences, so parents are generated chunk by chunk and only the current chunk's
+keys are held in memory.
+"""
+import json
+import numpy as np
+import pandas as pd
+from ..utils.distributions import DISTRIBUTIONS, distribution_of, index_cdf, sample, sample_indices
+from ..utils.faker_helpers import derive_seed, get_rng, reference_time
+from ..utils.pools import get_pools
+from ..utils.validators import validate_schema
+from .compiler import ColumnGenerator, compile_field
+
+CARDINALITIES = ["fixed"] + DISTRIBUTIONS
+
+
+def draw_counts(rng, spec, n):
+    """
+    Draws the number of child rows for each of `n` parent rows from a `per` spec (any distribution of
+    `utils.distributions`, or `fixed`), rounded and floored at zero.
+    """
+    dist = spec.get("distribution", "uniform")
+    if dist not in CARDINALITIES:
+        raise ValueError(f"Unknown cardinality distribution '{dist}' (use one of {', '.join(CARDINALITIES)}).")
+    if dist == "fixed":
+        return np.full(n, int(spec.get("value", 1)), dtype=np.int64)
+    if dist == "uniform":
+        return rng.integers(int(spec.get("min", 1)), int(spec.get("max", 3)) + 1, size=n)
+    if dist == "choice":
+        spec = dict(spec, values=spec.get("values", [1]))
+    return np.maximum(np.rint(sample(rng, spec, n)), 0).astype(np.int64)
+
+
+class RefColumn(ColumnGenerator):
+    """
+    Foreign key sampled from the integer keys (1..size) of a root table: uniformly, or with
+    `distribution: zipf` (low keys are the most popular).
+    """
+
+    def __init__(self, name, spec):
+        super().__init__(name, spec)
+        self.table = spec.get("table")
+        self.size = 1
+        self.zipf = distribution_of(spec) == "zipf"
+        if not self.zipf and spec.get("distribution", "uniform") != "uniform":
+            raise ValueError(f"Field '{name}': 'ref' fields support 'distribution: zipf' only.")
+        self._cdf = (None, None)
+
+    def generate(self, n, rng, now=None, offset=0):
+        if not self.zipf:
+            return rng.integers(1, self.size + 1, size=n)
+        if self._cdf[0] != self.size:
+            self._cdf = (self.size, index_cdf(self.spec, self.size))
+        return 1 + sample_indices(rng, self._cdf[1], n)
+
+    def generate_arrow(self, n, rng, now=None, offset=0):
+        from ..utils.arrow_columns import int_array
+        return int_array(self.generate(n, rng, now), 1, self.size)
+
+
+class Table:
+    def __init__(self, name, key, count, parent, fk, per, columns):
+        self.name = name
+        self.key = key
+        self.count = count
+        self.parent = parent
+        self.fk = fk
+        self.per = per
+        self.columns = columns
+        self.children = []
+
+
+class RelationalPlan:
+    """
+    A compiled relational schema. `batches` yields (table name, chunk) pairs: each chunk of a root
+    table is followed by the child rows of its parent rows, depth first.
+    """
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.roots = [t for t in tables if t.parent is None]
+
+    def sizes(self, count):
+        return {t.name: t.count or count for t in self.roots}
+
+    def batches(self, count=1000, chunksize=1000, seed=None, now=None, arrow=False):
+        now = now or reference_time(seed)
+        sizes = self.sizes(count)
+        for table in self.tables:
+            for col in table.columns:
+                if isinstance(col, RefColumn):
+                    col.size = sizes[col.table]
+        next_key = {t.name: 1 for t in self.tables}
+        for position, root in enumerate(self.roots):
+            total = sizes[root.name]
+            for index in range(-(-total // chunksize)):
+                take = min(chunksize, total - index * chunksize)
+                rng = get_rng(derive_seed(seed, index, position))
+                yield from self._emit(root, take, None, rng, now, next_key, arrow)
+
+    def _emit(self, table, n, fk_values, rng, now, next_key, arrow):
+        data = {}
+        keys = None
+        offset = next_key[table.name] - 1
+        next_key[table.name] += n
+        if table.key:
+            keys = np.arange(offset + 1, offset + n + 1, dtype=np.int64)
+            data[table.key] = keys
+        if fk_values is not None:
+            data[table.fk] = fk_values
+        for col in table.columns:
+            data[col.name] = col.generate_arrow(n, rng, now, offset) if arrow else col.generate(n, rng, now, offset)
+        if n:
+            if arrow:
+                import pyarrow as pa
+                yield table.name, pa.table(data)
+            else:
+                yield table.name, pd.DataFrame(data, columns=list(data))
+        for child in table.children:
+            counts = draw_counts(rng, child.per, n)
+            yield from self._emit(child, int(counts.sum()), np.repeat(keys, counts), rng, now, next_key, arrow)
+
+
+_plans = {}
+
+
+def compile_relational(schema, locale="en_US"):
+    """
+    Compiles a relational schema into a `RelationalPlan` (cached by schema and locale).
+    Raises ValueError if the schema is invalid.
+    """
+    ok, msg = validate_schema(schema)
+    if not ok:
+        raise ValueError(msg)
+    key = (json.dumps(schema, sort_keys=True, default=str), locale)
+    if key in _plans:
+        return _plans[key]
+    pools = get_pools(locale)
+    tables = {}
+    for spec in schema.get("tables") or []:
+        name = spec["name"]
+        if name in tables:
+            raise ValueError(f"Table '{name}' is defined twice.")
+        parent_spec = spec.get("parent")
+        parent = fk = per = None
+        if parent_spec:
+            parent = tables.get(parent_spec.get("table"))
+            if parent is None:
+                raise ValueError(f"Table '{name}': parent '{parent_spec.get('table')}' must be defined before it.")
+            if not parent.key:
+                raise ValueError(f"Table '{name}': parent '{parent.name}' needs a 'key'.")
+            fk = parent_spec.get("column", parent.key)
+            per = parent_spec.get("per") or {"distribution": "fixed", "value": 1}
+            draw_counts(np.random.default_rng(0), per, 1)
+        columns = []
+        for field in spec.get("fields") or []:
+            if field.get("type") == "ref":
+                target = tables.get(field.get("table"))
+                if target is None or target.parent is not None or not target.key:
+                    raise ValueError(f"Field '{field.get('name')}': 'ref' needs 'table' naming an earlier root "
+                                     f"table with a 'key'.")
+                columns.append(RefColumn(field["name"], field))
+            else:
+                columns.append(compile_field(field, pools))
+        table = Table(name, spec.get("key"), spec.get("count"), parent, fk, per, columns)
+        if parent is not None:
+            parent.children.append(table)
+        tables[name] = table
+    plan = _plans[key] = RelationalPlan(list(tables.values()))
+    return plan
@@ -0,0 +1,124 @@
+"""
+Checkpoint manifests for resumable streaming runs.
+
+Every `CHECKPOINT_BYTES` of output (and at the end), the output is flushed to a block boundary and
+the manifest (`<out>.checkpoint.json`) records how many chunks, rows and bytes are committed, next to
+the seed and reference time of the run (and the state a transform attached to the last chunk as
+`attrs["transform_state"]`, e.g. error-injection statistics). Resuming truncates the output to the
+committed size and restarts generation at the next chunk index; since every chunk is seeded from
+`derive_seed(seed, index)`, the result matches an uninterrupted run. The manifest is deleted once
+the run completes.
+"""
+import json
+import os
+
+MANIFEST_VERSION = 1
+# uncompressed output written between two commits (each commit flushes compressed output to a block boundary)
+CHECKPOINT_BYTES = 64 << 20
+
+
+def manifest_path(out_path):
+    return f"{out_path}.checkpoint.json"
+
+
+class Checkpoint:
+    def __init__(self, path, state):
+        self.path = path
+        self.state = state
+
+    @classmethod
+    def load(cls, path):
+        """
+        Returns the checkpoint stored at `path`, or None if there is none.
+        """
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported checkpoint manifest version in {path}")
+        return cls(path, state)
+
+    @classmethod
+    def create(cls, path, params, seed, now):
+        checkpoint = cls(path, {
+            "version": MANIFEST_VERSION,
+            "params": params,
+            "seed": seed,
+            "now": now.isoformat(),
+            "chunks": 0,
+            "rows": 0,
+            "bytes": 0,
+        })
+        checkpoint.save()
+        return checkpoint
+
+    def mismatches(self, params):
+        """
+        Returns the names of run parameters that differ from the checkpointed run.
+        """
+        saved = self.state["params"]
+        return sorted(k for k in set(saved) | set(params) if saved.get(k) != params.get(k))
+
+    def commit(self, chunks, rows, nbytes, transform_state=None):
+        self.state.update(chunks=self.state["chunks"] + chunks, rows=rows, bytes=nbytes)
+        if transform_state is not None:
+            self.state["transform_state"] = transform_state
+        self.save()
+
+    def finish(self):
+        """
+        Removes the manifest of a completed run.
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def save(self):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.state, f)
+        os.replace(tmp, self.path)
+
+
+class CheckpointedSink:
+    """
+    Wraps a stream sink: once `every` bytes were written since the last commit (every chunk for sinks
+    that don't count bytes), the output is flushed to disk and committed to the checkpoint. Chunks
+    written after the last commit are generated again on resume.
+    """
+
+    def __init__(self, sink, checkpoint, every=CHECKPOINT_BYTES):
+        self.sink = sink
+        self.checkpoint = checkpoint
+        self.every = every
+        self.pending = 0
+        self.transform_state = None
+        self.committed = getattr(sink, "bytes", None)
+
+    @property
+    def rows(self):
+        return self.sink.rows
+
+    def write(self, chunk):
+        self.sink.write(chunk)
+        self.pending += 1
+        attrs = getattr(chunk, "attrs", None) or {}
+        self.transform_state = attrs.get("transform_state", self.transform_state)
+        written = getattr(self.sink, "bytes", None)
+        if written is None or written - self.committed >= self.every:
+            self.commit()
+
+    def commit(self):
+        if self.pending:
+            self.checkpoint.commit(self.pending, self.sink.rows, self.sink.flush(), self.transform_state)
+            self.pending = 0
+            self.committed = getattr(self.sink, "bytes", None)
+
+    def close(self):
+        self.sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
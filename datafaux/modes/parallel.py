@@ -0,0 +1,45 @@
+import inspect
+import pandas as pd
+from itertools import accumulate
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+from ..utils.faker_helpers import derive_seed, reference_time
+
+
+def shard_sizes(count: int, shards: int) -> list:
+    """
+    Splits `count` rows into `shards` contiguous shards (the first ones get the remainder).
+    """
+    base, extra = divmod(count, shards)
+    return [base + (1 if i < extra else 0) for i in range(shards)]
+
+
+def _run_shard(generator_func, kwargs):
+    return generator_func(**kwargs)
+
+
+def generate_parallel(generator_func: Callable, count: int = 100, *, workers: int = 2, seed=None, now=None,
+                      **kwargs) -> pd.DataFrame:
+    """
+    Runs `generator_func(count=..., seed=..., now=..., **kwargs)` over `workers` shards in a process pool
+    and concatenates the results in shard order (tuples of DataFrames are concatenated element-wise).
+
+    Shard seeds are derived from the master `seed` and all shards share one reference time, so the
+    same seed and worker count always give the same output. Generators taking an `offset` get the
+    index of their shard's first row (e.g. for `unique` schema fields). `generator_func` must be
+    importable (module-level) so it can be sent to the worker processes.
+    """
+    workers = max(1, min(workers, count)) if count else 1
+    now = now or reference_time(seed)
+    sizes = shard_sizes(count, workers)
+    jobs = [dict(kwargs, count=size, seed=derive_seed(seed, i), now=now) for i, size in enumerate(sizes)]
+    if "offset" in inspect.signature(generator_func).parameters:
+        for job, offset in zip(jobs, accumulate(sizes[:-1], initial=0)):
+            job["offset"] = offset
+    if workers == 1:
+        return _run_shard(generator_func, jobs[0])
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_run_shard, [generator_func] * workers, jobs))
+    if isinstance(parts[0], tuple):
+        return tuple(pd.concat(tables, ignore_index=True) for tables in zip(*parts))
+    return pd.concat(parts, ignore_index=True)
@@ -0,0 +1,110 @@
+import multiprocessing
+import queue
+import threading
+import traceback
+from collections import deque
+from typing import Callable, Iterable
+from ..utils.faker_helpers import reference_time
+
+_DONE = "__datafaux_done__"
+
+
+class _Failure:
+    def __init__(self, message):
+        self.message = message
+
+
+def write_pipelined(chunks: Iterable, sink, queue_size: int = 4) -> None:
+    """
+    Writes `chunks` to `sink` from a dedicated writer thread, so generation and serialization overlap.
+
+    The queue holds at most `queue_size` chunks: when the writer falls behind, the producer blocks
+    (backpressure), keeping memory bounded. Writer errors are re-raised in the caller.
+    """
+    pending = queue.Queue(maxsize=max(1, queue_size))
+    errors = []
+
+    def writer():
+        while True:
+            chunk = pending.get()
+            if chunk is _DONE:
+                return
+            if errors:
+                continue  # drain so the producer never blocks on a dead writer
+            try:
+                sink.write(chunk)
+            except BaseException as e:
+                errors.append(e)
+
+    thread = threading.Thread(target=writer, name="datafaux-writer", daemon=True)
+    thread.start()
+    try:
+        for chunk in chunks:
+            if errors:
+                break
+            pending.put(chunk)
+    finally:
+        pending.put(_DONE)
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def _produce(generator_func, out, kwargs):
+    try:
+        for chunk in generator_func(**kwargs):
+            out.put(chunk)
+        out.put(_DONE)
+    except BaseException:
+        out.put(_Failure(traceback.format_exc()))
+
+
+def parallel_chunks(generator_func: Callable, *, workers: int = 2, queue_size: int = 4, ordered: bool = True,
+                    **kwargs):
+    """
+    Returns an iterator over the chunks of a streaming generator produced by `workers` processes.
+
+    Worker `w` runs `generator_func(start=start + w, step=workers, **kwargs)`, i.e. chunks start + w,
+    start + w + workers, ... (`start` defaults to 0)
+    (every stream seeds chunk `i` from the master seed, so the result does not depend on which
+    process made it). With `ordered`, chunks are yielded in chunk order by reading the worker queues
+    round-robin; otherwise they are yielded as they arrive. Each worker queue holds at most
+    `queue_size` chunks, so a slow consumer applies backpressure to the producers.
+
+    Processes are started right away (before any writer thread exists).
+    """
+    kwargs.setdefault("now", reference_time(kwargs.get("seed")))
+    ctx = multiprocessing.get_context()
+    if ordered:
+        queues = [ctx.Queue(maxsize=max(1, queue_size)) for _ in range(workers)]
+    else:
+        queues = [ctx.Queue(maxsize=max(1, queue_size) * workers)] * workers
+    start = kwargs.pop("start", 0)
+    procs = [ctx.Process(target=_produce, args=(generator_func, queues[w],
+                                                dict(kwargs, start=start + w, step=workers)),
+                         daemon=True)
+             for w in range(workers)]
+    for p in procs:
+        p.start()
+    return _collect(procs, queues, ordered)
+
+
+def _collect(procs, queues, ordered):
+    # rotation of the workers still producing; in ordered mode the head is the owner of the next chunk
+    rotation = deque(range(len(procs)))
+    try:
+        while rotation:
+            item = queues[rotation[0]].get()
+            if isinstance(item, _Failure):
+                raise RuntimeError(f"Chunk producer failed:\n{item.message}")
+            if isinstance(item, str) and item == _DONE:
+                rotation.popleft()
+                continue
+            yield item
+            if ordered:
+                rotation.rotate(-1)
+    finally:
+        for p in procs:
+            if p.is_alive():
+                p.terminate()
+            p.join()
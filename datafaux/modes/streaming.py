@@ -1,56 +1,257 @@
 import pandas as pd
-from ..utils.faker_helpers import get_faker
-import random
 from typing import Callable
+from ..utils.faker_helpers import derive_seed, get_faker, get_rng, reference_time
 
 
 def generate_stream(generator_func: Callable, out_path: str, *, count: int = 10000, chunksize: int = 1000,
-                    fmt: str = "csv", **kwargs):
+                    fmt: str = "csv", sink_options: dict = None, transform: Callable = None, workers: int = 1,
+                    pipeline: bool = False, queue_size: int = 4, ordered: bool = True, checkpoint: str = None,
+                    resume: bool = False, checkpoint_every: int = None, profiler=None, **kwargs):
     """
     Generates data in streaming mode by calling `generator_func` which must accept (count, chunksize, **kwargs)
-    and be iterable (yield DataFrame chunks).
+    and be iterable (yield DataFrame or pyarrow Table chunks). Chunks are written through `utils.exporters.open_sink`
+    (`sink_options` are passed to the sink, e.g. Parquet compression and row_group_size).
+    `transform`, if given, wraps the chunk iterator and is called as `transform(chunks, start=first_chunk_index,
+    seed=seed)` (e.g. `modes.testers.inject_errors_stream`); resumed runs also pass the checkpointed `state`.
+
+    With `pipeline` (implied by `workers` > 1), a dedicated writer thread consumes chunks from a bounded
+    queue of `queue_size` chunks while generation continues. With `workers` > 1, chunks are produced by
+    worker processes (see `modes.pipeline.parallel_chunks`); `ordered=False` writes them as they arrive.
+
+    With `checkpoint` (a manifest path, CSV/JSON in chunk order only), the output is rewritten from scratch
+    and the manifest is updated every `checkpoint_every` bytes of output (default
+    `modes.checkpoint.CHECKPOINT_BYTES`) and deleted once the run completes; `resume` continues from the
+    manifest instead (see `modes.checkpoint`). Unseeded checkpointed runs draw a random seed so they can
+    be resumed.
+
+    With a `profiler` (see `datafaux.profiling`), generation, `transform` and sink time are recorded
+    as stages, with rows, bytes and time per chunk; it is passed on to in-process generators that
+    accept one (e.g. `schema_stream`).
     """
+    import inspect
     import math
+    from ..utils.exporters import open_sink
+    from .pipeline import parallel_chunks, write_pipelined
     try:
         from tqdm import tqdm
         use_tqdm = True
     except ImportError:
         use_tqdm = False
 
-    total_chunks = math.ceil(count / chunksize)
-    iterator = generator_func(count=count, chunksize=chunksize, **kwargs)
+    start = 0
+    sink_options = dict(sink_options or {})
+    state = None
+    if checkpoint:
+        state, start = _open_checkpoint(checkpoint, resume, out_path, count, chunksize, fmt, workers, ordered,
+                                        generator_func, sink_options, kwargs)
+        if start:
+            # resumed: the output was truncated to the committed bytes; continue after them
+            sink_options["mode"] = "a"
+    total_chunks = math.ceil(count / chunksize) - start
+    sink = open_sink(out_path, fmt, **sink_options)
+    if state is not None:
+        sink.rows = state.state["rows"]
+    if profiler is not None:
+        from ..profiling import ProfiledSink
+        sink = ProfiledSink(sink, profiler)
+    if state is not None:
+        from .checkpoint import CHECKPOINT_BYTES, CheckpointedSink
+        sink = CheckpointedSink(sink, state, CHECKPOINT_BYTES if checkpoint_every is None else checkpoint_every)
+    if workers > 1:
+        iterator = parallel_chunks(generator_func, workers=workers, queue_size=queue_size, ordered=ordered,
+                                   count=count, chunksize=chunksize, start=start, **kwargs)
+    else:
+        if profiler is not None and "profiler" in inspect.signature(generator_func).parameters:
+            # in-process generators that take a profiler also record per-column costs
+            kwargs["profiler"] = profiler
+        iterator = generator_func(count=count, chunksize=chunksize, start=start, **kwargs)
+    if profiler is not None:
+        iterator = profiler.timed(iterator, "generate")
+    if transform is not None:
+        transform_kwargs = {"start": start, "seed": kwargs.get("seed")}
+        if state is not None and state.state.get("transform_state"):
+            transform_kwargs["state"] = state.state["transform_state"]
+        iterator = transform(iterator, **transform_kwargs)
+        if profiler is not None:
+            iterator = profiler.timed(iterator, "error_injection")
     if use_tqdm:
         iterator = tqdm(iterator, total=total_chunks, desc="Generating chunks")
-    first_chunk = True
-    for chunk in iterator:
-        if fmt == "csv":
-            chunk.to_csv(out_path, mode="a", header=first_chunk, index=False, encoding="utf-8")
-        elif fmt == "json":
-            chunk.to_json(out_path, orient="records", lines=True, force_ascii=False, mode="a")
+    with sink:
+        if pipeline or workers > 1:
+            write_pipelined(iterator, sink, queue_size=queue_size)
         else:
-            raise ValueError(f"Streaming not supported for format {fmt}")
-        first_chunk = False
+            for chunk in iterator:
+                sink.write(chunk)
+    if state is not None:
+        state.finish()
 
 
-def people_stream(count=1000000, seed=None, locale="en_US", chunksize=1000):
-    from ..utils.faker_helpers import get_faker
-    fake = get_faker(locale, seed)
-    import uuid
+def _open_checkpoint(path, resume, out_path, count, chunksize, fmt, workers, ordered, generator_func,
+                     sink_options, kwargs):
+    """
+    Loads (with `resume`) or creates the checkpoint of a streaming run; pins seed and `now` in `kwargs`,
+    truncates `out_path` to the committed bytes and returns (checkpoint, first chunk index).
+    """
+    import os
+    import secrets
     from datetime import datetime
+    from .checkpoint import Checkpoint
+    if fmt not in ("csv", "json"):
+        raise ValueError(f"Checkpoints are only supported for csv and json output, not {fmt}")
+    if workers > 1 and not ordered:
+        raise ValueError("Checkpoints need chunks in order (drop ordered=False)")
+    options = {k: v for k, v in dict(kwargs, **sink_options).items()
+               if k not in ("seed", "now") and isinstance(v, (str, int, float, bool, type(None)))}
+    params = {"count": count, "chunksize": chunksize, "fmt": fmt, "generator": generator_func.__name__,
+              "options": options}
+    state = Checkpoint.load(path) if resume else None
+    if state is None:
+        if kwargs.get("seed") is None:
+            kwargs["seed"] = secrets.randbits(63)
+        kwargs["now"] = kwargs.get("now") or reference_time(kwargs["seed"])
+        open(out_path, "wb").close()
+        return Checkpoint.create(path, params, kwargs["seed"], kwargs["now"]), 0
+    mismatched = state.mismatches(params)
+    if mismatched or (kwargs.get("seed") is not None and kwargs["seed"] != state.state["seed"]):
+        raise ValueError(f"Checkpoint {path} was written with different options: {', '.join(mismatched or ['seed'])}")
+    committed = state.state["bytes"]
+    if not os.path.exists(out_path) or os.path.getsize(out_path) < committed:
+        raise ValueError(f"{out_path} is shorter than its checkpoint ({committed} bytes); can't resume")
+    os.truncate(out_path, committed)
+    kwargs["seed"] = state.state["seed"]
+    kwargs["now"] = datetime.fromisoformat(state.state["now"])
+    return state, state.state["chunks"]
+
 
-    produced = 0
-    while produced < count:
-        batch = []
-        take = min(chunksize, count - produced)
-        for _ in range(take):
-            batch.append({
-                "person_id": str(uuid.uuid4()),
-                "name": fake.name(),
-                "email": fake.safe_email(),
-                "phone": fake.phone_number(),
-                "address": fake.address().replace("\n", ", "),
-                "age": random.randint(18, 80),
-                "registered_at": fake.date_time_between(start_date='-3y', end_date='now').isoformat()
-            })
-        produced += take
-        yield pd.DataFrame(batch)
+def chunk_sizes(count, chunksize, start=0, step=1):
+    """
+    Yields (chunk_index, rows) pairs covering `count` rows in chunks of at most `chunksize`; a 0-row
+    run is one empty chunk, so the sink still learns the columns (CSV header, Parquet schema).
+    `start` and `step` select a subset of the chunks (e.g. one worker's share, or a resume point).
+    """
+    for index in range(start, max(1, -(-count // chunksize)), step):
+        yield index, min(chunksize, count - index * chunksize)
+
+
+def faker_stream(generate_func, count=1000000, seed=None, locale="en_US", chunksize=1000, now=None, start=0, step=1,
+                 fake=None, **kwargs):
+    """
+    Streams a row-based preset generator chunk by chunk, reusing a single Faker instance (`fake`, or a new
+    one for `locale`). Each chunk is seeded with `derive_seed(seed, chunk_index)`, so any chunk can be
+    regenerated on its own.
+    """
+    fake = fake or get_faker(locale)
+    now = now or reference_time(seed)
+    for index, take in chunk_sizes(count, chunksize, start, step):
+        chunk_seed = derive_seed(seed, index)
+        if chunk_seed is not None:
+            fake.seed_instance(chunk_seed)
+        yield generate_func(count=take, locale=locale, now=now, fake=fake, **kwargs)
+
+
+def people_stream(count=1000000, seed=None, locale="en_US", chunksize=1000, engine="faker", now=None, start=0, step=1,
+                  arrow=False, fake=None):
+    if engine == "columnar":
+        yield from people_columnar_stream(count=count, seed=seed, locale=locale, chunksize=chunksize, now=now,
+                                          start=start, step=step, arrow=arrow)
+        return
+    from ..generators.people import generate_default
+    yield from faker_stream(generate_default, count=count, seed=seed, locale=locale, chunksize=chunksize, now=now,
+                            start=start, step=step, fake=fake)
+
+
+def people_columnar_stream(count=1000000, seed=None, locale="en_US", chunksize=1000, now=None, start=0, step=1,
+                           arrow=False):
+    """
+    Streams the columnar people generator. With `arrow`, chunks are pyarrow Tables of compact columns
+    built straight from the column arrays, skipping the DataFrame.
+    """
+    from ..generators.people import generate_columns
+    from ..utils.pools import get_pools
+    if arrow:
+        from pyarrow import table as make_chunk
+    else:
+        make_chunk = pd.DataFrame
+    pools = get_pools(locale)
+    now = now or reference_time(seed)
+    for index, take in chunk_sizes(count, chunksize, start, step):
+        yield make_chunk(generate_columns(take, get_rng(derive_seed(seed, index)), pools, now, arrow))
+
+
+def stream_customers(count, seed=None, locale="en_US"):
+    """
+    Generates the customer pool an ecommerce stream of `count` orders draws from.
+    """
+    from ..config import CUSTOMER_POOL_MAX
+    from ..generators.ecommerce import generate_customers
+    return generate_customers(min(max(1, count // 3), CUSTOMER_POOL_MAX), seed=seed, locale=locale)
+
+
+def ecommerce_stream(count=1000000, seed=None, locale="en_US", chunksize=1000, now=None, customers_df=None,
+                     start=0, step=1, fake=None, arrow=False):
+    """
+    Streams orders; customers are generated once (or taken from `customers_df`) and shared by all chunks.
+    With `arrow`, chunks are pyarrow Tables of compact columns.
+    """
+    from ..generators.ecommerce import generate_default
+    if customers_df is None:
+        customers_df = stream_customers(count, seed=seed, locale=locale)
+    yield from faker_stream(generate_default, count=count, seed=seed, locale=locale, chunksize=chunksize, now=now,
+                            start=start, step=step, fake=fake, customers_df=customers_df, arrow=arrow)
+
+
+def finance_stream(count=1000000, seed=None, locale="en_US", chunksize=1000, now=None, start=0, step=1, fake=None):
+    from ..generators.finance import generate_default
+    yield from faker_stream(generate_default, count=count, seed=seed, locale=locale, chunksize=chunksize, now=now,
+                            start=start, step=step, fake=fake)
+
+
+def health_stream(count=1000000, seed=None, locale="en_US", chunksize=1000, now=None, start=0, step=1, fake=None,
+                  arrow=False):
+    from ..generators.health import generate_default
+    yield from faker_stream(generate_default, count=count, seed=seed, locale=locale, chunksize=chunksize, now=now,
+                            start=start, step=step, fake=fake, arrow=arrow)
+
+
+def schema_stream(count=1000000, plan=None, seed=None, chunksize=1000, now=None, start=0, step=1, arrow=False,
+                  profiler=None):
+    """
+    Streams chunks from a compiled schema plan (see generators.compiler.compile_schema).
+    """
+    yield from plan.batches(count=count, chunksize=chunksize, seed=seed, now=now, start=start, step=step,
+                            arrow=arrow, profiler=profiler)
+
+
+STREAMS = {
+    "people": people_stream,
+    "ecommerce": ecommerce_stream,
+    "finance": finance_stream,
+    "health": health_stream,
+}
+
+
+def generate_relational(plan, out_dir, *, count=1000, chunksize=1000, fmt="csv", sink_options=None, seed=None,
+                        now=None, arrow=False):
+    """
+    Streams a compiled relational plan (see generators.relational) into one file per table in `out_dir`
+    (`<table>.<fmt>`, plus the compression suffix if any). Returns {table: rows written}.
+    """
+    import os
+    from ..utils.compression import SUFFIXES
+    from ..utils.exporters import open_sink
+    sink_options = dict(sink_options or {})
+    suffix = ""
+    if fmt in ("csv", "json"):
+        sink_options["mode"] = "w"
+        suffix = SUFFIXES.get(sink_options.get("compression"), "")
+    os.makedirs(out_dir, exist_ok=True)
+    sinks = {}
+    try:
+        for table in plan.tables:
+            sinks[table.name] = open_sink(os.path.join(out_dir, f"{table.name}.{fmt}{suffix}"), fmt, **sink_options)
+        for name, chunk in plan.batches(count=count, chunksize=chunksize, seed=seed, now=now, arrow=arrow):
+            sinks[name].write(chunk)
+    finally:
+        for sink in sinks.values():
+            sink.close()
+    return {name: sink.rows for name, sink in sinks.items()}
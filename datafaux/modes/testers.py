@@ -1,8 +1,79 @@
-import random
+import numpy as np
 import pandas as pd
+from ..utils.faker_helpers import derive_seed, get_rng
 
+ERROR_KINDS = ["empty", "wrong_type", "outlier"]
+EMPTY, WRONG_TYPE, OUTLIER = range(len(ERROR_KINDS))
+# spawn key used to keep error-injection randomness independent from chunk generation seeds
+ERRORS_STREAM = 1
 
-def inject_errors(df: pd.DataFrame, error_rate: float = 0.05) -> pd.DataFrame:
+
+class ErrorInjector:
+    """
+    Mask-based error injector: all target cells of a chunk are drawn at once (without repetition) and each
+    column is rewritten with a single bulk assignment. Per-column statistics (max of numeric columns, used for outliers) are
+    cached and updated across chunks, so the same injector can be applied chunk by chunk.
+    """
+
+    def __init__(self, error_rate: float = 0.05, seed=None, rng=None):
+        self.error_rate = error_rate
+        self.rng = rng or get_rng(seed)
+        self.stats = {}
+
+    def outlier_value(self, col, series):
+        current = series.max() if len(series) else np.nan
+        if pd.notna(current):
+            cached = self.stats.get(col)
+            self.stats[col] = current if cached is None else max(cached, current)
+        if self.stats.get(col) is None:
+            return 999999
+        return self.stats[col] * 1000
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        if df.empty:
+            return df
+
+        total_cells = len(df) * len(df.columns)
+        n_errors = max(1, int(total_cells * self.error_rate))
+        # distinct cells, so exactly n_errors cells end up modified
+        cells = self.rng.choice(total_cells, size=min(n_errors, total_cells), replace=False)
+        rows, cols = np.divmod(cells, len(df.columns))
+        kinds = self.rng.integers(len(ERROR_KINDS), size=len(cells))
+
+        for col_pos in np.unique(cols):
+            col = df.columns[col_pos]
+            hit = cols == col_pos
+            col_rows, col_kinds = rows[hit], kinds[hit]
+            try:
+                df[col] = self._inject_column(col, df[col], col_rows, col_kinds)
+            except Exception:
+                values = df[col].to_numpy(dtype=object, copy=True)
+                values[col_rows] = None
+                df[col] = values
+        return df
+
+    def _inject_column(self, col, series, rows, kinds):
+        numeric = pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+        if numeric:
+            outlier = self.outlier_value(col, series)
+            if not (kinds == WRONG_TYPE).any():
+                # keep numeric columns numeric when only empties/outliers land in them
+                values = series.to_numpy(dtype=np.float64, copy=True)
+                values[rows[kinds == EMPTY]] = np.nan
+                values[rows[kinds == OUTLIER]] = outlier
+                if pd.api.types.is_integer_dtype(series) and not (kinds == EMPTY).any():
+                    return values.astype(series.dtype)
+                return values
+        else:
+            outlier = "OUTLIER_VALUE"
+        values = series.to_numpy(dtype=object, copy=True)
+        values[rows[kinds == EMPTY]] = None
+        values[rows[kinds == WRONG_TYPE]] = "WRONG_TYPE_INJECTED"
+        values[rows[kinds == OUTLIER]] = outlier
+        return values
+
+
+def inject_errors(df: pd.DataFrame, error_rate: float = 0.05, seed=None, rng=None) -> pd.DataFrame:
     """
     Injects random errors into the DataFrame for testing purposes.
 
@@ -10,32 +81,27 @@ def inject_errors(df: pd.DataFrame, error_rate: float = 0.05) -> pd.DataFrame:
       - empty: None
       - wrong_type: unexpected structure
       - outlier: out-of-range value for numeric types
+
+    Randomness comes from `rng` (a NumPy Generator) or a new one seeded with `seed`.
     """
-    if df.empty:
-        return df
+    return ErrorInjector(error_rate, seed=seed, rng=rng).apply(df)
 
-    # Select indices to modify
-    total_cells = len(df) * len(df.columns)
-    n_errors = max(1, int(total_cells * error_rate))
-
-    for _ in range(n_errors):
-        idx = random.choice(df.index.tolist())
-        col = random.choice(df.columns.tolist())
-        kind = random.choice(["empty", "wrong_type", "outlier"])
-        if kind == "empty":
-            df.at[idx, col] = None
-        elif kind == "wrong_type":
-            df.at[idx, col] = "WRONG_TYPE_INJECTED"
-        elif kind == "outlier":
-            try:
-                if pd.api.types.is_numeric_dtype(df[col]):
-                    current = df[col].dropna()
-                    if not current.empty:
-                        df.at[idx, col] = current.max() * 1000
-                    else:
-                        df.at[idx, col] = 999999
-                else:
-                    df.at[idx, col] = "OUTLIER_VALUE"
-            except Exception:
-                df.at[idx, col] = None
-    return df
\ No newline at end of file
+
+def inject_errors_stream(chunks, error_rate: float = 0.05, seed=None, start: int = 0, state: dict = None):
+    """
+    Applies error injection chunk by chunk (e.g. to a streaming generator), sharing cached column
+    statistics across chunks. Chunk `i` draws its errors from `derive_seed(seed, i, ERRORS_STREAM)`;
+    the first chunk of `chunks` has index `start`.
+
+    After each chunk, the statistics are snapshotted into `chunk.attrs["transform_state"]` so that a
+    checkpoint can store them; passing that snapshot back as `state` resumes with the same outliers.
+    """
+    injector = ErrorInjector(error_rate)
+    if state:
+        injector.stats.update(state.get("stats", {}))
+    for index, chunk in enumerate(chunks, start):
+        injector.rng = get_rng(derive_seed(seed, index, ERRORS_STREAM))
+        chunk = injector.apply(chunk)
+        chunk.attrs["transform_state"] = {
+            "stats": {str(k): v.item() if hasattr(v, "item") else v for k, v in injector.stats.items()}}
+        yield chunk
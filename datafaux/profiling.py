@@ -0,0 +1,228 @@
+"""
+`generate --profile`: wall time and peak memory per stage, per-column generation cost for compiled
+schemas, and per-chunk throughput in streaming mode, as a console summary and a JSON report.
+
+Memory is the process RSS, sampled every few milliseconds on a background thread (it covers NumPy
+and Arrow buffers, which `tracemalloc` would miss). Per-column costs are only collected in-process,
+i.e. not for chunks made by `--workers` processes.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from . import __version__
+
+SAMPLE_INTERVAL = 0.005
+
+
+def current_rss_mb():
+    """
+    Current resident set size in MB (peak RSS so far where /proc is not available).
+    """
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        from .bench import peak_rss_mb
+        return peak_rss_mb()
+
+
+class Profiler:
+    """
+    Collects stage timings (`mark` or `add`), per-column costs (`column`) and per-chunk throughput
+    (`chunk`); `report()` returns them as a JSON-serializable dict. Call `close()` when done.
+    """
+
+    def __init__(self, options=None):
+        self.options = dict(options or {})
+        self.started = time.perf_counter()
+        self.stages = {}
+        self.columns = {}
+        self.chunks = []
+        self._nested = 0.0
+        self._current = None
+        self.peak = self.window = current_rss_mb()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, name="datafaux-profiler", daemon=True)
+        self._sampler.start()
+
+    def _sample(self):
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            rss = current_rss_mb()
+            self.window = max(self.window, rss)
+            self.peak = max(self.peak, rss)
+
+    def _entry(self, name):
+        return self.stages.setdefault(name, {"stage": name, "seconds": 0.0, "calls": 0})
+
+    def mark(self, name=None):
+        """
+        Ends the current stage (if any) and starts stage `name`: the CLI marks each stage as it
+        begins. The peak RSS reached during each stage is recorded with its time.
+        """
+        now = time.perf_counter()
+        rss = current_rss_mb()
+        if self._current is not None:
+            current, start, before = self._current
+            peak = max(self.window, rss)
+            entry = self._entry(current)
+            entry["seconds"] += now - start
+            entry["calls"] += 1
+            entry["peak_rss_mb"] = round(max(entry.get("peak_rss_mb", 0.0), peak), 1)
+            entry["rss_growth_mb"] = round(max(entry.get("rss_growth_mb", 0.0), peak - before), 1)
+        self.window = rss
+        self._current = (name, now, rss) if name is not None else None
+
+    def add(self, name, seconds):
+        """
+        Adds `seconds` to stage `name` (for stages measured piecewise, e.g. per chunk).
+        """
+        entry = self._entry(name)
+        entry["seconds"] += seconds
+        entry["calls"] += 1
+
+    def column(self, name, seconds, rows):
+        entry = self.columns.setdefault(name, {"column": name, "seconds": 0.0, "rows": 0})
+        entry["seconds"] += seconds
+        entry["rows"] += rows
+
+    def chunk(self, rows, nbytes, seconds):
+        self.chunks.append({"index": len(self.chunks), "rows": rows, "bytes": nbytes, "seconds": seconds})
+
+    def timed(self, iterator, name):
+        """
+        Wraps a chunk iterator, adding the time spent producing each chunk to stage `name`. Time spent
+        in an inner `timed` iterator (e.g. generation under error injection) is not counted twice.
+        """
+        iterator = iter(iterator)
+        while True:
+            nested = self._nested
+            start = time.perf_counter()
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                elapsed = time.perf_counter() - start
+                self.add(name, elapsed - (self._nested - nested))
+                self._nested = nested + elapsed
+            yield chunk
+
+    def close(self):
+        self.mark()
+        self._stop.set()
+        self._sampler.join()
+
+    def report(self):
+        total = time.perf_counter() - self.started
+        stages, breakdown = [], []
+        for s in self.stages.values():
+            # marked stages cover the run end to end; `add`ed ones break a stage down (no RSS of their own)
+            (stages if "peak_rss_mb" in s else breakdown).append(
+                dict(s, seconds=round(s["seconds"], 6), share=round(s["seconds"] / total, 4) if total else 0.0))
+        column_time = sum(c["seconds"] for c in self.columns.values())
+        columns = [{"column": c["column"], "seconds": round(c["seconds"], 6), "rows": c["rows"],
+                    "rows_per_sec": round(c["rows"] / c["seconds"], 1) if c["seconds"] else None,
+                    "share": round(c["seconds"] / column_time, 4) if column_time else 0.0}
+                   for c in sorted(self.columns.values(), key=lambda c: -c["seconds"])]
+        chunks = [dict(c, seconds=round(c["seconds"], 6),
+                       rows_per_sec=round(c["rows"] / c["seconds"], 1) if c["seconds"] else None,
+                       bytes_per_sec=round(c["bytes"] / c["seconds"], 1) if c["seconds"] and c["bytes"] is not None
+                       else None)
+                  for c in self.chunks]
+        rows = sum(c["rows"] for c in self.chunks)
+        nbytes = sum(c["bytes"] or 0 for c in self.chunks) if self.chunks else None
+        chunk_time = sum(c["seconds"] for c in self.chunks)
+        return {
+            "version": __version__,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "options": self.options,
+            "total_seconds": round(total, 6),
+            "peak_rss_mb": round(self.peak, 1),
+            "stages": stages,
+            "breakdown": breakdown,
+            "columns": columns,
+            "chunks": chunks,
+            "throughput": {
+                "rows": rows,
+                "bytes": nbytes,
+                "rows_per_sec": round(rows / chunk_time, 1) if chunk_time else None,
+                "bytes_per_sec": round(nbytes / chunk_time, 1) if chunk_time and nbytes is not None else None,
+            } if self.chunks else None,
+        }
+
+    def save(self, path, report=None):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report or self.report(), f, indent=2)
+
+
+class ProfiledSink:
+    """
+    Wraps a stream sink: records each chunk's rows, serialized bytes and time since the previous
+    chunk was written (generation + export), and the time spent writing as the "export" stage.
+    """
+
+    def __init__(self, sink, profiler):
+        self.sink = sink
+        self.profiler = profiler
+        self.last = time.perf_counter()
+
+    @property
+    def rows(self):
+        return self.sink.rows
+
+    @property
+    def bytes(self):
+        return getattr(self.sink, "bytes", None)
+
+    def write(self, chunk):
+        before = getattr(self.sink, "bytes", None)
+        start = time.perf_counter()
+        self.sink.write(chunk)
+        end = time.perf_counter()
+        after = getattr(self.sink, "bytes", None)
+        self.profiler.add("export", end - start)
+        self.profiler.chunk(len(chunk), after - before if after is not None else None, end - self.last)
+        self.last = end
+
+    def flush(self):
+        return self.sink.flush()
+
+    def close(self):
+        start = time.perf_counter()
+        self.sink.close()
+        self.profiler.add("export", time.perf_counter() - start)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def format_report(report):
+    """
+    Renders a report as console lines: stages (then their breakdown, indented), slowest columns
+    and streaming throughput.
+    """
+    lines = [f"{'stage':<24} {'seconds':>10} {'share':>7} {'peak RSS':>10}"]
+    for s in report["stages"]:
+        lines.append(f"{s['stage']:<24} {s['seconds']:>10.3f} {s['share']:>7.1%} {s['peak_rss_mb']:>7.1f} MB")
+    for s in report["breakdown"]:
+        lines.append(f"{'  ' + s['stage']:<24} {s['seconds']:>10.3f} {s['share']:>7.1%}")
+    lines.append(f"{'total':<24} {report['total_seconds']:>10.3f} {'':>7} {report['peak_rss_mb']:>7.1f} MB")
+    if report["columns"]:
+        lines.append("")
+        lines.append(f"{'column':<24} {'seconds':>10} {'share':>7} {'rows/s':>14}")
+        for c in report["columns"]:
+            rate = f"{c['rows_per_sec']:,.0f}" if c["rows_per_sec"] else "-"
+            lines.append(f"{c['column']:<24} {c['seconds']:>10.3f} {c['share']:>7.1%} {rate:>14}")
+    t = report["throughput"]
+    if t:
+        lines.append("")
+        mb = f", {t['bytes_per_sec'] / 1e6:,.1f} MB/s" if t["bytes_per_sec"] else ""
+        lines.append(f"{len(report['chunks'])} chunks: {t['rows_per_sec'] or 0:,.0f} rows/s{mb}")
+    return lines
@@ -0,0 +1,347 @@
+"""
+`datafaux serve`: a local generation server that keeps generator state warm between requests.
+
+Faker instances, value pools and compiled schemas are built once per worker and reused, so a small
+fixture costs milliseconds instead of a CLI start. Requests are plain HTTP over TCP or a Unix socket;
+rows are streamed back as NDJSON or CSV in a chunked response, chunk by chunk as the workers make them:
+
+    GET  /health
+    GET  /generate?preset=people&engine=columnar&count=500&seed=42&format=csv
+    GET  /generate?schema=orders&count=500        (a schema loaded with --schema orders.yaml)
+    POST /generate?count=500                       (body: a YAML or JSON schema)
+
+The body matches `datafaux generate --mode streaming` with the same seed and chunk size. Unseeded
+requests get a random seed, returned in the `X-DataFaux-Seed` header.
+"""
+import asyncio
+import json
+import os
+import signal
+from collections import deque
+from functools import lru_cache
+from urllib.parse import parse_qs, urlsplit
+from .config import CHUNKSIZE_DEFAULT, DEFAULT_LOCALE, DEFAULT_ROWS, ENGINES, PRESETS
+
+CONTENT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+FORMAT_ALIASES = {"json": "ndjson", "jsonl": "ndjson"}
+MAX_BODY = 1 << 20
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large"}
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+@lru_cache(maxsize=None)
+def _faker(locale):
+    from .utils.faker_helpers import get_faker
+    return get_faker(locale)
+
+
+@lru_cache(maxsize=8)
+def _customers(count, seed, locale):
+    from .modes.streaming import stream_customers
+    return stream_customers(count, seed=seed, locale=locale)
+
+
+def warm(locale=DEFAULT_LOCALE):
+    """
+    Loads the value pools and a Faker instance for `locale` (run by every worker at startup).
+    """
+    from .utils.pools import get_pools
+    from .utils import serializers  # noqa: F401 (imports pyarrow)
+    get_pools(locale)
+    _faker(locale)
+
+
+def render_chunk(job):
+    """
+    Generates chunk `job["index"]` of a request and returns it serialized. Runs in the worker pool;
+    Faker instances, customer pools and compiled schemas stay cached in the worker.
+    """
+    from .modes import streaming
+    from .utils.serializers import csv_bytes, ndjson_bytes
+    options = dict(count=job["count"], chunksize=job["chunksize"], seed=job["seed"], now=job["now"],
+                   start=job["index"], step=job["chunks"])
+    locale = job["locale"]
+    if job["schema"] is not None:
+        from .generators.compiler import compile_schema
+        chunks = streaming.schema_stream(plan=compile_schema(job["schema"], locale), arrow=True, **options)
+    elif job["preset"] == "people" and job["engine"] == "columnar":
+        chunks = streaming.people_stream(locale=locale, engine="columnar", arrow=True, **options)
+    else:
+        if job["preset"] == "ecommerce":
+            options["customers_df"] = _customers(job["count"], job["seed"], locale)
+        chunks = streaming.STREAMS[job["preset"]](locale=locale, fake=_faker(locale), **options)
+    chunk = next(chunks)
+    return csv_bytes(chunk, header=job["index"] == 0) if job["format"] == "csv" else ndjson_bytes(chunk)
+
+
+async def read_request(reader):
+    """
+    Reads one HTTP request; returns (method, target, version, headers, body), or None at end of stream.
+    """
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        raise RequestError(400, "Malformed request line.")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise RequestError(400, "Invalid Content-Length.")
+    if length > MAX_BODY:
+        raise RequestError(413, f"Request body over {MAX_BODY} bytes.")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, version.upper(), headers, body
+
+
+def check_schema(schema, locale=DEFAULT_LOCALE):
+    """
+    Compiles `schema` (warming the plan cache); raises ValueError if it can't be served.
+    """
+    from .generators.compiler import compile_schema
+    if not isinstance(schema, dict):
+        raise ValueError("The schema must be a YAML/JSON mapping with 'fields'.")
+    if schema.get("type") == "relational":
+        raise ValueError("Relational schemas write several tables; use 'datafaux generate' for them.")
+    compile_schema(schema, locale)
+
+
+def _int_arg(query, name, default, minimum=None):
+    values = query.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[-1])
+    except ValueError:
+        raise RequestError(400, f"'{name}' must be an integer.")
+    if minimum is not None and value < minimum:
+        raise RequestError(400, f"'{name}' must be >= {minimum}.")
+    return value
+
+
+class GenerationServer:
+    """
+    Asyncio HTTP server generating data on request. Chunks are made on a pool of `workers` processes
+    (a single thread when `workers` is 1), each keeping its own warm state. At most 2 * `workers`
+    chunks of a response are in flight, so a slow client applies backpressure.
+    `schemas` maps names to schema documents that requests select with `?schema=<name>`.
+    """
+
+    def __init__(self, workers=1, locale=DEFAULT_LOCALE, chunksize=CHUNKSIZE_DEFAULT, schemas=None, log=None):
+        self.workers = workers
+        self.locale = locale
+        self.chunksize = chunksize
+        self.schemas = dict(schemas or {})
+        self.log = log or (lambda message: None)
+        self.pool = None
+
+    def _start_pool(self):
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        for name, schema in self.schemas.items():
+            try:
+                check_schema(schema, self.locale)
+            except ValueError as e:
+                raise ValueError(f"Schema '{name}': {e}")
+        if self.workers > 1:
+            self.pool = ProcessPoolExecutor(self.workers, initializer=warm, initargs=(self.locale,))
+        else:
+            self.pool = ThreadPoolExecutor(1, initializer=warm, initargs=(self.locale,))
+
+    async def start(self, host="127.0.0.1", port=8765, socket_path=None):
+        """
+        Starts the worker pool and listens on `host`:`port` (or the Unix socket `socket_path`).
+        Returns the `asyncio.Server`.
+        """
+        self._start_pool()
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            return await asyncio.start_unix_server(self.handle, path=socket_path)
+        return await asyncio.start_server(self.handle, host, port)
+
+    def serve_forever(self, host="127.0.0.1", port=8765, socket_path=None, ready=None):
+        """
+        Runs the server until interrupted (Ctrl+C or SIGTERM); `ready(address)` is called once it is listening.
+        """
+        async def run():
+            listener = await self.start(host, port, socket_path)
+            try:
+                asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+            except NotImplementedError:  # no signal handlers on Windows event loops
+                pass
+            if ready:
+                ready(socket_path or "http://%s:%s" % listener.sockets[0].getsockname()[:2])
+            async with listener:
+                try:
+                    await listener.serve_forever()
+                except asyncio.CancelledError:
+                    pass
+
+        try:
+            asyncio.run(run())
+        finally:
+            self.close()
+            if socket_path and os.path.exists(socket_path):
+                os.remove(socket_path)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except RequestError as e:
+                    await self._send_error(writer, e, keep_alive=False)
+                    break
+                if request is None or not await self.respond(*request, writer):
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, method, target, version, headers, body, writer):
+        """
+        Answers one request; returns whether the connection can be kept open.
+        """
+        url = urlsplit(target)
+        keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        try:
+            if url.path == "/health":
+                if method != "GET":
+                    raise RequestError(405, "Use GET /health.")
+                payload = {"status": "ok", "workers": self.workers, "schemas": sorted(self.schemas)}
+                await self._send(writer, 200, json.dumps(payload).encode(), "application/json", keep_alive)
+                return keep_alive
+            if url.path != "/generate":
+                raise RequestError(404, f"No route for {url.path} (use /generate or /health).")
+            job = self.parse_job(method, parse_qs(url.query), body)
+        except RequestError as e:
+            self.log(f"{method} {target} {e.status} {e}")
+            await self._send_error(writer, e, keep_alive)
+            return keep_alive
+        return await self._stream(writer, job, keep_alive, chunked=version == "HTTP/1.1", request=f"{method} {target}")
+
+    def parse_job(self, method, query, body):
+        """
+        Validates the query (and schema body) of a /generate request; returns the job for `render_chunk`.
+        """
+        import secrets
+        from .utils.faker_helpers import reference_time
+
+        def arg(name, default=None):
+            values = query.get(name)
+            return values[-1] if values else default
+
+        fmt = arg("format", "ndjson").lower()
+        fmt = FORMAT_ALIASES.get(fmt, fmt)
+        if fmt not in CONTENT_TYPES:
+            raise RequestError(400, f"Unsupported format '{fmt}' (use ndjson or csv).")
+        engine = arg("engine", "faker")
+        if engine not in ENGINES:
+            raise RequestError(400, f"Unknown engine '{engine}' (use one of {', '.join(ENGINES)}).")
+        job = {
+            "preset": None,
+            "schema": None,
+            "engine": engine,
+            "format": fmt,
+            "locale": arg("locale", self.locale),
+            "count": _int_arg(query, "count", DEFAULT_ROWS, minimum=0),
+            "chunksize": _int_arg(query, "chunksize", self.chunksize, minimum=1),
+            "seed": _int_arg(query, "seed", None),
+        }
+        if method == "POST":
+            job["schema"] = self._load_schema(body)
+        elif method != "GET":
+            raise RequestError(405, "Use GET, or POST with a schema body.")
+        elif arg("schema"):
+            if arg("schema") not in self.schemas:
+                raise RequestError(404, f"Unknown schema '{arg('schema')}' (loaded: {', '.join(self.schemas) or 'none'}).")
+            job["schema"] = self.schemas[arg("schema")]
+        elif arg("preset") in PRESETS:
+            job["preset"] = arg("preset")
+        else:
+            raise RequestError(400, f"Pass ?preset= (one of {', '.join(PRESETS)}), ?schema=<name> or POST a schema.")
+        if job["schema"] is not None:
+            from .generators.compiler import compile_schema
+            try:
+                compile_schema(job["schema"], job["locale"]).check_rows(job["count"])
+            except ValueError as e:
+                raise RequestError(400, str(e))
+        job["now"] = reference_time(job["seed"])
+        if job["seed"] is None:
+            job["seed"] = secrets.randbits(63)
+        return job
+
+    def _load_schema(self, body):
+        import yaml
+        try:
+            schema = yaml.safe_load(body.decode("utf-8"))
+        except (UnicodeDecodeError, yaml.YAMLError) as e:
+            raise RequestError(400, f"Could not parse the schema: {e}")
+        try:
+            check_schema(schema, self.locale)
+        except ValueError as e:
+            raise RequestError(400, f"Invalid schema: {e}")
+        return schema
+
+    async def _send(self, writer, status, body, content_type, keep_alive):
+        head = (f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def _send_error(self, writer, error, keep_alive):
+        await self._send(writer, error.status, json.dumps({"error": str(error)}).encode(), "application/json",
+                         keep_alive)
+
+    async def _stream(self, writer, job, keep_alive, chunked, request):
+        loop = asyncio.get_running_loop()
+        total = -(-job["count"] // job["chunksize"])
+        keep_alive = keep_alive and chunked
+        head = (f"HTTP/1.1 200 OK\r\nContent-Type: {CONTENT_TYPES[job['format']]}\r\n"
+                f"X-DataFaux-Seed: {job['seed']}\r\nX-DataFaux-Rows: {job['count']}\r\n"
+                + ("Transfer-Encoding: chunked\r\n" if chunked else "")
+                + f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1"))
+        pending = deque()
+        index = 0
+        try:
+            while index < total or pending:
+                while index < total and len(pending) < 2 * self.workers:
+                    pending.append(loop.run_in_executor(self.pool, render_chunk, dict(job, index=index, chunks=total)))
+                    index += 1
+                data = await pending.popleft()
+                if data:
+                    writer.write(b"%x\r\n%s\r\n" % (len(data), data) if chunked else data)
+                    await writer.drain()
+            if chunked:
+                writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        except Exception as e:
+            # the status line is already sent: drop the connection so the client sees a truncated body
+            for future in pending:
+                future.cancel()
+            if not isinstance(e, ConnectionError):
+                self.log(f"{request} failed: {e!r}")
+            return False
+        self.log(f"{request} 200 {job['count']} rows")
+        return keep_alive
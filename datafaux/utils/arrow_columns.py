@@ -0,0 +1,85 @@
+"""
+Compact Arrow columns for generated chunks.
+
+The columnar generators can build their chunks as pyarrow arrays in compact types: UUIDs as 16-byte
+`arrow.uuid` values (pyarrow 18+), datetimes as `timestamp[s]`, pooled/enum values as dictionary arrays over the
+pool, and bounded integers in the narrowest integer type. Text is only produced at the output
+boundary: `render_text` turns such a table back into the string columns the DataFrame generators
+return (and the CSV/JSON writers expect).
+"""
+import numpy as np
+from .columns import format_uuids, narrow_int_dtype
+
+# pool arrays -> their Arrow dictionaries, built once per pool (the pool is kept alive with the entry)
+_dictionaries = {}
+
+
+def uuid_array(raw):
+    """
+    Wraps an (n, 16) uint8 array of UUIDs as an `arrow.uuid` extension array (no copy of the bytes).
+    """
+    import pyarrow as pa
+    raw = np.ascontiguousarray(raw, dtype=np.uint8)
+    storage = pa.FixedSizeBinaryArray.from_buffers(pa.binary(16), len(raw), [None, pa.py_buffer(raw)])
+    return pa.ExtensionArray.from_storage(pa.uuid(), storage)
+
+
+def int_array(values, low, high):
+    import pyarrow as pa
+    return pa.array(values.astype(narrow_int_dtype(low, high), copy=False))
+
+
+def timestamp_array(values):
+    import pyarrow as pa
+    return pa.array(values.astype("datetime64[s]", copy=False))
+
+
+def dictionary_array(indices, pool):
+    """
+    Returns a dictionary array of `pool[indices]` without materializing the values.
+    """
+    import pyarrow as pa
+    entry = _dictionaries.get(id(pool))
+    if entry is None or entry[0] is not pool:
+        entry = _dictionaries[id(pool)] = (pool, pa.array(pool.tolist() if pool.dtype == object else pool))
+    codes = pa.array(indices.astype(narrow_int_dtype(0, len(pool) - 1), copy=False))
+    return pa.DictionaryArray.from_arrays(codes, entry[1])
+
+
+def _is_uuid(t):
+    import pyarrow as pa
+    return isinstance(t, pa.BaseExtensionType) and t.extension_name == "arrow.uuid"
+
+
+def _uuid_strings(chunk):
+    import pyarrow as pa
+    storage = chunk.storage
+    data = np.frombuffer(storage.buffers()[1], dtype=np.uint8)
+    raw = data[storage.offset * 16:(storage.offset + len(storage)) * 16].reshape(-1, 16)
+    mask = storage.is_null().to_numpy(zero_copy_only=False) if storage.null_count else None
+    return pa.array(format_uuids(raw), type=pa.string(), mask=mask)
+
+
+def _render(column):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    t = column.type
+    if _is_uuid(t):
+        return pa.chunked_array([_uuid_strings(c) for c in column.chunks], type=pa.string())
+    if pa.types.is_dictionary(t):
+        return column.cast(t.value_type)
+    if pa.types.is_timestamp(t) and t.unit == "s" and t.tz is None:
+        return pc.strftime(column, format="%Y-%m-%dT%H:%M:%S")
+    return None
+
+
+def render_text(table):
+    """
+    Converts the compact columns of a pyarrow Table (uuid, dictionary, timestamp[s]) to strings.
+    Other columns are returned unchanged.
+    """
+    for i, name in enumerate(table.column_names):
+        rendered = _render(table.column(i))
+        if rendered is not None:
+            table = table.set_column(i, name, rendered)
+    return table
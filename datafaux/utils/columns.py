@@ -0,0 +1,145 @@
+import numpy as np
+from calendar import timegm
+from .faker_helpers import relative_date, reference_time
+
+_HEX = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+# (start, end) of the hex groups inside the 32 digits and the canonical 36-char UUID string
+_UUID_GROUPS = [((0, 8), (0, 8)), ((8, 12), (9, 13)), ((12, 16), (14, 18)), ((16, 20), (19, 23)), ((20, 32), (24, 36))]
+
+
+def uuid_column(rng, n):
+    """
+    Returns `n` random (version 4) UUID strings built from one block of random bytes.
+    """
+    return format_uuids(uuid_bytes(rng, n))
+
+
+def uuid_bytes(rng, n):
+    """
+    Returns `n` random version 4 UUIDs as an (n, 16) uint8 array.
+    """
+    raw = np.frombuffer(rng.bytes(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    return raw
+
+
+def format_uuids(raw):
+    """
+    Renders an (n, 16) uint8 array of UUIDs as canonical 36-character strings.
+    """
+    n = len(raw)
+    digits = np.empty((n, 32), dtype=np.uint8)
+    digits[:, 0::2] = _HEX[raw >> 4]
+    digits[:, 1::2] = _HEX[raw & 0x0F]
+    out = np.full((n, 36), ord("-"), dtype=np.uint8)
+    for (src_start, src_end), (dst_start, dst_end) in _UUID_GROUPS:
+        out[:, dst_start:dst_end] = digits[:, src_start:src_end]
+    return out.view("S36").ravel().astype("U36").astype(object)
+
+
+def int_column(rng, n, low, high):
+    """
+    Returns `n` integers uniformly drawn from [low, high] (both inclusive, like random.randint).
+    """
+    return rng.integers(low, high + 1, size=n, dtype=np.int64)
+
+
+def narrow_int_dtype(low, high):
+    """
+    Returns the smallest signed integer dtype holding every value in [low, high].
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def to_timestamp(value, now=None):
+    """
+    Converts a Faker-style date spec ('-3y', 'now', datetime, ...) resolved against `now`
+    to a unix timestamp (naive datetimes are rendered as-is, like Faker does).
+    """
+    return timegm(relative_date(value, now or reference_time()).timetuple())
+
+
+def datetime_column(rng, n, start="-3y", end="now", now=None):
+    """
+    Returns `n` ISO 8601 timestamps (second precision) uniformly drawn between `start` and `end`.
+    """
+    return format_datetimes(datetime_values(rng, n, start, end, now))
+
+
+def datetime_values(rng, n, start="-3y", end="now", now=None):
+    """
+    Returns `n` datetime64[s] values uniformly drawn between `start` and `end`.
+    """
+    seconds = rng.integers(to_timestamp(start, now), to_timestamp(end, now) + 1, size=n, dtype=np.int64)
+    return seconds.astype("datetime64[s]")
+
+
+def format_datetimes(values):
+    """
+    Renders datetime64[s] values as ISO 8601 strings ("2024-05-01T12:00:00").
+    """
+    return values.astype("U19").astype(object)
+
+
+def pool_column(rng, pool, n):
+    """
+    Draws `n` values from a precomputed value pool by integer index.
+    """
+    return pool[pool_indices(rng, pool, n)]
+
+
+def pool_indices(rng, pool, n):
+    return rng.integers(0, len(pool), size=n)
+
+
+def pooled_email_column(rng, pools, n, offset=None):
+    return email_column(rng, pools["user_name"], pools["email_domain"], n, offset)
+
+
+def pooled_phone_column(rng, pools, n):
+    """
+    Renders phone numbers from the locale's formats, or samples the phone pool when the locale's
+    formats cannot be rendered column-wise.
+    """
+    if "phone_format" in pools:
+        return phone_column(rng, pools["phone_format"], n)
+    return pool_column(rng, pools["phone"], n)
+
+
+def email_column(rng, user_names, domains, n, offset=None):
+    """
+    Builds `n` safe emails (like Faker's safe_email) from pools of user names and domains. With
+    `offset`, the row numbers from `offset` on are appended to the user names, making them unique.
+    """
+    users = pool_column(rng, user_names, n)
+    if offset is not None:
+        from .unique import row_suffixed
+        users = row_suffixed(users, offset)
+    return np.char.add(np.char.add(users, "@"), pool_column(rng, domains, n))
+
+
+def phone_column(rng, formats, n):
+    """
+    Renders `n` phone numbers from Faker phone formats: '#' becomes a digit, '%' a non-zero digit
+    and '$' a digit from 2 to 9, filled per format group as whole arrays of code points.
+    """
+    choice = rng.integers(0, len(formats), size=n)
+    width = max(len(f) for f in formats)
+    out = np.zeros((n, width), dtype=np.uint32)
+    for i, fmt in enumerate(formats):
+        rows = np.flatnonzero(choice == i)
+        if not len(rows):
+            continue
+        template = np.frombuffer(str(fmt).encode("utf-32-le"), dtype=np.uint32)
+        block = np.tile(template, (len(rows), 1))
+        for placeholder, low in (("#", 0), ("%", 1), ("$", 2)):
+            cols = np.flatnonzero(template == ord(placeholder))
+            if len(cols):
+                block[:, cols] = ord("0") + rng.integers(low, 10, size=(len(rows), len(cols)), dtype=np.uint32)
+        out[rows, :len(template)] = block
+    return out.view(f"U{width}").ravel()
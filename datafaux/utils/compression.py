@@ -0,0 +1,136 @@
+"""
+Block-parallel compression for the CSV/JSON writers.
+
+Output is cut into fixed-size blocks that are compressed independently on a thread pool (zlib, bz2
+and zstd release the GIL) and written in order. Each block becomes a complete gzip member, bz2 stream
+or zstd frame; concatenations of those are valid files for the standard tools and Python modules.
+"""
+import os
+from collections import deque
+
+CODECS = ["gzip", "zstd", "bz2"]
+EXTENSIONS = {".gz": "gzip", ".gzip": "gzip", ".zst": "zstd", ".zstd": "zstd", ".bz2": "bz2"}
+SUFFIXES = {"gzip": ".gz", "zstd": ".zst", "bz2": ".bz2"}
+DEFAULT_LEVELS = {"gzip": 6, "zstd": 3, "bz2": 9}
+BLOCK_SIZE = 4 << 20
+
+
+def infer_compression(path):
+    """
+    Returns the codec implied by the file extension (e.g. `out.csv.gz` -> "gzip"), or None.
+    """
+    return EXTENSIONS.get(os.path.splitext(str(path))[1].lower())
+
+
+def resolve_compression(compression, path):
+    """
+    Resolves "infer" (or None, for callers that pass it through) against `path`; validates explicit codecs.
+    """
+    if compression in (None, "infer"):
+        return infer_compression(path) if compression == "infer" else None
+    if compression not in CODECS:
+        raise ValueError(f"Compression {compression} not supported (use one of {', '.join(CODECS)})")
+    return compression
+
+
+def _zstd_compressor(level):
+    try:
+        import zstandard
+        return zstandard.ZstdCompressor(level=level).compress
+    except ImportError:
+        import pyarrow as pa
+        if not pa.Codec.is_available("zstd"):
+            raise ValueError("zstd compression needs the 'zstandard' package or a pyarrow build with zstd")
+        codec = pa.Codec("zstd", compression_level=level)
+        return lambda data: codec.compress(data, asbytes=True)
+
+
+def block_compressor(codec, level=None):
+    """
+    Returns a function compressing one block of bytes into a self-contained member/stream/frame.
+    """
+    level = DEFAULT_LEVELS[codec] if level is None else level
+    if codec == "gzip":
+        import zlib
+
+        def compress(data):
+            c = zlib.compressobj(level, zlib.DEFLATED, 31)
+            return c.compress(data) + c.flush()
+        return compress
+    if codec == "bz2":
+        import bz2
+        return lambda data: bz2.compress(data, level)
+    if codec == "zstd":
+        return _zstd_compressor(level)
+    raise ValueError(f"Compression {codec} not supported (use one of {', '.join(CODECS)})")
+
+
+class CompressedWriter:
+    """
+    Binary file-like writer that compresses `block_size` blocks on `threads` threads, keeping at most
+    2 * `threads` blocks in flight, and writes them to `fh` in order.
+    """
+
+    def __init__(self, fh, codec, level=None, block_size=BLOCK_SIZE, threads=None):
+        from concurrent.futures import ThreadPoolExecutor
+        self.fh = fh
+        self.compress = block_compressor(codec, level)
+        self.block_size = block_size
+        self.threads = threads or os.cpu_count() or 1
+        self.pool = ThreadPoolExecutor(self.threads)
+        self.pending = deque()
+        self.buffer = bytearray()
+
+    def write(self, data):
+        self.buffer += data
+        while len(self.buffer) >= self.block_size:
+            block = bytes(self.buffer[:self.block_size])
+            del self.buffer[:self.block_size]
+            self._submit(block)
+        return len(data)
+
+    def _submit(self, block):
+        self.pending.append(self.pool.submit(self.compress, block))
+        while len(self.pending) > 2 * self.threads or (self.pending and self.pending[0].done()):
+            self.fh.write(self.pending.popleft().result())
+
+    def flush(self):
+        """
+        Compresses the buffered tail as its own block and writes every pending block, so the file
+        ends on a member/frame boundary (used by streaming checkpoints).
+        """
+        if self.buffer:
+            self._submit(bytes(self.buffer))
+            self.buffer.clear()
+        while self.pending:
+            self.fh.write(self.pending.popleft().result())
+        self.fh.flush()
+
+    def tell(self):
+        return self.fh.tell()
+
+    def close(self):
+        if self.fh is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self.pool.shutdown()
+            self.fh.close()
+            self.fh = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_output(path, mode="w", compression="infer", buffer_size=1 << 20, **options):
+    """
+    Opens `path` for binary writing, wrapped in a `CompressedWriter` if a codec is given or inferred.
+    `options` (level, block_size, threads) are passed to the writer.
+    """
+    codec = resolve_compression(compression, path)
+    fh = open(path, mode + "b", buffering=buffer_size)
+    return CompressedWriter(fh, codec, **options) if codec else fh
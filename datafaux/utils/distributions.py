@@ -0,0 +1,124 @@
+"""
+Statistical distributions for schema fields, sampled as whole NumPy arrays per chunk.
+
+A distribution is declared inline, next to its parameters:
+
+    - {name: age, type: int, min: 18, max: 90, distribution: normal, mean: 40, std: 12}
+    - {name: amount, type: float, distribution: lognormal, mean: 3.5, sigma: 1.0}
+    - {name: sku, type: enum, values: [A, B, C, D], distribution: zipf, exponent: 1.3}
+    - {name: tier, type: enum, values: [free, pro, team], weights: [80, 15, 5]}
+    - {name: seen_at, type: datetime, start: -1d, distribution: poisson, rate: 30, per: minute}
+
+Numeric values are clipped to `min`/`max` when those are given. Zipf on a numeric field draws ranks
+from `min` (the most frequent value) to `max`; on enums and pools the first values are the most frequent.
+"""
+import numpy as np
+
+DISTRIBUTIONS = ["uniform", "normal", "lognormal", "exponential", "poisson", "zipf", "choice"]
+# seconds per `per` unit of an arrival `rate`
+RATE_UNITS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+def distribution_of(spec):
+    """
+    Returns the distribution named in `spec` (default "uniform"); raises ValueError if it is unknown.
+    """
+    dist = spec.get("distribution", "uniform")
+    if dist not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution '{dist}' (use one of {', '.join(DISTRIBUTIONS)}).")
+    return dist
+
+
+def _weights_cdf(weights):
+    weights = np.asarray(weights, dtype=float)
+    if weights.ndim != 1 or not len(weights) or (weights < 0).any() or weights.sum() <= 0:
+        raise ValueError("'weights' must be non-negative numbers with a positive sum.")
+    cdf = np.cumsum(weights)
+    return cdf / cdf[-1]
+
+
+def zipf_weights(size, exponent=1.0):
+    """
+    Unnormalized bounded Zipf weights 1 / rank**exponent for ranks 1..size.
+    """
+    if exponent < 0:
+        raise ValueError("'exponent' must be >= 0.")
+    return 1.0 / np.arange(1, size + 1, dtype=float) ** exponent
+
+
+def index_cdf(spec, size):
+    """
+    Returns the cumulative probabilities of drawing each of `size` values (`weights` or a Zipf
+    `distribution`), or None for uniform draws.
+    """
+    weights = spec.get("weights")
+    if weights is not None:
+        if len(weights) != size:
+            raise ValueError(f"'weights' needs one weight per value ({size}), got {len(weights)}.")
+        return _weights_cdf(weights)
+    dist = distribution_of(spec)
+    if dist == "zipf":
+        return _weights_cdf(zipf_weights(size, float(spec.get("exponent", 1.0))))
+    if dist != "uniform":
+        raise ValueError(f"Distribution '{dist}' can't pick from a list of values (use zipf or 'weights').")
+    return None
+
+
+def sample_indices(rng, cdf, n):
+    """
+    Draws `n` indices with the cumulative probabilities `cdf` (see `index_cdf`).
+    """
+    return np.searchsorted(cdf, rng.random(n), side="right")
+
+
+def sample(rng, spec, n):
+    """
+    Draws `n` values from the (non-uniform) distribution in `spec`: float64 for continuous
+    distributions, int64 for poisson, zipf and integer choices. Not clipped.
+    """
+    dist = distribution_of(spec)
+    if dist == "normal":
+        return rng.normal(float(spec.get("mean", 0.0)), float(spec.get("std", 1.0)), size=n)
+    if dist == "lognormal":
+        return rng.lognormal(float(spec.get("mean", 0.0)), float(spec.get("sigma", 1.0)), size=n)
+    if dist == "exponential":
+        return rng.exponential(float(spec.get("scale", 1.0)), size=n)
+    if dist == "poisson":
+        return rng.poisson(float(spec.get("mean", 1.0)), size=n)
+    if dist == "zipf":
+        if "min" in spec and "max" in spec:
+            low, high = int(spec["min"]), int(spec["max"])
+            cdf = _weights_cdf(zipf_weights(high - low + 1, float(spec.get("exponent", 1.0))))
+            return low + sample_indices(rng, cdf, n)
+        exponent = float(spec.get("exponent", 2.0))
+        if not exponent > 1:
+            raise ValueError("'zipf' without 'min' and 'max' needs an 'exponent' > 1.")
+        return rng.zipf(exponent, size=n)
+    if dist == "choice":
+        values = np.asarray(spec.get("values") or [], dtype=float)
+        if not len(values):
+            raise ValueError("'choice' needs a non-empty 'values' list.")
+        weights = spec.get("weights")
+        p = None
+        if weights:
+            _weights_cdf(weights)
+            p = np.asarray(weights, dtype=float) / np.sum(weights)
+        picked = values[rng.choice(len(values), size=n, p=p)]
+        return picked.astype(np.int64) if np.all(values == np.round(values)) else picked
+    raise ValueError("Uniform values are drawn by the column itself.")
+
+
+def arrival_seconds(rng, spec, n, offset=0):
+    """
+    Poisson arrivals: seconds after the start for rows `offset`..`offset + n - 1` of a stream with
+    `rate` events per `per` unit. Row `offset` opens the window [offset, offset + n) / rate, and the
+    rows fall in it as sorted uniform draws, so chunks made independently stay in time order.
+    """
+    rate = float(spec.get("rate", 1.0))
+    per = spec.get("per", "second")
+    if per not in RATE_UNITS:
+        raise ValueError(f"Unknown 'per' unit '{per}' (use one of {', '.join(RATE_UNITS)}).")
+    if rate <= 0:
+        raise ValueError("'rate' must be > 0.")
+    scale = RATE_UNITS[per] / rate
+    return (offset + np.sort(rng.uniform(0, n, size=n))) * scale
@@ -1,41 +1,249 @@
 import pandas as pd
 import json
-from math import ceil
+from .compression import open_output
+from .serializers import csv_bytes, ndjson_bytes, to_pandas
 
+# rows serialized at a time when `save_df` writes CSV/JSON, so the text of a large dataset is never
+# held in memory at once
+SAVE_ROWS = 100000
 
-def save_df(df: pd.DataFrame, out_path: str, fmt: str = "csv") -> None:
+
+def save_df(df: pd.DataFrame, out_path: str, fmt: str = "csv", **options) -> None:
+    """
+    Saves a DataFrame (or a pyarrow Table). `options` are forwarded to the Parquet writer (e.g.
+    compression, row_group_size), for CSV and JSON to the text sinks (compression: gzip, zstd, bz2, or
+    "infer" from the extension, the default; compression_level), and for xlsx to `XlsxSink`.
+    CSV and JSON are written `SAVE_ROWS` rows at a time.
+    """
     fmt = fmt.lower()
     if fmt == "csv":
-        df.to_csv(out_path, index=False, encoding="utf-8")
+        save_df_stream(df, out_path, "csv", chunksize=SAVE_ROWS, **options)
     elif fmt == "json":
-        df.to_json(out_path, orient="records", force_ascii=False, date_format="iso")
+        with JSONArraySink(out_path, **options) as sink:
+            _write_slices(sink, df, SAVE_ROWS)
     elif fmt == "parquet":
-        df.to_parquet(out_path, index=False)
+        if not isinstance(df, pd.DataFrame):
+            import pyarrow.parquet as pq
+            pq.write_table(df, out_path, **options)
+        else:
+            df.to_parquet(out_path, index=False, **options)
     elif fmt in ("xlsx", "excel"):
-        df.to_excel(out_path, index=False)
+        with XlsxSink(out_path, **options) as sink:
+            sink.write(df)
     else:
         raise ValueError(f"Format {fmt} not supported")
 
 
-def save_df_stream(df: pd.DataFrame, out_path: str, fmt: str = "csv", chunksize: int = 1000) -> None:
+class StreamSink:
     """
-    Saves a large DataFrame in chunks (writes to disk without loading everything into memory at once).
+    Base class for chunk-by-chunk writers: call `write(chunk)` for every chunk (a DataFrame or a
+    pyarrow Table), then `close()`. Can be used as a context manager. `bytes` counts the serialized
+    (uncompressed) bytes written, where the sink knows them (None otherwise).
+    """
+
+    bytes = None
+
+    def __init__(self, out_path: str):
+        self.out_path = out_path
+        self.rows = 0
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        self._write(chunk)
+        self.rows += len(chunk)
+
+    def _write(self, chunk: pd.DataFrame) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> int:
+        """
+        Pushes everything written so far to the file; returns the file size in bytes.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TextSink(StreamSink):
     """
-    n = len(df)
-    parts = ceil(n / chunksize)
-    first = True
-    for i in range(parts):
-        start = i * chunksize
-        end = min(n, start + chunksize)
-        part = df.iloc[start:end]
-        if fmt == "csv":
-            part.to_csv(out_path, mode="a", header=first, index=False, encoding="utf-8")
-        elif fmt == "json":
-            # lines=True for NDJSON
-            part.to_json(out_path, orient="records", lines=True, force_ascii=False, mode="a")
-        elif fmt == "parquet":
-            # append parquet requires more work; creating files by part and then concatenating is out of scope
-            part.to_parquet(f"{out_path}.part{i}.parquet", index=False)
+    Keeps a single binary file handle open (truncating the file first; `mode="a"` appends, as a resumed
+    checkpointed run does) with a large write buffer; chunks are encoded by `utils.serializers`. With `compression` (gzip, zstd,
+    bz2, or "infer" from the extension), output goes through a block-parallel compressor.
+    """
+
+    def __init__(self, out_path: str, buffer_size: int = 1 << 20, mode: str = "w", compression: str = "infer",
+                 compression_level: int = None):
+        super().__init__(out_path)
+        self.bytes = 0
+        self.fh = open_output(out_path, mode, compression, buffer_size, level=compression_level)
+
+    def _emit(self, data):
+        self.fh.write(data)
+        self.bytes += len(data)
+
+    def flush(self):
+        self.fh.flush()
+        return self.fh.tell()
+
+    def close(self):
+        if self.fh is not None:
+            self.fh.close()
+            self.fh = None
+
+
+class CSVSink(TextSink):
+    def _write(self, chunk):
+        self._emit(csv_bytes(chunk, header=self.rows == 0))
+
+
+class NDJSONSink(TextSink):
+    def _write(self, chunk):
+        self._emit(ndjson_bytes(chunk))
+
+
+class JSONArraySink(TextSink):
+    """
+    Writes chunks as one JSON array of records (the layout of `save_df(..., "json")`).
+    """
+
+    def _write(self, chunk):
+        lines = ndjson_bytes(chunk)
+        if lines:
+            self._emit((b"," if self.bytes else b"[") + lines.rstrip(b"\n").replace(b"\n", b","))
+
+    def close(self):
+        if self.fh is not None:
+            self._emit(b"]" if self.bytes else b"[]")
+        super().close()
+
+
+class ParquetSink(StreamSink):
+    """
+    Writes all chunks into a single Parquet file through one `pyarrow.parquet.ParquetWriter`.
+
+    Each chunk becomes a row group; with `row_group_size`, chunks are buffered and re-cut so that
+    row groups hold exactly `row_group_size` rows (memory stays bounded by max(chunk, row group)).
+    Empty chunks only contribute their schema: if no rows arrive, `close` writes a 0-row file with it.
+    """
+
+    def __init__(self, out_path: str, compression: str = "snappy", row_group_size: int = None):
+        super().__init__(out_path)
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.writer = None
+        self.schema = None
+        self.empty_schema = None
+        self.pending = []
+        self.pending_rows = 0
+
+    def _write(self, chunk):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        if isinstance(chunk, pa.Table):
+            table = chunk if self.schema is None else chunk.cast(self.schema)
         else:
-            raise ValueError("Format not supported in save_df_stream")
-        first = False
\ No newline at end of file
+            table = pa.Table.from_pandas(chunk, schema=self.schema, preserve_index=False)
+        if self.writer is None and not table.num_rows:
+            self.empty_schema = table.schema
+            return
+        if self.writer is None:
+            self.schema = table.schema
+            self.writer = pq.ParquetWriter(self.out_path, self.schema, compression=self.compression)
+        if not self.row_group_size:
+            self.writer.write_table(table)
+            return
+        self.pending.append(table)
+        self.pending_rows += table.num_rows
+        if self.pending_rows >= self.row_group_size:
+            self._flush(final=False)
+
+    def _flush(self, final):
+        import pyarrow as pa
+        table = pa.concat_tables(self.pending)
+        full = table.num_rows if final else table.num_rows - table.num_rows % self.row_group_size
+        if full:
+            self.writer.write_table(table.slice(0, full), row_group_size=self.row_group_size)
+        rest = table.slice(full)
+        self.pending = [rest] if rest.num_rows else []
+        self.pending_rows = rest.num_rows
+
+    def close(self):
+        if self.writer is None:
+            if self.empty_schema is None:
+                return
+            import pyarrow.parquet as pq
+            self.writer = pq.ParquetWriter(self.out_path, self.empty_schema, compression=self.compression)
+        if self.pending:
+            self._flush(final=True)
+        self.writer.close()
+        self.writer = None
+
+
+class XlsxSink(StreamSink):
+    """
+    Writes chunks into one .xlsx workbook through the streaming `utils.xlsx.XlsxWriter`, a batch of
+    rows at a time; sheets roll over (Sheet1, Sheet2, ...) at Excel's 1,048,576 rows, header included.
+    """
+
+    def __init__(self, out_path: str, sheet_name: str = "Sheet", max_rows: int = None, compression_level: int = 1):
+        from .xlsx import EXCEL_MAX_ROWS, XlsxWriter
+        super().__init__(out_path)
+        self.writer = XlsxWriter(out_path, sheet_name, max_rows or EXCEL_MAX_ROWS, compression_level)
+
+    def _write(self, chunk):
+        from .xlsx import BATCH_ROWS
+        for start in range(0, len(chunk), BATCH_ROWS):
+            part = to_pandas(chunk[start:start + BATCH_ROWS])
+            self.writer.write(list(part.columns), [part[name].tolist() for name in part.columns])
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+SINKS = {
+    "csv": CSVSink,
+    "json": NDJSONSink,
+    "parquet": ParquetSink,
+    "xlsx": XlsxSink,
+    "excel": XlsxSink,
+}
+
+
+def open_sink(out_path: str, fmt: str = "csv", **options) -> StreamSink:
+    """
+    Returns the streaming sink for `fmt`. `options` are passed to the sink (CSV/JSON: buffer_size,
+    compression, compression_level; Parquet: compression, row_group_size; xlsx: sheet_name, max_rows).
+    With `partition_by` or `rows_per_file`, `out_path` is a directory written by a
+    `utils.partitions.PartitionedSink` (which also accepts `threads`).
+    """
+    fmt = fmt.lower()
+    if fmt not in SINKS:
+        raise ValueError(f"Streaming not supported for format {fmt}")
+    if options.get("partition_by") or options.get("rows_per_file"):
+        from .partitions import PartitionedSink
+        return PartitionedSink(out_path, fmt, **options)
+    options.pop("partition_by", None)
+    options.pop("rows_per_file", None)
+    return SINKS[fmt](out_path, **options)
+
+
+def save_df_stream(df: pd.DataFrame, out_path: str, fmt: str = "csv", chunksize: int = 1000, **options) -> None:
+    """
+    Saves a large DataFrame in chunks (writes to disk without loading everything into memory at once).
+    """
+    with open_sink(out_path, fmt, **options) as sink:
+        _write_slices(sink, df, chunksize)
+
+
+def _write_slices(sink, df, chunksize):
+    # an empty frame is still written once, e.g. for the CSV header
+    for start in range(0, len(df), chunksize) if len(df) else [0]:
+        sink.write(df[start:start + chunksize])
@@ -1,13 +1,82 @@
-from faker import Faker
-import random
+import re
+from datetime import date, datetime, timedelta
+import numpy as np
+
+# Faker's relative date syntax ('-3y', '+30d', '-1y-2M'), parsed here so that columnar code paths
+# never have to import Faker (same regex and year/month lengths as faker.providers.date_time)
+_TIMEDELTA_RE = re.compile("".join(rf"((?P<{name}>(?:\+|-)\d+?){unit})?" for name, unit in (
+    ("years", "y"), ("months", "M"), ("weeks", "w"), ("days", "d"), ("hours", "h"), ("minutes", "m"),
+    ("seconds", "s"))))
+_EPOCH = datetime(1970, 1, 1)
 
 
 def get_faker(locale="en_US", seed=None):
     """
     Returns a Faker instance with optional locale and seed.
+    The seed only applies to this instance (`fake.random`), never to the shared Faker/`random` state.
     """
+    from faker import Faker  # deferred: importing Faker is slow and columnar paths don't need it
     fake = Faker(locale)
     if seed is not None:
-        Faker.seed(seed)
-        random.seed(seed)
-    return fake
\ No newline at end of file
+        fake.seed_instance(seed)
+    return fake
+
+
+def get_rng(seed=None):
+    """
+    Returns a NumPy Generator owned by the caller (for columnar generation and error injection).
+    """
+    return np.random.default_rng(seed)
+
+
+def derive_seed(seed, index, *path):
+    """
+    Derives an independent, deterministic seed for shard/chunk `index` from a master seed
+    (extra `path` items select independent sub-streams of the same chunk).
+    Returns None when no master seed is given.
+    """
+    if seed is None:
+        return None
+    return int(np.random.SeedSequence(seed, spawn_key=(index, *path)).generate_state(1)[0])
+
+
+def reference_time(seed=None):
+    """
+    Returns the datetime that relative dates ('-3y', 'now') are resolved against.
+    Seeded runs are pinned to the start of the current day so they reproduce byte for byte.
+    """
+    now = datetime.now().replace(microsecond=0)
+    if seed is not None:
+        now = now.replace(hour=0, minute=0, second=0)
+    return now
+
+
+def relative_date(spec, now):
+    """
+    Resolves a Faker-style date spec ('-3y', '-30d', 'now', datetime, date) against `now`. Like Faker,
+    a date is its midnight and an int is an absolute unix timestamp (rendered as a naive UTC datetime).
+    """
+    if isinstance(spec, datetime):
+        return spec
+    if isinstance(spec, date):
+        return datetime(spec.year, spec.month, spec.day)
+    if isinstance(spec, int) and not isinstance(spec, bool):
+        return _EPOCH + timedelta(seconds=spec)
+    if spec in ("now", "today"):
+        return now
+    return now + parse_timedelta(spec)
+
+
+def parse_timedelta(spec):
+    """
+    Parses a relative spec ('-3y', '+30d', timedelta or seconds) like Faker does; raises ValueError.
+    """
+    if isinstance(spec, timedelta):
+        return spec
+    if isinstance(spec, (int, float)):
+        return timedelta(seconds=spec)
+    parts = {k: int(v) for k, v in _TIMEDELTA_RE.match(str(spec)).groupdict().items() if v}
+    if not parts:
+        raise ValueError(f"Can't parse date string `{spec}`")
+    days = parts.pop("days", 0) + 365.24 * parts.pop("years", 0) + 30.42 * parts.pop("months", 0)
+    return timedelta(days=days, **parts)
@@ -0,0 +1,163 @@
+"""
+Partitioned dataset output: a directory of fixed-size files and/or Hive-style partitions
+(`currency=USD/part-00000.csv`), plus a `_manifest.json` listing every file with its row count and size.
+
+Partition keys are columns (`currency`, stored in the path and dropped from the files, as Spark and
+DuckDB expect) or derived from a date column (`order_date:month` -> `order_date_month=2024-05`, the
+column itself is kept). The rows of each chunk are split per partition and the partitions are
+serialized and written concurrently on a thread pool.
+"""
+import json
+import os
+from urllib.parse import quote
+import numpy as np
+from .compression import SUFFIXES, resolve_compression
+
+MANIFEST_NAME = "_manifest.json"
+# derived partition keys: prefix length of the ISO date/datetime string
+DATE_PARTS = {"year": 4, "month": 7, "day": 10}
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def parse_partition_by(specs):
+    """
+    Parses partition specs ("currency", "order_date:month") into (column, part or None, key name) tuples.
+    """
+    parsed = []
+    for spec in specs or []:
+        column, _, part = spec.partition(":")
+        if part and part not in DATE_PARTS:
+            raise ValueError(f"Unknown partition part '{part}' in '{spec}' (use one of {', '.join(DATE_PARTS)}).")
+        parsed.append((column, part or None, f"{column}_{part}" if part else column))
+    return parsed
+
+
+def _column(chunk, name):
+    if type(chunk).__module__.startswith("pyarrow"):
+        return chunk.column(name).to_pandas()
+    return chunk[name]
+
+
+def _key_values(chunk, column, part):
+    import pandas as pd
+    values = _column(chunk, column)
+    if part is None:
+        return values.to_numpy(dtype=object)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        values = values.dt.strftime("%Y-%m-%dT%H:%M:%S")
+    return values.astype("string").str.slice(0, DATE_PARTS[part]).to_numpy(dtype=object)
+
+
+def _path_value(value):
+    import pandas as pd
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return NULL_PARTITION
+    return quote(str(value), safe="")
+
+
+class PartitionedSink:
+    """
+    Stream sink writing a partitioned directory. Each partition rolls over to a new file every
+    `rows_per_file` rows (if given); `threads` partitions are written at the same time.
+    `options` are passed to the per-file sinks (see `utils.exporters.open_sink`).
+    """
+
+    def __init__(self, out_dir, fmt="csv", partition_by=None, rows_per_file=None, threads=None, **options):
+        from concurrent.futures import ThreadPoolExecutor
+        self.out_path = out_dir
+        self.fmt = fmt
+        self.keys = parse_partition_by(partition_by)
+        self.rows_per_file = rows_per_file
+        self.options = dict(options)
+        if fmt in ("csv", "json"):
+            self.options["mode"] = "w"
+            codec = resolve_compression(self.options.get("compression", "infer"), "")
+            self.suffix = f".{fmt}{SUFFIXES.get(codec, '')}"
+        else:
+            self.suffix = f".{fmt}"
+        self.rows = 0
+        self.partitions = {}
+        self.files = []
+        self.pool = ThreadPoolExecutor(threads or min(8, os.cpu_count() or 1))
+        os.makedirs(out_dir, exist_ok=True)
+
+    def write(self, chunk):
+        futures = [self.pool.submit(self._write_partition, key, part) for key, part in self._split(chunk)]
+        for future in futures:
+            future.result()
+        self.rows += len(chunk)
+
+    def _split(self, chunk):
+        if len(chunk) == 0:
+            return []
+        if not self.keys:
+            return [((), chunk)]
+        import pandas as pd
+        columns = [_key_values(chunk, column, part) for column, part, _ in self.keys]
+        codes, uniques = pd.factorize(pd.MultiIndex.from_arrays(columns) if len(columns) > 1 else columns[0],
+                                      use_na_sentinel=False)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.flatnonzero(np.diff(codes[order])) + 1
+        drop = [column for column, part, _ in self.keys if part is None]
+        if drop:
+            chunk = chunk.drop(columns=drop)
+        parts = []
+        for rows in np.split(order, bounds):
+            unique = uniques[codes[rows[0]]]
+            values = unique if len(self.keys) > 1 else (unique,)
+            key = tuple(f"{name}={_path_value(v)}" for (_, _, name), v in zip(self.keys, values))
+            parts.append((key, chunk.take(rows) if hasattr(chunk, "column_names") else chunk.iloc[rows]))
+        return parts
+
+    def _write_partition(self, key, part):
+        from .exporters import open_sink
+        state = self.partitions.setdefault(key, {"sink": None, "file": None, "index": 0})
+        offset = 0
+        while offset < len(part):
+            if state["sink"] is None:
+                rel = os.path.join(*key, f"part-{state['index']:05d}{self.suffix}")
+                os.makedirs(os.path.join(self.out_path, *key), exist_ok=True)
+                state["sink"] = open_sink(os.path.join(self.out_path, rel), self.fmt, **self.options)
+                state["file"] = {"path": rel.replace(os.sep, "/"), "partition": dict(k.split("=", 1) for k in key),
+                                 "rows": 0, "bytes": 0}
+                state["index"] += 1
+            room = len(part) - offset
+            if self.rows_per_file:
+                room = min(room, self.rows_per_file - state["sink"].rows)
+            piece = part[offset:offset + room] if hasattr(part, "column_names") else part.iloc[offset:offset + room]
+            state["sink"].write(piece)
+            offset += room
+            if self.rows_per_file and state["sink"].rows >= self.rows_per_file:
+                self._close_file(state)
+
+    def _close_file(self, state):
+        state["sink"].close()
+        state["file"]["rows"] = state["sink"].rows
+        state["file"]["bytes"] = os.path.getsize(os.path.join(self.out_path, state["file"]["path"]))
+        self.files.append(state["file"])
+        state["sink"] = state["file"] = None
+
+    def close(self):
+        if self.pool is None:
+            return
+        self.pool.shutdown()
+        self.pool = None
+        for state in self.partitions.values():
+            if state["sink"] is not None:
+                self._close_file(state)
+        self.files.sort(key=lambda f: f["path"])
+        manifest = {
+            "format": self.fmt,
+            "partition_by": [name for _, _, name in self.keys],
+            "rows": sum(f["rows"] for f in self.files),
+            "bytes": sum(f["bytes"] for f in self.files),
+            "files": self.files,
+        }
+        with open(os.path.join(self.out_path, MANIFEST_NAME), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,144 @@
+import json
+import os
+import numpy as np
+from ..config import POOL_SIZE
+
+# Bump when pool contents or layout change, so stale on-disk pools are ignored
+POOL_VERSION = 2
+
+# Faker providers sampled to fill each pool; values are post-processed like the row generators do
+POOL_PROVIDERS = {
+    "name": lambda fake: fake.name(),
+    "user_name": lambda fake: fake.user_name(),
+    "phone": lambda fake: fake.phone_number(),
+    "address": lambda fake: fake.address().replace("\n", ", "),
+    "street_address": lambda fake: fake.street_address(),
+    "city": lambda fake: fake.city(),
+    "word": lambda fake: fake.word(),
+}
+
+# Placeholders that phone formats may use to be rendered by `columns.phone_column` (see Faker's numerify)
+PHONE_PLACEHOLDERS = "#%$"
+
+# Pools are built with a fixed seed so their content only depends on locale and size;
+# the run seed only drives which indices get drawn from them.
+POOL_SEED = 0
+
+_cache = {}
+
+
+def cache_dir():
+    """
+    Root directory of the on-disk pool cache ($DATAFAUX_CACHE_DIR, else $XDG_CACHE_HOME/datafaux or ~/.cache/datafaux).
+    """
+    if os.environ.get("DATAFAUX_CACHE_DIR"):
+        return os.environ["DATAFAUX_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "datafaux")
+
+
+def pool_size():
+    """
+    Values sampled per pool: $DATAFAUX_POOL_SIZE, else `config.POOL_SIZE`.
+    """
+    size = os.environ.get("DATAFAUX_POOL_SIZE")
+    if not size:
+        return POOL_SIZE
+    try:
+        size = int(size)
+    except ValueError:
+        raise ValueError(f"DATAFAUX_POOL_SIZE must be a positive integer, not '{size}'") from None
+    if size < 1:
+        raise ValueError(f"DATAFAUX_POOL_SIZE must be a positive integer, not '{size}'")
+    return size
+
+
+def pool_dir(locale, size, root=None):
+    from importlib.metadata import version
+    faker_version = version("faker")
+    return os.path.join(root or cache_dir(), "pools", f"v{POOL_VERSION}", f"faker-{faker_version}", f"{locale}-{size}")
+
+
+def phone_formats(fake):
+    """
+    Returns the locale's phone number formats if they only use digit placeholders, else None.
+    """
+    from faker.providers.phone_number import Provider as PhoneProvider
+    for provider in fake.get_providers():
+        if isinstance(provider, PhoneProvider):
+            if type(provider).phone_number is not PhoneProvider.phone_number:
+                return None
+            formats = sorted(set(provider.formats))
+            if all("{{" not in f and "!" not in f and "@" not in f for f in formats):
+                return formats
+            return None
+    return None
+
+
+def build_pools(locale="en_US", size=None):
+    """
+    Builds every pool for `locale` from Faker: `size` (default `pool_size()`) sampled values per
+    provider, plus the complete lists of safe email domains and phone formats.
+    """
+    from faker import Faker
+    size = size or pool_size()
+    fake = Faker(locale)
+    fake.seed_instance(POOL_SEED)
+    pools = {kind: np.array([provider(fake) for _ in range(size)]) for kind, provider in POOL_PROVIDERS.items()}
+    pools["email_domain"] = np.array(sorted(fake.provider("faker.providers.internet").safe_domain_names))
+    formats = phone_formats(fake)
+    if formats:
+        pools["phone_format"] = np.array(formats)
+    return pools
+
+
+def save_pools(pools, path):
+    os.makedirs(path, exist_ok=True)
+    for kind, values in pools.items():
+        tmp = os.path.join(path, f".{kind}.{os.getpid()}.npy")
+        np.save(tmp, values)
+        os.replace(tmp, os.path.join(path, f"{kind}.npy"))
+    # written last: its presence marks a complete pool directory
+    with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"version": POOL_VERSION, "kinds": sorted(pools)}, f)
+
+
+def load_pools(path):
+    """
+    Memory-maps the pools saved in `path` (read-only, so worker processes share the pages).
+    Returns None if the directory does not hold a complete pool set.
+    """
+    try:
+        with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        return {kind: np.load(os.path.join(path, f"{kind}.npy"), mmap_mode="r") for kind in meta["kinds"]}
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def get_pools(locale="en_US", size=None, cache=True):
+    """
+    Returns a dict of value pools (fixed-width numpy string arrays) for the given locale, with `size`
+    (default `pool_size()`) values per pool.
+
+    Pools are loaded once per process from the on-disk cache, and built from Faker (then saved)
+    only when missing; if they can't be saved, the pools built in memory are used. With `cache=False`
+    nothing is read from or written to disk.
+    """
+    size = size or pool_size()
+    key = (locale, size)
+    if key not in _cache:
+        pools = None
+        if cache:
+            path = pool_dir(locale, size)
+            pools = load_pools(path)
+        if pools is None:
+            pools = build_pools(locale, size)
+            if cache:
+                try:
+                    save_pools(pools, path)
+                    pools = load_pools(path) or pools
+                except OSError:
+                    pass
+        _cache[key] = pools
+    return _cache[key]
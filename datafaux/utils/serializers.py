@@ -0,0 +1,316 @@
+"""
+Fast CSV / JSON-lines serializers for generated chunks (pandas DataFrames or pyarrow Tables).
+
+CSV and JSON lines are assembled column-wise with Arrow compute kernels: every column is rendered to
+CSV fields or JSON fragments once and the rows are joined in C, so there is no per-row Python work
+for flat string/number columns. Chunks that Arrow cannot represent (e.g. mixed types after error
+injection) fall back to a pure-Python encoder or to pandas.
+
+CSV output is the same as `DataFrame.to_csv(index=False)`: fields quoted only when needed, nulls
+empty, floats and datetimes formatted the way pandas does (3.0, 1e-05, "2024-01-01 10:00:00"). Only
+values holding a bare carriage return differ: they are quoted (the csv module before Python 3.12
+leaves them bare, which splits the row for most readers).
+JSON lines parse to the same records as `to_json(lines=True)`; only number formatting details differ
+(e.g. floats keep full precision). Compact Arrow columns (uuid, dictionary, timestamp[s]; see
+`utils.arrow_columns`) are rendered to text here, at the boundary.
+"""
+import csv
+import io
+import json
+import math
+from json.encoder import encode_basestring
+import numpy as np
+from .arrow_columns import render_text
+
+# characters `encode_basestring` would escape
+_NEEDS_ESCAPE = r'[\x00-\x1f"\\]'
+# characters that make the csv module (QUOTE_MINIMAL, as used by `DataFrame.to_csv`) quote a field
+_NEEDS_QUOTES = r'[,"\r\n]'
+# Arrow bytes and rows rendered per pass of the kernels: keeps each rendered or joined string array well
+# below the 2 GiB its int32 offsets can address (compact columns grow a few times when rendered to
+# text), and bounds the temporary arrays
+SLICE_BYTES = 256 << 20
+SLICE_ROWS = 1 << 18
+
+
+def _is_arrow(chunk):
+    return type(chunk).__module__.startswith("pyarrow")
+
+
+def to_arrow(chunk):
+    """
+    Returns `chunk` as a pyarrow Table, or None if a DataFrame cannot be converted.
+    """
+    import pyarrow as pa
+    if _is_arrow(chunk):
+        return chunk if isinstance(chunk, pa.Table) else pa.Table.from_batches([chunk])
+    try:
+        return pa.Table.from_pandas(chunk, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+
+
+def to_pandas(chunk):
+    """
+    Returns `chunk` as a DataFrame; compact Arrow columns come back as the generators' strings and
+    nested columns as Python lists and dicts.
+    """
+    return _pandas_cells(render_text(to_arrow(chunk))) if _is_arrow(chunk) else chunk
+
+
+def csv_bytes(chunk, header=True):
+    """
+    Serializes a chunk to UTF-8 CSV, like `DataFrame.to_csv(index=False)` (Arrow kernels for flat
+    columns, pandas otherwise).
+    """
+    table = to_arrow(chunk)
+    if (table is None or not table.num_columns
+            or not all(_csv_type(f.type) for f in render_text(table.slice(0, 0)).schema)):
+        return to_pandas(chunk).to_csv(index=False, header=header).encode("utf-8")
+    head = _csv_header(table.column_names) if header else b""
+    return head + b"".join(_csv_rows(render_text(part)) for part in _slices(table))
+
+
+def _csv_rows(table):
+    import pyarrow.compute as pc
+    fields = [_csv_fields(table.column(i)) for i in range(table.num_columns)]
+    if len(fields) == 1:
+        # the csv module quotes a lone empty field, so that the row isn't a blank line
+        fields = [_fill_empty(fields[0], '""')]
+    parts = [part for f in fields for part in (",", f)][1:] + ["\n"]
+    return _buffer_bytes(pc.binary_join_element_wise(*parts, ""))
+
+
+def _csv_type(t):
+    """
+    True for the column types `_csv_fields` renders (the others are left to pandas).
+    """
+    import pyarrow as pa
+    if pa.types.is_dictionary(t):
+        t = t.value_type
+    return (pa.types.is_string(t) or pa.types.is_large_string(t) or pa.types.is_integer(t)
+            or pa.types.is_boolean(t) or pa.types.is_floating(t) or pa.types.is_temporal(t))
+
+
+def _pandas_cells(table):
+    """
+    Converts an Arrow table to a DataFrame whose nested columns hold Python lists and dicts, as in the
+    generators' DataFrames (`Table.to_pandas` would make them NumPy arrays, written as their repr).
+    """
+    import pyarrow as pa
+    df = table.to_pandas()
+    for i, column in enumerate(table.columns):
+        if pa.types.is_nested(column.type):
+            df.isetitem(i, column.to_pylist())
+    return df
+
+
+def _csv_fields(column):
+    """
+    Renders an Arrow column (of a `_csv_type`) to a string array of CSV fields formatted like
+    `DataFrame.to_csv`.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    t = column.type
+    if pa.types.is_dictionary(t):
+        column, t = column.cast(t.value_type), t.value_type
+    if pa.types.is_large_string(t):
+        column, t = column.cast(pa.string()), pa.string()
+
+    if pa.types.is_string(t):
+        quote = _needs_quotes(column)
+        if quote is not None:
+            quoted = pc.binary_join_element_wise('"', pc.replace_substring(column, '"', '""'), '"', "")
+            column = pc.if_else(quote, quoted, column)
+        out = column
+    elif pa.types.is_integer(t):
+        out = column.cast(pa.string())
+    elif pa.types.is_boolean(t):
+        out = pc.if_else(column, "True", "False")
+    elif pa.types.is_floating(t) and _plain_floats(column):
+        # in this range Arrow writes the same digits as repr(), but 3.0 as "3"
+        column = pc.if_else(pc.is_nan(column), None, column)
+        out = column.cast(pa.string())
+        whole = pc.match_substring_regex(out, r"^-?[0-9]+$")
+        out = pc.if_else(whole, pc.binary_join_element_wise(out, ".0", ""), out)
+    elif pa.types.is_floating(t) or pa.types.is_temporal(t):
+        # pandas' own formatting: repr() floats (1e-05, 1e+20), datetimes without a "T" and dates-only
+        # columns without a time
+        series = column.to_pandas()
+        mask = series.isna().to_numpy()
+        text = series.to_numpy().astype(str) if pa.types.is_floating(t) else series.astype(str).to_numpy()
+        out = pa.array(text, type=pa.string(), mask=mask)
+    return pc.fill_null(out, "") if out.null_count else out
+
+
+def _needs_quotes(column):
+    """
+    Returns the mask of the string values that need quoting, or None if none does. Each chunk's data
+    buffer is searched first as a single binary value (no copy), so columns without any special
+    character skip the per-value match.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    chunks = column.chunks if isinstance(column, pa.ChunkedArray) else [column]
+    if not any(pc.any(pc.match_substring_regex(_whole_buffer(c), _NEEDS_QUOTES)).as_py() for c in chunks):
+        return None
+    quote = pc.match_substring_regex(column, _NEEDS_QUOTES)
+    return quote if pc.any(quote).as_py() else None
+
+
+def _whole_buffer(chunk):
+    # the values of a string array, viewed as one large_binary value over its data buffer
+    import pyarrow as pa
+    data, begin, end = _value_bytes(chunk)
+    offsets = pa.py_buffer(np.array([begin, end], dtype=np.int64))
+    return pa.Array.from_buffers(pa.large_binary(), 1, [None, offsets, data or pa.py_buffer(b"")])
+
+
+def _value_bytes(chunk):
+    """
+    Returns (data buffer, begin, end): the values of a (large_)string array are contiguous in its data
+    buffer, between these byte positions.
+    """
+    import pyarrow as pa
+    if not len(chunk):
+        return None, 0, 0
+    dtype = np.int64 if pa.types.is_large_string(chunk.type) or pa.types.is_large_binary(chunk.type) else np.int32
+    offsets = np.frombuffer(chunk.buffers()[1], dtype=dtype)
+    return chunk.buffers()[2], int(offsets[chunk.offset]), int(offsets[chunk.offset + len(chunk)])
+
+
+def _slices(table):
+    """
+    Cuts a table into row slices of at most `SLICE_ROWS` rows and about `SLICE_BYTES` (none for an
+    empty table).
+    """
+    rows = SLICE_ROWS
+    if table.nbytes > SLICE_BYTES:
+        rows = min(rows, max(1, int(len(table) * SLICE_BYTES / table.nbytes)))
+    if len(table) <= rows:
+        return [table] if len(table) else []
+    return [table.slice(start, rows) for start in range(0, len(table), rows)]
+
+
+def _plain_floats(column):
+    """
+    True if every value of a float column is 0, NaN or null, or has a magnitude in [1e-4, 1e9), where
+    repr() and Arrow both write positional notation.
+    """
+    import pyarrow.compute as pc
+    magnitude = pc.abs(column)
+    plain = pc.or_kleene(pc.and_(pc.greater_equal(magnitude, 1e-4), pc.less(magnitude, 1e9)),
+                         pc.or_(pc.equal(magnitude, 0), pc.is_nan(column)))
+    return pc.all(plain).as_py() is not False
+
+
+def _fill_empty(column, value):
+    import pyarrow.compute as pc
+    return pc.if_else(pc.equal(column, ""), value, column)
+
+
+def _buffer_bytes(lines):
+    """
+    Returns the concatenated values of a (large_)string array: the rows of each chunk are contiguous in
+    its data buffer, so a chunk is one slice of it.
+    """
+    import pyarrow as pa
+    chunks = lines.chunks if isinstance(lines, pa.ChunkedArray) else [lines]
+    out = []
+    for chunk in chunks:
+        data, begin, end = _value_bytes(chunk)
+        if end > begin:
+            out.append(data.slice(begin, end - begin).to_pybytes())
+    return out[0] if len(out) == 1 else b"".join(out)
+
+
+def _csv_header(names):
+    # pyarrow quotes every header name; write it the way pandas/csv do (quoted only when needed)
+    line = io.StringIO()
+    csv.writer(line, lineterminator="\n").writerow(names)
+    return line.getvalue().encode("utf-8")
+
+
+def _json_default(value):
+    if hasattr(value, "item"):
+        return value.item()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _encode_value(value):
+    if value is None or (isinstance(value, float) and not math.isfinite(value)):
+        return "null"
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if hasattr(value, "isoformat"):
+        return "null" if value != value else encode_basestring(value.isoformat())
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+
+
+def _json_fragments(column):
+    """
+    Renders an Arrow column to a string array of JSON values.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    t = column.type
+    if pa.types.is_timestamp(t):
+        column, t = pc.strftime(column, format="%Y-%m-%dT%H:%M:%S"), pa.string()
+    elif pa.types.is_date(t):
+        column, t = column.cast(pa.string()), pa.string()
+    if pa.types.is_large_string(t):
+        column, t = column.cast(pa.string()), pa.string()
+
+    if pa.types.is_string(t) and not pc.any(pc.match_substring_regex(column, _NEEDS_ESCAPE)).as_py():
+        out = pc.binary_join_element_wise('"', column, '"', "")
+    elif pa.types.is_integer(t) or pa.types.is_boolean(t):
+        out = column.cast(pa.string())
+    elif pa.types.is_floating(t):
+        column = pc.if_else(pc.is_finite(column), column, None)
+        out = column.cast(pa.string())
+        # Arrow renders 3.0 as "3"; keep it a float literal like json.dumps does
+        whole = pc.match_substring_regex(out, r"^-?[0-9]+$")
+        out = pc.if_else(whole, pc.binary_join_element_wise(out, ".0", ""), out)
+    else:
+        out = pa.array([_encode_value(v) for v in column.to_pylist()], type=pa.string())
+    return pc.fill_null(out, "null")
+
+
+def _arrow_lines(table):
+    return b"".join(_json_rows(render_text(part)) for part in _slices(table))
+
+
+def _json_rows(table):
+    import pyarrow.compute as pc
+    parts = ["{"]
+    for i, name in enumerate(table.column_names):
+        parts.append(("," if i else "") + encode_basestring(str(name)) + ":")
+        parts.append(_json_fragments(table.column(name)))
+    parts.append("}\n")
+    return _buffer_bytes(pc.binary_join_element_wise(*parts, ""))
+
+
+def _python_lines(df):
+    names = [encode_basestring(str(c)).replace("%", "%%") for c in df.columns]
+    template = "{" + ",".join(name + ":%s" for name in names) + "}\n"
+    columns = [[_encode_value(v) for v in df[c].tolist()] for c in df.columns]
+    return "".join(map(template.__mod__, zip(*columns))).encode("utf-8")
+
+
+def ndjson_bytes(chunk):
+    """
+    Serializes a chunk to UTF-8 JSON lines (one object per row, keys in column order).
+    """
+    if not len(chunk):
+        return b""
+    table = to_arrow(chunk)
+    if table is None:
+        return _python_lines(chunk)
+    return _arrow_lines(table)
@@ -0,0 +1,62 @@
+"""
+`unique: true` fields. Values are derived from the row's position in the dataset (the `offset` of
+its chunk plus its index in the chunk) instead of being deduplicated after the fact, so chunks,
+streams and parallel shards generated independently never collide and no state is kept:
+
+- int: a keyed permutation of [min, max] (a Feistel network with cycle walking), so the values
+  look random but row `i` always gets a different value than any other row;
+- email, user_name: the drawn user name gets the row number as a suffix ("jane.doe.1042@...");
+- uuid: random version 4 UUIDs are unique by construction (122 random bits).
+"""
+import hashlib
+import numpy as np
+
+UNIQUE_TYPES = ["uuid", "int", "email", "user_name"]
+ROUNDS = 4
+
+
+def field_key(name):
+    """
+    Returns the round keys of the permutation for field `name` (the same in every chunk and shard).
+    """
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest()
+    return np.random.SeedSequence(int.from_bytes(digest, "little")).generate_state(ROUNDS, np.uint64)
+
+
+def _mix(values, key):
+    # splitmix64 finalizer: uint64 arithmetic wraps around
+    x = values ^ key
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _feistel(values, half, keys):
+    shift, mask = np.uint64(half), np.uint64((1 << half) - 1)
+    left, right = values >> shift, values & mask
+    for key in keys:
+        left, right = right, left ^ (_mix(right, key) & mask)
+    return (left << shift) | right
+
+
+def permute(index, size, keys):
+    """
+    Maps row indices in [0, size) to distinct values in [0, size): a Feistel permutation of the
+    smallest even-bit domain holding `size`, applied again to values that fall outside (cycle walking).
+    """
+    half = max(1, (int(size - 1).bit_length() + 1) // 2)
+    size = np.uint64(size)
+    out = _feistel(np.asarray(index, dtype=np.uint64), half, keys)
+    outside = np.flatnonzero(out >= size)
+    while len(outside):
+        out[outside] = _feistel(out[outside], half, keys)
+        outside = outside[out[outside] >= size]
+    return out
+
+
+def row_suffixed(values, offset, sep="."):
+    """
+    Appends the 1-based row number of each value (the first one is row `offset` + 1): "jane" -> "jane.1042".
+    """
+    rows = np.arange(offset + 1, offset + len(values) + 1).astype(str)
+    return np.char.add(np.char.add(np.asarray(values, dtype=str), sep), rows)
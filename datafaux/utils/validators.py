@@ -11,4 +11,17 @@ def validate_schema(doc):
     if "fields" in doc:
         if not isinstance(doc["fields"], list):
             return False, "The 'fields' field must be a list of definitions."
+        for f in doc["fields"]:
+            if not isinstance(f, dict) or not f.get("name"):
+                return False, f"Each field must be a mapping with a 'name' (got {f!r})."
+    if doc["type"] == "relational":
+        tables = doc.get("tables")
+        if not isinstance(tables, list) or not tables:
+            return False, "A relational schema must include a non-empty 'tables' list."
+        for t in tables:
+            if not isinstance(t, dict) or not t.get("name"):
+                return False, f"Each table must be a mapping with a 'name' (got {t!r})."
+            ok, msg = validate_schema({"type": t["name"], "fields": t.get("fields") or []})
+            if not ok:
+                return False, f"Table '{t['name']}': {msg}"
     return True, "OK"
\ No newline at end of file
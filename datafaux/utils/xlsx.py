@@ -0,0 +1,218 @@
+"""
+Streaming .xlsx writer: rows are rendered straight to SpreadsheetML (inline strings, no shared string
+table) and deflated into the zip package as they come, so memory stays bounded by one batch
+of rows whatever the size of the workbook. openpyxl's write-only mode does the same through a Python
+object per cell and is an order of magnitude slower.
+
+A sheet holds at most `EXCEL_MAX_ROWS` rows including its header; `XlsxWriter` rolls over to a new
+sheet (Sheet1, Sheet2, ...) when one is full.
+"""
+import json
+import math
+import re
+import zipfile
+
+EXCEL_MAX_ROWS = 1048576
+# rows rendered to XML at a time
+BATCH_ROWS = 10000
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_XML_HEAD = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+# characters XML 1.0 can't hold (Excel would refuse the file); dropped from strings
+_ILLEGAL = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+# the same without NUL, which separates the values of a column while they are escaped together
+_ILLEGAL_BUT_NUL = re.compile("[\x01-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+
+def column_letters(count):
+    """
+    Returns the Excel column names of the first `count` columns: A, B, ..., Z, AA, AB, ...
+    """
+    letters = []
+    for i in range(count):
+        name = ""
+        i += 1
+        while i:
+            i, rest = divmod(i - 1, 26)
+            name = chr(65 + rest) + name
+        letters.append(name)
+    return letters
+
+
+def _escape(value):
+    value = value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return _ILLEGAL.sub("", value) if _ILLEGAL.search(value) else value
+
+
+def _escape_all(values):
+    """
+    Escapes a list of strings at once: joined by NUL, escaped with a few whole-string replaces, split.
+    """
+    if not values:
+        return []
+    joined = "\x00".join(values)
+    if joined.count("\x00") != len(values) - 1:
+        return [_escape(value) for value in values]
+    for char, entity in (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;")):
+        if char in joined:
+            joined = joined.replace(char, entity)
+    if _ILLEGAL_BUT_NUL.search(joined):
+        joined = _ILLEGAL_BUT_NUL.sub("", joined)
+    return joined.split("\x00")
+
+
+def _text(value):
+    return f'<is><t xml:space="preserve">{_escape(value)}</t></is>'
+
+
+def _cell(ref, value):
+    """
+    Renders one cell; None and NaN are left empty, like `DataFrame.to_excel` does.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return f'<c r="{ref}" t="inlineStr">{_text(value)}</c>'
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, int):
+        return f'<c r="{ref}"><v>{value}</v></c>'
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ""
+        if math.isinf(value):
+            return f'<c r="{ref}" t="inlineStr">{_text(str(value))}</c>'
+        return f'<c r="{ref}"><v>{value!r}</v></c>'
+    if isinstance(value, (list, dict)):
+        return f'<c r="{ref}" t="inlineStr">{_text(json.dumps(value, ensure_ascii=False, default=str))}</c>'
+    if hasattr(value, "item"):
+        return _cell(ref, value.item())
+    if value != value:  # pd.NA, NaT
+        return ""
+    return f'<c r="{ref}" t="inlineStr">{_text(str(value))}</c>'
+
+
+def _string_cells(letter, first, values):
+    # fast path for columns holding only strings
+    return [f'<c r="{letter}{row}" t="inlineStr"><is><t xml:space="preserve">{value}</t></is></c>'
+            for row, value in enumerate(_escape_all(values), first)]
+
+
+def render_rows(columns, values, first):
+    """
+    Renders rows of `values` (one list per column) as <row> elements numbered from `first`.
+    """
+    n = len(values[0]) if values else 0
+    cells = []
+    for letter, column in zip(columns, values):
+        if all(type(v) is str for v in column):
+            cells.append(_string_cells(letter, first, column))
+        else:
+            cells.append([_cell(f"{letter}{row}", v) for row, v in enumerate(column, first)])
+    return "".join(f'<row r="{row}">{"".join(row_cells)}</row>'
+                   for row, *row_cells in zip(range(first, first + n), *cells))
+
+
+class XlsxWriter:
+    """
+    Writes rows (as columns of Python values) into a new .xlsx file, sheet after sheet.
+    `max_rows` is the row limit of a sheet, header included.
+    """
+
+    def __init__(self, path, sheet_name="Sheet", max_rows=EXCEL_MAX_ROWS, compression_level=1):
+        if max_rows < 2:
+            raise ValueError("max_rows must leave room for the header and at least one row")
+        if not sheet_name or len(sheet_name) > 24 or re.search(r"[\[\]:*?/\\&<>\"']", sheet_name):
+            raise ValueError(f"Invalid sheet name '{sheet_name}' (up to 24 characters, no []:*?/\\&<>'\")")
+        self.zip = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, compresslevel=compression_level)
+        self.sheet_name = sheet_name
+        self.max_rows = max_rows
+        self.header = None
+        self.letters = None
+        self.sheets = []
+        self.fh = None
+        self.row = 0
+
+    def _open_sheet(self):
+        self._close_sheet()
+        self.sheets.append(f"{self.sheet_name}{len(self.sheets) + 1}")
+        self.fh = self.zip.open(f"xl/worksheets/sheet{len(self.sheets)}.xml", "w", force_zip64=True)
+        self.fh.write(f'{_XML_HEAD}<worksheet xmlns="{_MAIN_NS}"><sheetData>'.encode("utf-8"))
+        self.fh.write(render_rows(self.letters, [[name] for name in self.header], 1).encode("utf-8"))
+        self.row = 1
+
+    def _close_sheet(self):
+        if self.fh is not None:
+            self.fh.write(b"</sheetData></worksheet>")
+            self.fh.close()
+            self.fh = None
+
+    def write(self, header, columns):
+        """
+        Appends rows given as `columns` (lists of equal length) under `header` (the column names).
+        """
+        if self.header is None:
+            self.header = [str(name) for name in header]
+            self.letters = column_letters(len(self.header))
+        n = len(columns[0]) if columns else 0
+        start = 0
+        while start < n:
+            if self.fh is None or self.row >= self.max_rows:
+                self._open_sheet()
+            take = min(n - start, self.max_rows - self.row, BATCH_ROWS)
+            batch = [column[start:start + take] for column in columns]
+            self.fh.write(render_rows(self.letters, batch, self.row + 1).encode("utf-8"))
+            self.row += take
+            start += take
+
+    def close(self):
+        if self.zip is None:
+            return
+        if not self.sheets:
+            self.header = self.header or []
+            self.letters = self.letters or []
+            self._open_sheet()
+        self._close_sheet()
+        sheets = range(1, len(self.sheets) + 1)
+        overrides = "".join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+            f'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for i in sheets)
+        self.zip.writestr("[Content_Types].xml", (
+            f'{_XML_HEAD}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            f'{overrides}</Types>'))
+        self.zip.writestr("_rels/.rels", (
+            f'{_XML_HEAD}<Relationships xmlns="{_PKG_REL_NS}"><Relationship Id="rId1" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+            'Target="xl/workbook.xml"/></Relationships>'))
+        sheet_entries = "".join(f'<sheet name="{name}" sheetId="{i}" r:id="rId{i}"/>'
+                                for i, name in zip(sheets, self.sheets))
+        self.zip.writestr("xl/workbook.xml", (
+            f'{_XML_HEAD}<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}"><sheets>{sheet_entries}</sheets>'
+            '</workbook>'))
+        rels = "".join(
+            f'<Relationship Id="rId{i}" Type="{_REL_NS}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+            for i in sheets)
+        rels += f'<Relationship Id="rId{len(self.sheets) + 1}" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+        self.zip.writestr("xl/_rels/workbook.xml.rels",
+                          f'{_XML_HEAD}<Relationships xmlns="{_PKG_REL_NS}">{rels}</Relationships>')
+        self.zip.writestr("xl/styles.xml", (
+            f'{_XML_HEAD}<styleSheet xmlns="{_MAIN_NS}">'
+            '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+            '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+            '<fill><patternFill patternType="gray125"/></fill></fills>'
+            '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+            '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+            '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+            '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+            '</styleSheet>'))
+        self.zip.close()
+        self.zip = None
@@ -11,7 +11,7 @@ setup(
         "pyyaml",
         "click",
         "openpyxl",
-        "pyarrow",
+        "pyarrow>=18",
         "fastparquet",
     ],
     entry_points={
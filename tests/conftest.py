@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def pool_cache(tmp_path_factory):
+    """
+    Keeps the value pools the tests build out of the user's ~/.cache, and small enough to build quickly.
+    Tests may still override both variables with `monkeypatch.setenv`.
+    """
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("DATAFAUX_CACHE_DIR", str(tmp_path_factory.mktemp("pools")))
+        patch.setenv("DATAFAUX_POOL_SIZE", "500")
+        yield
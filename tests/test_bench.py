@@ -0,0 +1,44 @@
+import json
+import subprocess
+from datafaux.bench import CASES, run_benchmarks, compare
+
+
+def test_all_cases_run():
+    report = run_benchmarks(sizes=[20], isolate=False)
+    assert {r["case"] for r in report["results"]} == set(CASES)
+    assert all(r["rows_per_sec"] > 0 and r["rss_growth_mb"] >= 0 for r in report["results"])
+    # the process high-water mark includes earlier cases, so it is only reported for isolated runs
+    assert all(r["peak_rss_mb"] is None for r in report["results"])
+
+
+def test_compare_flags_regressions():
+    base = {"results": [{"case": "people", "rows": 10, "rows_per_sec": 1000.0}]}
+    slow = {"results": [{"case": "people", "rows": 10, "rows_per_sec": 500.0}]}
+    assert compare(slow, base, threshold=0.2)[0]["regression"]
+    assert not compare(base, base)[0]["regression"]
+
+
+def test_cli_bench(tmp_path):
+    out = tmp_path / "bench.json"
+    result = subprocess.run([
+        "python", "-m", "datafaux.main", "bench", "--case", "people_columnar", "--sizes", "50", "--out", str(out)
+    ], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    report = json.loads(out.read_text())
+    assert report["results"][0]["case"] == "people_columnar"
+    assert report["results"][0]["peak_rss_mb"] > 0 and report["results"][0]["rss_growth_mb"] >= 0
+
+
+def test_cli_import_is_lazy():
+    code = "import sys, datafaux.cli; print(sorted({'pandas', 'faker', 'yaml', 'pyarrow'} & set(sys.modules)))"
+    result = subprocess.run(["python", "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_startup_times_report_budget():
+    from datafaux.bench import startup_times, STARTUP_COMMANDS
+    results = startup_times(repeat=1, budget={"help": 60})
+    assert [r["command"] for r in results] == list(STARTUP_COMMANDS)
+    assert results[0]["budget_seconds"] == 60 and not results[0]["over_budget"]
+    assert all(r["seconds"] > 0 for r in results)
@@ -0,0 +1,64 @@
+import json
+import pytest
+from datafaux.modes.checkpoint import manifest_path
+from datafaux.modes.streaming import generate_stream, people_stream
+from datafaux.modes.testers import inject_errors_stream
+
+
+def crash_at(index):
+    def transform(chunks, start=0, **kwargs):
+        for i, chunk in enumerate(inject_errors_stream(chunks, start=start, **kwargs), start):
+            if i == index:
+                raise RuntimeError("simulated crash")
+            yield chunk
+    return transform
+
+
+@pytest.mark.parametrize("fmt", ["csv", "json"])
+def test_resume_matches_uninterrupted_run(tmp_path, fmt):
+    kwargs = dict(count=500, chunksize=60, fmt=fmt, seed=11)
+    full, part = tmp_path / f"full.{fmt}", tmp_path / f"part.{fmt}"
+    generate_stream(people_stream, str(full), checkpoint=manifest_path(full), transform=inject_errors_stream,
+                    **kwargs)
+
+    with pytest.raises(RuntimeError):
+        generate_stream(people_stream, str(part), checkpoint=manifest_path(part), transform=crash_at(4),
+                        checkpoint_every=0, **kwargs)
+    manifest = json.loads((tmp_path / f"part.{fmt}.checkpoint.json").read_text())
+    assert manifest["chunks"] == 4 and manifest["rows"] == 240
+    with open(part, "ab") as f:
+        f.write(b"half a chunk")
+
+    generate_stream(people_stream, str(part), checkpoint=manifest_path(part), resume=True,
+                    transform=inject_errors_stream, **kwargs)
+    assert part.read_bytes() == full.read_bytes()
+    assert not (tmp_path / f"part.{fmt}.checkpoint.json").exists()
+    assert not (tmp_path / f"full.{fmt}.checkpoint.json").exists()
+
+
+def test_checkpoint_commits_every_n_bytes(tmp_path):
+    out = tmp_path / "out.csv"
+    with pytest.raises(RuntimeError):
+        generate_stream(people_stream, str(out), count=500, chunksize=50, seed=3, checkpoint=manifest_path(out),
+                        transform=crash_at(7), checkpoint_every=10000)
+    manifest = json.loads((tmp_path / "out.csv.checkpoint.json").read_text())
+    # commits land on chunk boundaries once 10 kB were written since the last one
+    assert 0 < manifest["chunks"] < 7 and manifest["rows"] == manifest["chunks"] * 50
+    assert manifest["bytes"] <= out.stat().st_size
+
+
+def test_resume_rejects_changed_options(tmp_path):
+    out = tmp_path / "out.csv"
+    with pytest.raises(RuntimeError):
+        generate_stream(people_stream, str(out), count=100, chunksize=50, seed=1, checkpoint=manifest_path(out),
+                        transform=crash_at(1), checkpoint_every=0)
+    with pytest.raises(ValueError, match="chunksize"):
+        generate_stream(people_stream, str(out), count=100, chunksize=25, seed=1, checkpoint=manifest_path(out),
+                        resume=True)
+
+
+def test_fresh_checkpointed_run_overwrites(tmp_path):
+    out = tmp_path / "out.csv"
+    for _ in range(2):
+        generate_stream(people_stream, str(out), count=100, chunksize=50, checkpoint=manifest_path(out))
+    assert len(out.read_text().splitlines()) == 101
@@ -40,3 +40,45 @@ def test_cli_ecommerce_with_customers():
         assert os.path.exists(out_path)
         df = pd.read_csv(out_path)
         assert "customer_id" in df.columns
+
+
+def test_cli_ecommerce_with_empty_customers(tmp_path):
+    customers_path = tmp_path / "customers.csv"
+    customers_path.write_text("customer_id,name,email\n")
+    result = subprocess.run([
+        "python", "-m", "datafaux.main", "generate",
+        "--preset", "ecommerce",
+        "--count", "5",
+        "--out", str(tmp_path / "orders.csv"),
+        "--customers-file", str(customers_path)
+    ], capture_output=True, text=True)
+    assert result.returncode == 1
+    assert "[Error]" in result.stdout and "holds no customers" in result.stdout and "Tip:" in result.stdout
+
+
+def test_cli_verbose_echoes_options(tmp_path):
+    result = subprocess.run([
+        "python", "-m", "datafaux.main", "generate",
+        "--preset", "people", "--count", "5", "--out", str(tmp_path / "people.csv.gz"),
+        "--compression", "gzip", "--pipeline", "--engine", "columnar", "--verbose"
+    ], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    options = next(line for line in result.stdout.splitlines() if line.startswith("[Verbose] Options"))
+    for option in ("engine=columnar", "workers=1", "pipeline=True", "compression=gzip", "partition_by=[]",
+                   "profile=False", "items_out=None", "queue_size=4", "row_group_size=None",
+                   "parquet_compression=snappy", "inject_errors=False", "profile_out=None"):
+        assert option in options
+
+
+def test_cli_streaming_rerun_overwrites(tmp_path):
+    import gzip
+    for name, read in (("people.csv", lambda p: p.read_text()),
+                       ("people.csv.gz", lambda p: gzip.decompress(p.read_bytes()).decode())):
+        out = tmp_path / name
+        for _ in range(2):
+            result = subprocess.run([
+                "python", "-m", "datafaux.main", "generate",
+                "--preset", "people", "--count", "5", "--mode", "streaming", "--seed", "1", "--out", str(out)
+            ], capture_output=True, text=True)
+            assert result.returncode == 0, result.stderr
+        assert len(read(out).splitlines()) == 6
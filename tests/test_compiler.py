@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+import yaml
+from datafaux.generators import people, ecommerce
+from datafaux.generators.compiler import compile_schema
+
+
+def load(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def test_compile_people_schema():
+    plan = compile_schema(load("examples/people_schema.yaml"))
+    df = plan.generate(count=30, seed=1)
+    assert list(df.columns) == ["person_id", "name", "email", "phone", "age", "registered_at"]
+    assert df["age"].between(18, 90).all()
+    assert plan is compile_schema(load("examples/people_schema.yaml"))
+
+
+def test_ecommerce_schema_is_honoured():
+    df = ecommerce.generate_from_schema(load("examples/ecommerce_schema.yaml"), count=10, seed=1)
+    assert list(df.columns) == ["order_id", "customer_id", "order_date", "total", "currency", "items"]
+    assert df["currency"].isin(["EUR", "USD", "ARS"]).all()
+    assert all(1 <= len(items) <= 4 and {"sku", "qty"} <= set(items[0]) for items in df["items"])
+
+
+def test_plan_batches_any_type():
+    plan = compile_schema({"type": "inventory", "fields": [{"name": "code", "type": "uuid"},
+                                                           {"name": "label", "type": "mystery"}]})
+    chunks = list(plan.batches(count=25, chunksize=10, seed=3))
+    assert [len(c) for c in chunks] == [10, 10, 5]
+    assert isinstance(pd.concat(chunks).iloc[0]["label"], str)
+
+
+def test_people_from_schema_reproducible():
+    schema = load("examples/people_schema.yaml")
+    a = people.generate_from_schema(schema, count=10, seed=5)
+    b = people.generate_from_schema(schema, count=10, seed=5)
+    assert a.drop(columns=["registered_at"]).equals(b.drop(columns=["registered_at"]))
+
+
+def test_invalid_field_rejected():
+    with pytest.raises(ValueError):
+        compile_schema({"type": "people", "fields": [{"name": "n", "type": "int", "min": 5, "max": 1}]})
+
+
+def test_arrow_plan_uses_compact_types():
+    import pyarrow as pa
+    from datafaux.utils.arrow_columns import render_text
+    plan = compile_schema({"type": "t", "fields": [
+        {"name": "id", "type": "uuid"},
+        {"name": "n", "type": "int", "min": 0, "max": 100},
+        {"name": "at", "type": "datetime"},
+        {"name": "status", "type": "enum", "values": ["new", "paid"]},
+        {"name": "city", "type": "city"},
+    ]})
+    table = plan.generate(count=50, seed=9, arrow=True)
+    types = {f.name: f.type for f in table.schema}
+    assert types["id"].extension_name == "arrow.uuid"
+    assert types["n"] == pa.int8()
+    assert types["at"] == pa.timestamp("s")
+    assert pa.types.is_dictionary(types["status"]) and pa.types.is_dictionary(types["city"])
+    df = plan.generate(count=50, seed=9)
+    assert render_text(table).to_pandas().astype(object).equals(df.astype(object))
+
+
+def test_yaml_dates_and_bad_date_specs():
+    schema = yaml.safe_load("type: t\nfields:\n  - {name: at, type: datetime, start: 2023-01-01, end: 2023-01-31}\n"
+                            "  - {name: ts, type: datetime, start: 1672531200, end: 2023-01-01}\n")
+    df = compile_schema(schema).generate(count=50, seed=1)
+    assert df["at"].between("2023-01-01T00:00:00", "2023-01-31T00:00:00").all()
+    # ints are absolute unix timestamps, like Faker: 1672531200 is 2023-01-01T00:00:00Z
+    assert (df["ts"] == "2023-01-01T00:00:00").all()
+    with pytest.raises(ValueError, match="invalid 'start'"):
+        compile_schema({"type": "t", "fields": [{"name": "at", "type": "datetime", "start": "2023-01-01"}]})
@@ -0,0 +1,48 @@
+import bz2
+import gzip
+import pandas as pd
+import pyarrow as pa
+import pytest
+from datafaux.utils.compression import CompressedWriter, infer_compression, resolve_compression
+from datafaux.utils.exporters import open_sink, save_df
+
+
+def decompress(path, codec):
+    if codec == "gzip":
+        return gzip.open(path).read()
+    if codec == "bz2":
+        return bz2.open(path).read()
+    with pa.CompressedInputStream(pa.OSFile(str(path)), "zstd") as f:
+        return f.read()
+
+
+def test_infer_compression():
+    assert infer_compression("out.csv.gz") == "gzip"
+    assert infer_compression("out.ndjson.zst") == "zstd"
+    assert infer_compression("out.csv.bz2") == "bz2"
+    assert infer_compression("out.csv") is None
+    with pytest.raises(ValueError):
+        resolve_compression("lzma", "out.csv")
+
+
+@pytest.mark.parametrize("codec", ["gzip", "bz2", "zstd"])
+def test_block_parallel_writer_roundtrip(tmp_path, codec):
+    data = b"".join(b"%d,row %d\n" % (i, i) for i in range(20000))
+    out = tmp_path / "blocks.bin"
+    with CompressedWriter(open(out, "wb"), codec, block_size=4096, threads=3) as w:
+        for i in range(0, len(data), 1000):
+            w.write(data[i:i + 1000])
+    assert decompress(out, codec) == data
+
+
+def test_compressed_outputs_inferred_from_extension(tmp_path):
+    df = pd.DataFrame({"a": range(500), "b": ["x"] * 500})
+    save_df(df, str(tmp_path / "out.csv.gz"), "csv")
+    assert pd.read_csv(tmp_path / "out.csv.gz").equals(df)
+    save_df(df, str(tmp_path / "out.json.bz2"), "json")
+    assert pd.read_json(tmp_path / "out.json.bz2")["a"].tolist() == list(range(500))
+    out = tmp_path / "out.ndjson.zst"
+    with open_sink(str(out), "json") as sink:
+        for i in range(0, 500, 100):
+            sink.write(df.iloc[i:i + 100])
+    assert len(decompress(out, "zstd").splitlines()) == 500
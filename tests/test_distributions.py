@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+from datafaux.generators.compiler import compile_schema
+from datafaux.generators.relational import compile_relational
+
+
+def load(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def batches(fields, count=20000, chunksize=3000):
+    plan = compile_schema({"type": "t", "fields": fields})
+    return pd.concat(plan.batches(count=count, chunksize=chunksize, seed=1), ignore_index=True)
+
+
+def test_numeric_distributions_are_clipped():
+    df = batches([
+        {"name": "age", "type": "int", "min": 18, "max": 90, "distribution": "normal", "mean": 40, "std": 12},
+        {"name": "amount", "type": "float", "distribution": "lognormal", "mean": 3.0, "sigma": 0.5, "decimals": 1},
+        {"name": "visits", "type": "int", "distribution": "poisson", "mean": 3},
+    ])
+    assert df["age"].between(18, 90).all() and abs(df["age"].mean() - 40) < 1
+    assert df["amount"].min() > 0 and df["amount"].median() == pytest.approx(np.exp(3.0), rel=0.05)
+    assert df["visits"].mean() == pytest.approx(3, rel=0.05)
+
+
+def test_skewed_categoricals():
+    df = batches([
+        {"name": "sku", "type": "enum", "values": ["A", "B", "C", "D"], "distribution": "zipf", "exponent": 1.0},
+        {"name": "tier", "type": "enum", "values": ["free", "pro"], "weights": [9, 1]},
+        {"name": "rank", "type": "int", "min": 1, "max": 1000, "distribution": "zipf"},
+    ])
+    share = df["sku"].value_counts(normalize=True)
+    assert list(share.index) == ["A", "B", "C", "D"]
+    assert share["A"] == pytest.approx(1 / (1 + 1 / 2 + 1 / 3 + 1 / 4), abs=0.02)
+    assert df["tier"].value_counts(normalize=True)["free"] == pytest.approx(0.9, abs=0.01)
+    assert df["rank"].value_counts().index[0] == 1
+
+
+def test_poisson_arrivals_are_ordered_across_chunks():
+    field = {"name": "at", "type": "datetime", "start": "-30d", "distribution": "poisson", "rate": 2,
+             "per": "minute"}
+    at = pd.to_datetime(batches([field], count=6000, chunksize=1000)["at"])
+    assert at.is_monotonic_increasing
+    assert (at.iloc[-1] - at.iloc[0]).total_seconds() == pytest.approx(6000 * 30, rel=0.01)
+
+
+def test_relational_zipf_refs_and_normal_cardinality():
+    schema = load("examples/relational_schema.yaml")
+    for table in schema["tables"]:
+        if table["name"] == "order_items":
+            table["parent"]["per"] = {"distribution": "normal", "mean": 3, "std": 1}
+            for field in table["fields"]:
+                if field["type"] == "ref":
+                    field["distribution"] = "zipf"
+    plan = compile_relational(schema)
+    items = pd.concat(chunk for name, chunk in plan.batches(count=500, chunksize=100, seed=2) if name == "order_items")
+    assert items["product_id"].value_counts().index[0] == 1
+    assert items.groupby("order_id").size().mean() == pytest.approx(3, rel=0.1)
+
+
+@pytest.mark.parametrize("field", [
+    {"type": "int", "distribution": "gauss"},
+    {"type": "float", "distribution": "normal", "std": -1},
+    {"type": "enum", "values": ["a"], "weights": [1, 2]},
+    {"type": "city", "distribution": "normal"},
+    {"type": "datetime", "distribution": "poisson", "rate": 0},
+])
+def test_invalid_distributions_rejected(field):
+    with pytest.raises(ValueError):
+        compile_schema({"type": "t", "fields": [dict(field, name="x")]})
+
+
+def test_example_schema_compiles():
+    df = compile_schema(load("examples/load_test_schema.yaml")).generate(count=50, seed=1)
+    assert len(df) == 50 and df["customer_rank"].between(1, 10000).all()
@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+from datetime import datetime
+from datafaux.generators import ecommerce
+from datafaux.modes.parallel import generate_parallel
+
+NOW = datetime(2024, 1, 1)
+
+
+def test_generate_tables():
+    orders, items = ecommerce.generate_tables(count=50, seed=1, now=NOW)
+    assert len(orders) == 50
+    assert "items" not in orders.columns
+    assert set(items["order_id"]) == set(orders["order_id"])
+    assert items.groupby("order_id")["line"].max().between(1, 4).all()
+    line_totals = (items["unit_price"] * items["qty"]).groupby(items["order_id"]).sum().round(2)
+    assert (orders.set_index("order_id")["total"] - line_totals).abs().max() < 1e-9
+
+
+def test_generate_default_keeps_nested_items():
+    customers = pd.DataFrame([{"customer_id": str(i), "name": "n", "email": "e"} for i in range(10)])
+    df = ecommerce.generate_default(count=20, customers_df=customers, seed=2, now=NOW)
+    assert list(df.columns) == ["order_id", "customer_id", "order_date", "items", "total", "currency"]
+    assert df["customer_id"].isin(customers["customer_id"]).all()
+    first = df.iloc[0]
+    assert round(sum(i["unit_price"] * i["qty"] for i in first["items"]), 2) == first["total"]
+
+
+def test_generate_tables_parallel():
+    orders, items = generate_parallel(ecommerce.generate_tables, 30, workers=2, seed=1, now=NOW)
+    assert len(orders) == 30
+    assert set(items["order_id"]) == set(orders["order_id"])
+
+
+def test_generate_tables_without_customers():
+    empty = pd.DataFrame(columns=["customer_id", "name", "email"])
+    with pytest.raises(ValueError, match="No customers"):
+        ecommerce.generate_tables(count=5, customers_df=empty, seed=1, now=NOW)
+    orders, items = ecommerce.generate_tables(count=0, customers_df=empty, seed=1, now=NOW)
+    assert orders.empty and items.empty
+    # fewer than 3 orders still get a generated customer
+    assert len(ecommerce.generate_tables(count=2, seed=1, now=NOW)[0]) == 2
+
+
+def test_arrow_tables_use_compact_types():
+    import pyarrow as pa
+    from datafaux.generators import health
+    from datafaux.utils.arrow_columns import render_text
+    from datafaux.utils.serializers import csv_bytes
+    orders, items = ecommerce.generate_tables(count=40, seed=3, now=NOW, arrow=True)
+    types = {f.name: f.type for f in orders.schema}
+    assert types["order_id"].extension_name == "arrow.uuid"
+    assert types["order_date"] == pa.timestamp("s")
+    assert pa.types.is_dictionary(types["currency"])
+    ref_orders, ref_items = ecommerce.generate_tables(count=40, seed=3, now=NOW)
+    assert render_text(orders).to_pandas().astype(object).equals(ref_orders.astype(object))
+    assert render_text(items).to_pandas().astype(object).equals(ref_items.astype(object))
+    nested = ecommerce.generate_default(count=40, seed=3, now=NOW)
+    assert csv_bytes(ecommerce.generate_default(count=40, seed=3, now=NOW, arrow=True)) == csv_bytes(nested)
+    patients = health.generate_default(count=20, seed=3, now=NOW, arrow=True)
+    assert pa.types.is_dictionary(patients.schema.field("gender").type)
+    ref = health.generate_default(count=20, seed=3, now=NOW)
+    assert render_text(patients).to_pandas().astype(object).equals(ref.astype(object))
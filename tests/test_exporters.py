@@ -13,4 +13,134 @@ def test_save_csv(tmp_path):
     save_df(df, str(out), "csv")
     assert out.exists()
     content = out.read_text(encoding="utf-8")
-    assert "a,b" in content
\ No newline at end of file
+    assert "a,b" in content
+
+def test_parquet_sink_single_file_row_groups(tmp_path):
+    import pyarrow.parquet as pq
+    from datafaux.utils.exporters import open_sink
+    out = tmp_path / "stream.parquet"
+    with open_sink(str(out), "parquet", row_group_size=40, compression="zstd") as sink:
+        for i in range(5):
+            sink.write(pd.DataFrame({"a": range(i * 25, (i + 1) * 25), "b": ["x"] * 25}))
+    meta = pq.ParquetFile(str(out)).metadata
+    assert meta.num_rows == 125
+    assert [meta.row_group(i).num_rows for i in range(meta.num_row_groups)] == [40, 40, 40, 5]
+    assert pd.read_parquet(out)["a"].tolist() == list(range(125))
+    assert list(tmp_path.iterdir()) == [out]
+
+def test_fast_serializers_match_pandas(tmp_path):
+    import io
+    import json
+    import pyarrow as pa
+    from datafaux.utils.serializers import csv_bytes, ndjson_bytes
+    df = pd.DataFrame({"id": [1, 2, 3], "name": ['a "quoted", name', "é/ü", None],
+                       "price": [3.0, 19.99, float("nan")], "items": [[{"q": 1}], [], [{"q": 2}]]})
+    assert csv_bytes(df).decode() == df.to_csv(index=False)
+    assert csv_bytes(pa.Table.from_pandas(df, preserve_index=False)) == csv_bytes(df)
+    # compiled schemas with array/object fields, as DataFrame and as Arrow
+    from datafaux.generators.compiler import compile_schema
+    plan = compile_schema({"type": "t", "fields": [
+        {"name": "id", "type": "uuid"},
+        {"name": "tags", "type": "array", "min_items": 0, "max_items": 3, "item": {"type": "word"}},
+        {"name": "address", "type": "object", "fields": [{"name": "city", "type": "city"},
+                                                         {"name": "zip", "type": "int", "min": 1000, "max": 9999}]},
+    ]})
+    nested = plan.generate(count=20, seed=4)
+    assert csv_bytes(nested).decode() == nested.to_csv(index=False)
+    assert csv_bytes(plan.generate(count=20, seed=4, arrow=True)).decode() == nested.to_csv(index=False)
+    assert [json.loads(line) for line in ndjson_bytes(nested).splitlines()] == \
+        [json.loads(line) for line in nested.to_json(orient="records", lines=True).splitlines()]
+    expected = [json.loads(line) for line in df.to_json(orient="records", lines=True).splitlines()]
+    assert [json.loads(line) for line in ndjson_bytes(df).splitlines()] == expected
+    # mixed-type columns (e.g. after error injection) take the fallback paths
+    mixed = pd.DataFrame({"a": [1, "N/A"], "b": [1.5, None]})
+    assert [json.loads(line) for line in ndjson_bytes(mixed).splitlines()] == [{"a": 1, "b": 1.5},
+                                                                              {"a": "N/A", "b": None}]
+    assert csv_bytes(mixed).decode() == mixed.to_csv(index=False)
+
+
+def test_csv_bytes_formats_like_pandas():
+    import pyarrow as pa
+    from datafaux.utils.serializers import csv_bytes
+    df = pd.DataFrame({
+        "whole": [3.0, 0.1, float("nan"), 1e20], "small": [1e-05, -0.0, 2.5, 1e9],
+        "when": pd.to_datetime(["2024-01-01 10:00:00", None, "2024-01-02", "2024-01-01 00:00:00.5"], format="mixed"),
+        "day": pd.to_datetime(["2024-01-01", "2024-02-01", None, "2024-03-01"]),
+        "text": ["plain", 'a "quoted", name', "", None], "n": pd.array([1, None, 3, 4], dtype="Int64"),
+        "flag": [True, False, True, False]})
+    expected = df.to_csv(index=False)
+    assert expected.splitlines()[1] == "3.0,1e-05,2024-01-01 10:00:00.000,2024-01-01,plain,1,True"
+    assert csv_bytes(df).decode() == expected
+    assert csv_bytes(pa.Table.from_pandas(df, preserve_index=False)).decode() == expected
+    assert csv_bytes(df.iloc[:0]).decode() == df.iloc[:0].to_csv(index=False)
+    # a lone empty field is quoted so the row isn't blank
+    assert csv_bytes(pd.DataFrame({"a": ["x", ""]})) == b'a\nx\n""\n'
+
+def test_sinks_accept_arrow_tables(tmp_path):
+    import pyarrow as pa
+    from datafaux.utils.exporters import open_sink
+    chunks = [pa.table({"a": [i, i + 1], "b": ["x", "y"]}) for i in (0, 2)]
+    for fmt, read in (("csv", pd.read_csv), ("json", lambda p: pd.read_json(p, lines=True)),
+                      ("parquet", pd.read_parquet)):
+        out = tmp_path / f"stream.{fmt}"
+        with open_sink(str(out), fmt) as sink:
+            for chunk in chunks:
+                sink.write(chunk)
+        assert read(out)["a"].tolist() == [0, 1, 2, 3]
+
+def test_xlsx_sink_rolls_over_sheets(tmp_path):
+    from openpyxl import load_workbook
+    from datafaux.utils.exporters import open_sink
+    df = pd.DataFrame({"n": range(25), "s": [f"a&b<{i}>" for i in range(25)],
+                       "x": [1.5, None, "bad", [1, 2], True] * 5})
+    out = tmp_path / "stream.xlsx"
+    with open_sink(str(out), "xlsx", max_rows=10) as sink:
+        sink.write(df.iloc[:7])
+        sink.write(df.iloc[7:])
+    book = load_workbook(out)
+    assert book.sheetnames == ["Sheet1", "Sheet2", "Sheet3"]
+    sheets = [list(ws.iter_rows(values_only=True)) for ws in book]
+    # every sheet repeats the header and holds at most max_rows rows in total
+    assert [len(rows) for rows in sheets] == [10, 10, 8]
+    assert all(rows[0] == ("n", "s", "x") for rows in sheets)
+    rows = [row for rows in sheets for row in rows[1:]]
+    assert [row[0] for row in rows] == list(range(25))
+    assert rows[3] == (3, "a&b<3>", "[1, 2]")
+    assert [row[2] for row in rows[:5]] == [1.5, None, "bad", "[1, 2]", True]
+
+
+def test_csv_bytes_nested_columns_like_pandas():
+    import pyarrow as pa
+    from datafaux.generators import ecommerce
+    from datafaux.utils.serializers import csv_bytes
+    orders = ecommerce.generate_default(count=20, seed=3)
+    expected = orders.to_csv(index=False).encode("utf-8")
+    assert b"}, {" in expected or b"[{" in expected
+    assert csv_bytes(orders) == expected
+    assert csv_bytes(pa.Table.from_pandas(orders, preserve_index=False)) == expected
+
+
+def test_large_outputs_written_in_slices(tmp_path, monkeypatch):
+    import json
+    import pyarrow as pa
+    from datafaux.generators import people
+    from datafaux.utils import exporters, serializers
+    df = people.generate_columnar(500, seed=7)
+    table = people.generate_columnar(500, seed=7, arrow=True)
+    whole_csv, whole_json = serializers.csv_bytes(table), serializers.ndjson_bytes(table)
+    # a few kB or 64 rows per kernel pass and 120 rows per write: the output must not change
+    monkeypatch.setattr(serializers, "SLICE_BYTES", 4096)
+    monkeypatch.setattr(serializers, "SLICE_ROWS", 64)
+    monkeypatch.setattr(exporters, "SAVE_ROWS", 120)
+    assert serializers.csv_bytes(table) == whole_csv == df.to_csv(index=False).encode("utf-8")
+    assert serializers.ndjson_bytes(table) == whole_json
+    exporters.save_df(df, str(tmp_path / "out.csv"), "csv")
+    assert (tmp_path / "out.csv").read_bytes() == whole_csv
+    exporters.save_df(table, str(tmp_path / "out.json"), "json")
+    assert json.loads((tmp_path / "out.json").read_text()) == [json.loads(l) for l in whole_json.splitlines()]
+    exporters.save_df(df.iloc[:0], str(tmp_path / "empty.json"), "json")
+    exporters.save_df(df.iloc[:0], str(tmp_path / "empty.csv"), "csv")
+    assert (tmp_path / "empty.json").read_text() == "[]"
+    assert (tmp_path / "empty.csv").read_text() == df.iloc[:0].to_csv(index=False)
+    chunks = pa.chunked_array([pa.array(["a", "b,c"], pa.large_string()), pa.array(["d"], pa.large_string())])
+    assert serializers._buffer_bytes(chunks) == b"ab,cd"
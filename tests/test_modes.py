@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 from datafaux.modes.testers import inject_errors
 from datafaux.modes.streaming import people_stream
 
@@ -6,11 +7,84 @@ from datafaux.modes.streaming import people_stream
 def test_inject_errors():
     df = pd.DataFrame([{"a": 1, "b": "x"} for _ in range(10)])
     df_err = inject_errors(df.copy(), error_rate=0.5)
-    assert df_err.isnull().sum().sum() > 0 or any(df_err.applymap(lambda x: isinstance(x, dict)).sum())
+    assert df_err.isnull().sum().sum() > 0 or any(df_err.map(lambda x: isinstance(x, dict)).sum())
 
 
 def test_people_stream():
     gen = people_stream(count=200, chunksize=50)
     chunks = list(gen)
     assert len(chunks) == 4
-    assert all(isinstance(c, pd.DataFrame) for c in chunks)
\ No newline at end of file
+    assert all(isinstance(c, pd.DataFrame) for c in chunks)
+
+def test_people_stream_columnar():
+    chunks = list(people_stream(count=120, chunksize=50, engine="columnar", seed=1))
+    assert [len(c) for c in chunks] == [50, 50, 20]
+    assert list(chunks[0].columns) == ["person_id", "name", "email", "phone", "address", "age", "registered_at"]
+
+
+def test_generate_stream_parquet(tmp_path):
+    from datafaux.modes.streaming import generate_stream
+    out = tmp_path / "people.parquet"
+    generate_stream(people_stream, str(out), count=120, chunksize=50, fmt="parquet", engine="columnar", seed=1)
+    df = pd.read_parquet(out)
+    assert len(df) == 120
+    assert "person_id" in df.columns
+
+
+def test_generate_stream_parquet_zero_rows(tmp_path):
+    import pyarrow.parquet as pq
+    from datafaux.modes.streaming import generate_stream
+    for name, options in (("plain", {}), ("grouped", {"row_group_size": 10})):
+        out = tmp_path / f"{name}.parquet"
+        generate_stream(people_stream, str(out), count=0, chunksize=50, fmt="parquet", engine="columnar", seed=1,
+                        arrow=True, sink_options=options)
+        table = pq.read_table(out)
+        assert table.num_rows == 0
+        assert table.column_names == ["person_id", "name", "email", "phone", "address", "age", "registered_at"]
+
+
+def test_preset_streams():
+    from datetime import datetime
+    from datafaux.modes.streaming import STREAMS
+    for preset, stream in STREAMS.items():
+        chunks = list(stream(count=25, chunksize=10, seed=3, now=datetime(2024, 1, 1)))
+        assert [len(c) for c in chunks] == [10, 10, 5], preset
+        again = list(stream(count=25, chunksize=10, seed=3, now=datetime(2024, 1, 1)))
+        assert pd.concat(chunks).to_csv() == pd.concat(again).to_csv(), preset
+
+
+def test_ecommerce_stream_reuses_customers():
+    from datafaux.modes.streaming import ecommerce_stream
+    customers = pd.DataFrame([{"customer_id": "c1", "name": "A", "email": "a@example.com"}])
+    chunks = list(ecommerce_stream(count=30, chunksize=10, customers_df=customers))
+    assert set(pd.concat(chunks)["customer_id"]) == {"c1"}
+
+
+def test_inject_errors_vectorized_rate_and_dtypes():
+    from datafaux.modes.testers import inject_errors
+    df = pd.DataFrame({"n": range(1000), "s": ["x"] * 1000})
+    out = inject_errors(df.copy(), error_rate=0.1, seed=1)
+    changed = (out.astype(str) != df.astype(str)).to_numpy().sum()
+    assert 0 < changed <= 200
+    assert (out["n"] == "WRONG_TYPE_INJECTED").any() and (out["s"] == "OUTLIER_VALUE").any()
+    assert inject_errors(df.copy(), error_rate=0.1, seed=1).equals(out)
+
+
+def test_inject_errors_stream():
+    from datafaux.modes.testers import inject_errors_stream
+    chunks = list(inject_errors_stream(people_stream(count=100, chunksize=25, engine="columnar", seed=1),
+                                       error_rate=0.2, seed=1))
+    assert len(chunks) == 4
+    assert sum(c.isnull().sum().sum() for c in chunks) > 0
+
+@pytest.mark.parametrize("fmt", ["json", "csv"])
+def test_arrow_chunks_match_dataframe_chunks(tmp_path, fmt):
+    from datafaux.modes.streaming import generate_stream, people_stream
+    outs = []
+    for arrow in (False, True):
+        out = tmp_path / f"people_{arrow}.{fmt}"
+        generate_stream(people_stream, str(out), count=300, chunksize=128, fmt=fmt, seed=5, engine="columnar",
+                        arrow=arrow)
+        outs.append(out.read_bytes())
+    assert outs[0] == outs[1]
+    assert len(outs[0].splitlines()) == 300 + (fmt == "csv")
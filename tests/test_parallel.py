@@ -0,0 +1,24 @@
+from datetime import datetime
+from datafaux.generators import people, ecommerce, finance, health
+from datafaux.modes.parallel import generate_parallel, shard_sizes
+
+NOW = datetime(2024, 1, 1)
+
+
+def test_shard_sizes():
+    assert shard_sizes(10, 3) == [4, 3, 3]
+    assert sum(shard_sizes(1001, 8)) == 1001
+
+
+def test_parallel_is_deterministic():
+    for func in (people.generate_default, people.generate_columnar, ecommerce.generate_default,
+                 finance.generate_default, health.generate_default):
+        a = generate_parallel(func, 30, workers=3, seed=42, now=NOW)
+        b = generate_parallel(func, 30, workers=3, seed=42, now=NOW)
+        assert len(a) == 30
+        assert a.to_csv(index=False) == b.to_csv(index=False)
+
+
+def test_parallel_shards_differ():
+    df = generate_parallel(people.generate_default, 20, workers=2, seed=1, now=NOW)
+    assert df["person_id"].is_unique
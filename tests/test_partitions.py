@@ -0,0 +1,56 @@
+import json
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pytest
+from datafaux.generators import ecommerce
+from datafaux.modes.streaming import generate_stream, people_stream
+from datafaux.utils.exporters import open_sink
+from datafaux.utils.partitions import parse_partition_by
+
+
+def test_hive_partitions_with_manifest(tmp_path):
+    orders, _ = ecommerce.generate_tables(count=400, seed=2)
+    orders["currency"] = ["USD", "EUR"] * 200
+    with open_sink(str(tmp_path), "parquet", partition_by=["currency", "order_date:year"], rows_per_file=50) as sink:
+        for i in range(0, 400, 150):
+            sink.write(orders.iloc[i:i + 150])
+    manifest = json.loads((tmp_path / "_manifest.json").read_text())
+    assert manifest["rows"] == 400 and manifest["partition_by"] == ["currency", "order_date_year"]
+    assert all(f["rows"] <= 50 and f["bytes"] == (tmp_path / f["path"]).stat().st_size for f in manifest["files"])
+    table = ds.dataset(str(tmp_path), format="parquet", partitioning="hive", exclude_invalid_files=True).to_table()
+    df = table.to_pandas().sort_values("order_id")
+    expected = orders.sort_values("order_id")
+    assert df["order_id"].tolist() == expected["order_id"].tolist()
+    assert df["currency"].astype(str).tolist() == expected["currency"].tolist()
+    assert (df["order_date_year"].astype(str) == df["order_date"].str[:4]).all()
+
+
+def test_fixed_size_files_from_parallel_stream(tmp_path):
+    generate_stream(people_stream, str(tmp_path), count=1050, chunksize=200, fmt="csv", engine="columnar", seed=1,
+                    workers=2, sink_options={"rows_per_file": 300, "compression": "gzip"})
+    manifest = json.loads((tmp_path / "_manifest.json").read_text())
+    assert [f["rows"] for f in manifest["files"]] == [300, 300, 300, 150]
+    parts = pd.concat(pd.read_csv(tmp_path / f["path"]) for f in manifest["files"])
+    single = tmp_path / "single.csv"
+    generate_stream(people_stream, str(single), count=1050, chunksize=200, fmt="csv", engine="columnar", seed=1)
+    assert parts.reset_index(drop=True).equals(pd.read_csv(single))
+
+
+def test_partition_arrow_chunks_and_errors(tmp_path):
+    with open_sink(str(tmp_path), "json", partition_by=["kind"]) as sink:
+        sink.write(pa.table({"kind": ["a/b", None, "a/b"], "n": [1, 2, 3]}))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["_manifest.json", "kind=__HIVE_DEFAULT_PARTITION__",
+                                                          "kind=a%2Fb"]
+    assert pd.read_json(tmp_path / "kind=a%2Fb" / "part-00000.json", lines=True)["n"].tolist() == [1, 3]
+    with pytest.raises(ValueError):
+        parse_partition_by(["order_date:week"])
+
+
+@pytest.mark.parametrize("chunk", [pd.DataFrame({"currency": pd.Series([], dtype=str)}),
+                                   pa.table({"currency": pa.array([], pa.string())})])
+def test_empty_chunk_with_partition_keys(tmp_path, chunk):
+    with open_sink(str(tmp_path), "csv", partition_by=["currency"]) as sink:
+        sink.write(chunk)
+    manifest = json.loads((tmp_path / "_manifest.json").read_text())
+    assert manifest["rows"] == 0 and manifest["files"] == []
@@ -19,4 +19,43 @@ def test_generate_default():
     df = people.generate_default(count=5, seed=123, locale="en_US")
     assert isinstance(df, pd.DataFrame)
     assert len(df) == 5
-    assert "email" in df.columns
\ No newline at end of file
+    assert "email" in df.columns
+
+def test_generate_columnar_matches_default_layout():
+    df = people.generate_columnar(count=50, seed=123, locale="en_US")
+    ref = people.generate_default(count=5, seed=123, locale="en_US")
+    assert len(df) == 50
+    assert list(df.columns) == list(ref.columns)
+    assert (df.dtypes == ref.dtypes).all()
+    assert df["age"].between(18, 80).all()
+    assert df["person_id"].str.match(r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$").all()
+
+
+def test_generate_columnar_is_reproducible():
+    a = people.generate_columnar(count=20, seed=7)
+    b = people.generate_columnar(count=20, seed=7)
+    assert a.drop(columns=["registered_at"]).equals(b.drop(columns=["registered_at"]))
+
+
+def test_seeds_are_instance_local():
+    a1 = people.generate_default(count=5, seed=1)
+    people.generate_default(count=3, seed=2)
+    a2 = people.generate_default(count=5, seed=1)
+    assert a1.equals(a2)
+
+
+def test_concurrent_runs_are_reproducible():
+    from concurrent.futures import ThreadPoolExecutor
+    expected = {s: finance.generate_default(count=20, seed=s) for s in (1, 2)}
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda s: (s, finance.generate_default(count=20, seed=s)), [1, 2, 1, 2]))
+    assert all(df.equals(expected[s]) for s, df in results)
+
+
+def test_generate_columnar_arrow_is_compact(monkeypatch):
+    # pooled columns are dictionary-encoded: compact once rows outnumber the pool values
+    monkeypatch.setenv("DATAFAUX_POOL_SIZE", "2000")
+    df = people.generate_columnar(20000, seed=4)
+    table = people.generate_columnar(20000, seed=4, arrow=True)
+    assert table.column_names == list(df.columns)
+    assert table.nbytes < df.memory_usage(deep=True).sum() / 2
@@ -0,0 +1,47 @@
+from datetime import datetime
+import pandas as pd
+import pytest
+from datafaux.modes.pipeline import parallel_chunks, write_pipelined
+from datafaux.modes.streaming import generate_stream, people_stream, finance_stream
+
+NOW = datetime(2024, 1, 1)
+
+
+class ListSink:
+    def __init__(self, fail_at=None):
+        self.chunks = []
+        self.fail_at = fail_at
+
+    def write(self, chunk):
+        if len(self.chunks) == self.fail_at:
+            raise IOError("disk full")
+        self.chunks.append(chunk)
+
+
+def test_write_pipelined_preserves_order():
+    sink = ListSink()
+    write_pipelined((pd.DataFrame({"i": [i]}) for i in range(20)), sink, queue_size=2)
+    assert [c["i"][0] for c in sink.chunks] == list(range(20))
+
+
+def test_write_pipelined_raises_writer_errors():
+    with pytest.raises(IOError):
+        write_pipelined((pd.DataFrame({"i": [i]}) for i in range(20)), ListSink(fail_at=3), queue_size=2)
+
+
+def test_parallel_chunks_match_sequential():
+    kwargs = dict(count=95, chunksize=10, seed=4, now=NOW)
+    expected = pd.concat(finance_stream(**kwargs), ignore_index=True)
+    ordered = pd.concat(parallel_chunks(finance_stream, workers=3, **kwargs), ignore_index=True)
+    assert ordered.equals(expected)
+    unordered = pd.concat(parallel_chunks(finance_stream, workers=3, ordered=False, **kwargs), ignore_index=True)
+    assert sorted(unordered["transaction_id"]) == sorted(expected["transaction_id"])
+
+
+def test_generate_stream_pipelined_with_workers(tmp_path):
+    a, b = tmp_path / "a.csv", tmp_path / "b.csv"
+    kwargs = dict(count=230, chunksize=50, fmt="csv", seed=9, engine="columnar", now=NOW)
+    generate_stream(people_stream, str(a), **kwargs)
+    generate_stream(people_stream, str(b), workers=3, queue_size=1, **kwargs)
+    assert a.read_bytes() == b.read_bytes()
+    assert len(pd.read_csv(b)) == 230
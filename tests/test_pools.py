@@ -0,0 +1,38 @@
+import numpy as np
+from datafaux.utils import pools
+from datafaux.utils.columns import phone_column
+
+
+def test_pools_saved_and_memory_mapped(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATAFAUX_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(pools, "_cache", {})
+    built = pools.get_pools("en_US", size=50)
+    assert isinstance(built["name"], np.memmap)
+    assert {"name", "user_name", "email_domain", "address", "city", "street_address"} <= set(built)
+
+    monkeypatch.setattr(pools, "_cache", {})
+    monkeypatch.setattr(pools, "build_pools", lambda *a, **k: (_ for _ in ()).throw(AssertionError("rebuilt")))
+    loaded = pools.get_pools("en_US", size=50)
+    assert (loaded["name"] == built["name"]).all()
+
+
+def test_unsaved_pools_built_once(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATAFAUX_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("DATAFAUX_POOL_SIZE", "40")
+    monkeypatch.setattr(pools, "_cache", {})
+    monkeypatch.setattr(pools, "save_pools", lambda *a: (_ for _ in ()).throw(PermissionError("read-only")))
+    build, calls = pools.build_pools, []
+    monkeypatch.setattr(pools, "build_pools", lambda *a: calls.append(a) or build(*a))
+    built = pools.get_pools("en_US")
+    assert calls == [("en_US", 40)] and len(built["name"]) == 40
+
+
+def test_load_pools_missing(tmp_path):
+    assert pools.load_pools(str(tmp_path / "nothing")) is None
+
+
+def test_phone_column_renders_formats():
+    values = phone_column(np.random.default_rng(1), np.array(["(###) %##-$$##", "#-#"]), 200)
+    assert set(len(v) for v in values) == {3, 14}
+    long = [v for v in values if len(v) == 14]
+    assert all(v[6] != "0" and v[10] in "23456789" and v[1:4].isdigit() for v in long)
@@ -0,0 +1,35 @@
+import json
+import subprocess
+from datafaux.generators.compiler import compile_schema
+from datafaux.modes.streaming import generate_stream, schema_stream
+from datafaux.profiling import Profiler
+
+SCHEMA = {"type": "t", "fields": [{"name": "id", "type": "uuid"}, {"name": "n", "type": "int"}]}
+
+
+def test_stream_profile_records_columns_and_chunks(tmp_path):
+    out = tmp_path / "out.csv"
+    profiler = Profiler()
+    profiler.mark("stream")
+    generate_stream(schema_stream, str(out), count=250, chunksize=100, plan=compile_schema(SCHEMA), seed=1,
+                    profiler=profiler)
+    profiler.close()
+    report = profiler.report()
+    assert [s["stage"] for s in report["stages"]] == ["stream"]
+    assert {s["stage"] for s in report["breakdown"]} >= {"generate", "export"}
+    assert {c["column"]: c["rows"] for c in report["columns"]} == {"id": 250, "n": 250}
+    assert [c["rows"] for c in report["chunks"]] == [100, 100, 50]
+    # bytes per chunk add up to the (uncompressed) file
+    assert report["throughput"]["bytes"] == out.stat().st_size
+    json.dumps(report)
+
+
+def test_cli_profile_writes_report(tmp_path):
+    out = tmp_path / "out.csv"
+    result = subprocess.run(["python", "-m", "datafaux.main", "generate", "--preset", "finance", "--count", "20",
+                             "--out", str(out), "--inject-errors", "--profile"], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    report = json.loads((tmp_path / "out.csv.profile.json").read_text())
+    stages = [s["stage"] for s in report["stages"]]
+    assert stages == ["config", "setup", "generate", "error_injection", "export"]
+    assert report["options"]["count"] == 20
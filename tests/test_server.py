@@ -0,0 +1,55 @@
+import asyncio
+import http.client
+import json
+import threading
+import pytest
+from datafaux.server import GenerationServer
+
+
+@pytest.fixture
+def server():
+    srv = GenerationServer(chunksize=40, schemas={"ids": {"type": "t", "fields": [{"name": "id", "type": "uuid"}]}})
+    loop = asyncio.new_event_loop()
+    listener = loop.run_until_complete(srv.start("127.0.0.1", 0))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield listener.sockets[0].getsockname()[1]
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    listener.close()
+    loop.close()
+    srv.close()
+
+
+def test_generate_matches_streaming_mode(server, tmp_path):
+    from datafaux.modes.streaming import generate_stream, people_stream, finance_stream
+    conn = http.client.HTTPConnection("127.0.0.1", server)
+    # both requests go over one keep-alive connection
+    for stream, query, fmt in ((people_stream, "preset=people&engine=columnar", "csv"),
+                               (finance_stream, "preset=finance", "json")):
+        conn.request("GET", f"/generate?{query}&count=100&seed=7&format={fmt}")
+        response = conn.getresponse()
+        assert response.status == 200
+        assert response.getheader("X-DataFaux-Seed") == "7"
+        body = response.read()
+        out = tmp_path / f"expected.{fmt}"
+        kwargs = {"engine": "columnar"} if stream is people_stream else {}
+        generate_stream(stream, str(out), count=100, chunksize=40, fmt=fmt, seed=7, **kwargs)
+        assert body == out.read_bytes()
+    conn.close()
+
+
+def test_schemas_and_errors(server):
+    conn = http.client.HTTPConnection("127.0.0.1", server)
+    conn.request("GET", "/generate?schema=ids&count=3")
+    assert len(conn.getresponse().read().splitlines()) == 3
+    conn.request("POST", "/generate?count=5&seed=1", body=json.dumps({"type": "t", "fields": [{"name": "n", "type": "int"}]}))
+    assert [set(json.loads(line)) for line in conn.getresponse().read().splitlines()] == [{"n"}] * 5
+    for method, path, status in (("GET", "/generate?preset=nope", 400), ("GET", "/generate?schema=missing", 404),
+                                 ("POST", "/generate", 400), ("GET", "/other", 404),
+                                 ("GET", "/generate?preset=people&count=-1", 400)):
+        conn.request(method, path, body=b"type: relational" if method == "POST" else None)
+        response = conn.getresponse()
+        assert response.status == status
+        assert "error" in json.loads(response.read())
+    conn.close()